@@ -6,7 +6,7 @@ from __future__ import annotations
 import base64, os, time
 from pathlib import Path
 from typing import Any, Dict, Optional
-import requests, structlog
+import structlog
 from cascade.base_provider import BaseProvider, ProviderResult
 
 logger = structlog.get_logger(__name__)
@@ -21,6 +21,7 @@ class AIHordeProvider(BaseProvider):
     provider_name    = "ai_horde"
     is_free_tier     = True
     cascade_category = "ai_images"
+    max_concurrency  = 2   # anonymous/kudos-limited queue; extra jobs just wait
 
     def is_available(self) -> bool:
         # Always available — uses anonymous key if secret absent
@@ -63,7 +64,7 @@ class AIHordeProvider(BaseProvider):
             "r2": False,
         }
         try:
-            resp = requests.post(f"{_BASE}/generate/async",
+            resp = self.http().post(f"{_BASE}/generate/async",
                                  headers=headers, json=payload, timeout=30)
             resp.raise_for_status()
             job_id: str = resp.json().get("id", "")
@@ -77,7 +78,7 @@ class AIHordeProvider(BaseProvider):
         while time.time() < deadline:
             time.sleep(_POLL_S)
             try:
-                chk = requests.get(f"{_BASE}/generate/check/{job_id}",
+                chk = self.http().get(f"{_BASE}/generate/check/{job_id}",
                                    headers=headers, timeout=15)
                 chk.raise_for_status()
                 status = chk.json()
@@ -93,7 +94,7 @@ class AIHordeProvider(BaseProvider):
 
         # Fetch result
         try:
-            final = requests.get(f"{_BASE}/generate/status/{job_id}",
+            final = self.http().get(f"{_BASE}/generate/status/{job_id}",
                                  headers=headers, timeout=20)
             final.raise_for_status()
             generations = final.json().get("generations", [])
@@ -9,13 +9,14 @@ from typing import Dict, Optional
 import structlog
 from cascade.base_provider import ProviderResult
 from cascade.cascade_manager import CascadeManager, CircuitBreaker
+from cascade.provider_stats import get_provider_stats
 from cascade.ai_images.getimg_provider    import GetImgProvider
 from cascade.ai_images.stability_provider import StabilityProvider
 from cascade.ai_images.dezgo_provider     import DezgoProvider
 from cascade.ai_images.ai_horde_provider  import AIHordeProvider
 
 logger = structlog.get_logger(__name__)
-_SHARED_BREAKER = CircuitBreaker(failure_threshold=3, reset_timeout_seconds=300)
+_SHARED_BREAKER = CircuitBreaker(failure_threshold=3, reset_timeout_seconds=300, namespace="ai_images")
 
 
 @dataclass
@@ -86,6 +87,7 @@ class AIImagesCascade:
         return {
             "category": "ai_images",
             "circuit_status": _SHARED_BREAKER.get_status(),
+            "provider_stats": get_provider_stats().category_snapshot("ai_images"),
         }
 
 
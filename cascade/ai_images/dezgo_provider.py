@@ -6,7 +6,7 @@ from __future__ import annotations
 import os
 from pathlib import Path
 from typing import Any, Dict
-import requests, structlog
+import structlog
 from cascade.base_provider import BaseProvider, ProviderResult
 
 logger = structlog.get_logger(__name__)
@@ -36,7 +36,7 @@ class DezgoProvider(BaseProvider):
             "professional nature photo, award winning"
         )
         try:
-            resp = requests.post(
+            resp = self.http().post(
                 _URL,
                 headers={"X-Dezgo-Key": os.environ["DEZGO"]},
                 data={
@@ -6,7 +6,7 @@ from __future__ import annotations
 import base64, os
 from pathlib import Path
 from typing import Any, Dict, Optional
-import requests, structlog
+import structlog
 from cascade.base_provider import BaseProvider, ProviderResult
 
 logger = structlog.get_logger(__name__)
@@ -49,7 +49,7 @@ class GetImgProvider(BaseProvider):
                           "steps": 4, "output_format": "jpeg"}),
         ]:
             try:
-                resp = requests.post(url, headers=headers, json=body, timeout=90)
+                resp = self.http().post(url, headers=headers, json=body, timeout=90)
                 if resp.status_code == 429:
                     continue
                 if resp.status_code in (401, 403):
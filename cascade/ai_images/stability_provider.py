@@ -6,7 +6,7 @@ from __future__ import annotations
 import base64, os
 from pathlib import Path
 from typing import Any, Dict
-import requests, structlog
+import structlog
 from cascade.base_provider import BaseProvider, ProviderResult
 
 logger = structlog.get_logger(__name__)
@@ -55,7 +55,7 @@ class StabilityProvider(BaseProvider):
             "steps": 30, "samples": 1, "cfg_scale": 7.5,
         }
         try:
-            resp = requests.post(_ENDPOINT, headers=headers, json=body, timeout=120)
+            resp = self.http().post(_ENDPOINT, headers=headers, json=body, timeout=120)
             if resp.status_code == 429:
                 return ProviderResult.failure(self.provider_name, "Stability rate limit.")
             if resp.status_code in (401, 403):
@@ -0,0 +1,308 @@
+"""
+cascade/asset_cache.py
+
+Content-addressed local disk cache for downloaded footage and still images.
+
+Every footage and photo provider streams its chosen file through
+AssetCache.fetch().  A clip picked for two segments of one batch, or
+re-selected after a ShortPipeline topic retry, is then served from local
+disk instead of being downloaded again.
+
+Layout (under _CACHE_DIR)
+─────────────────────────
+  blobs/<sha[:2]>/<sha256>   File contents, stored once per unique hash.
+  index.json                 {key → sha256} plus per-blob size / last use.
+  tmp/                       In-flight downloads (renamed into blobs/).
+
+Keys are (provider, provider_source_id, rendition).  The rendition
+separates different files of the same asset, such as Pexels "hd_1920" and
+"sd_640".  Blobs are keyed by sha256, so identical bytes reached through
+two keys are stored once.
+
+Writes are atomic: a download goes to tmp/, is hashed, then
+os.replace()'d into blobs/.  A crashed run can never leave a
+half-written blob that a later hit would serve.  The cache is size-bounded.
+When it grows past _MAX_BYTES, the least-recently-used blobs are evicted.
+
+A hit is served as a copy, never a hard link, so a job that edits its
+file in place cannot corrupt the cache.  The blob is pinned while it is
+copied, so a concurrent eviction cannot delete it mid-copy.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_CACHE_DIR = os.path.join(tempfile.gettempdir(), "yta_asset_cache")
+_MAX_BYTES = 4 * 1024 ** 3   # 4 GiB — GitHub runners have ~14 GB free disk
+_HASH_CHUNK = 1 << 20
+
+Key = Tuple[str, str, str]
+
+
+class AssetCache:
+    """Thread-safe, size-bounded LRU cache of provider downloads."""
+
+    def __init__(self, root: str = _CACHE_DIR, max_bytes: int = _MAX_BYTES) -> None:
+        self._root = root
+        self._max_bytes = max_bytes
+        self._lock = threading.RLock()
+        self._key_locks: Dict[str, List[Any]] = {}       # key id → [lock, holders]
+        self._pins: Dict[str, int] = {}                  # sha256 → copies in progress
+        self._keys: Dict[str, str] = {}                  # key id → sha256
+        self._blobs: Dict[str, Dict[str, Any]] = {}      # sha256 → {size, last_used}
+        self._stats = {
+            "hits": 0, "misses": 0, "bytes_saved": 0,
+            "bytes_downloaded": 0, "evictions": 0,
+        }
+        os.makedirs(os.path.join(root, "blobs"), exist_ok=True)
+        os.makedirs(os.path.join(root, "tmp"), exist_ok=True)
+        self._load_index()
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def fetch(
+        self,
+        provider: str,
+        source_id: str,
+        rendition: str,
+        dest_path: str,
+        download: Callable[[str], int],
+        min_bytes: int = 0,
+    ) -> int:
+        """
+        Place the asset at dest_path and return its size in bytes.
+
+        On a hit the cached blob is copied to dest_path.
+        On a miss download(tmp_path) is called.  It must write the file and
+        return the number of bytes written, and it may raise; exceptions
+        propagate unchanged.  Downloads smaller than min_bytes are handed
+        back to the caller but are not cached, so the provider's own
+        "file too small" check still rejects them.
+        """
+        kid = self._key_id((provider, str(source_id), rendition))
+        with self._key_lock(kid):
+            sha = self._lookup(kid)
+            if sha is not None:
+                try:
+                    size = self._materialise(sha, dest_path)
+                except FileNotFoundError:
+                    # Deleted outside the cache after lookup — re-download
+                    self._forget(kid, sha)
+                    size = -1
+                if size >= 0:
+                    with self._lock:
+                        self._stats["hits"] += 1
+                        self._stats["bytes_saved"] += size
+                    logger.debug("asset_cache_hit", provider=provider, source_id=source_id, bytes=size)
+                    return size
+
+            tmp_path = os.path.join(self._root, "tmp", uuid.uuid4().hex)
+            try:
+                written = download(tmp_path)
+                with self._lock:
+                    self._stats["misses"] += 1
+                    self._stats["bytes_downloaded"] += written
+                if written < min_bytes:
+                    _move(tmp_path, dest_path)
+                    return written
+                sha = _sha256_file(tmp_path)
+                self._admit(kid, sha, tmp_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+            return self._materialise(sha, dest_path)
+
+    def contains_hash(self, sha256: str) -> bool:
+        with self._lock:
+            return sha256 in self._blobs
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters since process start plus current occupancy."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                "entries": len(self._keys),
+                "blobs": len(self._blobs),
+                "size_bytes": self._total_bytes(),
+                "max_bytes": self._max_bytes,
+            }
+
+    @staticmethod
+    def rendition_from_url(url: str) -> str:
+        """
+        Stable rendition label for providers that expose no quality tier.
+        Uses the URL path only, because signed query strings change per call.
+        """
+        path = urlsplit(url).path
+        return hashlib.sha1(path.encode("utf-8", errors="replace")).hexdigest()[:12]
+
+    # ── Internal ──────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _key_id(key: Key) -> str:
+        return "|".join(key)
+
+    @contextmanager
+    def _key_lock(self, kid: str) -> Iterator[None]:
+        # One lock per key so two threads asking for the same clip download
+        # it once, while different clips still download in parallel.  The
+        # entry is dropped when its last holder leaves, so the map only
+        # holds keys in flight.
+        with self._lock:
+            entry = self._key_locks.get(kid)
+            if entry is None:
+                entry = self._key_locks[kid] = [threading.Lock(), 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    self._key_locks.pop(kid, None)
+
+    def _blob_path(self, sha: str) -> str:
+        return os.path.join(self._root, "blobs", sha[:2], sha)
+
+    def _lookup(self, kid: str) -> Optional[str]:
+        """sha256 cached for kid, pinned for _materialise(), or None on a miss."""
+        with self._lock:
+            sha = self._keys.get(kid)
+            if sha is None:
+                return None
+            if not os.path.exists(self._blob_path(sha)):
+                # Blob vanished underneath us (manual cleanup) — treat as miss.
+                self._keys.pop(kid, None)
+                self._blobs.pop(sha, None)
+                return None
+            self._blobs[sha]["last_used"] = time.time()
+            self._pins[sha] = self._pins.get(sha, 0) + 1
+            return sha
+
+    def _forget(self, kid: str, sha: str) -> None:
+        with self._lock:
+            self._keys.pop(kid, None)
+            self._blobs.pop(sha, None)
+
+    def _admit(self, kid: str, sha: str, tmp_path: str) -> None:
+        blob = self._blob_path(sha)
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        with self._lock:
+            if sha in self._blobs and os.path.exists(blob):
+                os.unlink(tmp_path)   # identical content already cached
+            else:
+                os.replace(tmp_path, blob)
+                self._blobs[sha] = {"size": os.path.getsize(blob), "last_used": time.time()}
+            self._blobs[sha]["last_used"] = time.time()
+            self._keys[kid] = sha
+            self._evict(keep=sha)
+            self._save_index()
+            self._pins[sha] = self._pins.get(sha, 0) + 1   # for _materialise()
+
+    def _materialise(self, sha: str, dest_path: str) -> int:
+        """Copy a pinned blob to dest_path and unpin it."""
+        try:
+            blob = self._blob_path(sha)
+            os.makedirs(os.path.dirname(dest_path) or ".", exist_ok=True)
+            if os.path.exists(dest_path):
+                os.unlink(dest_path)
+            shutil.copyfile(blob, dest_path)
+            return os.path.getsize(dest_path)
+        finally:
+            with self._lock:
+                left = self._pins.get(sha, 0) - 1
+                if left > 0:
+                    self._pins[sha] = left
+                else:
+                    self._pins.pop(sha, None)
+
+    def _total_bytes(self) -> int:
+        return sum(b["size"] for b in self._blobs.values())
+
+    def _evict(self, keep: str) -> None:
+        total = self._total_bytes()
+        if total <= self._max_bytes:
+            return
+        for sha, meta in sorted(self._blobs.items(), key=lambda kv: kv[1]["last_used"]):
+            if total <= self._max_bytes:
+                break
+            if sha == keep or sha in self._pins:
+                continue
+            try:
+                os.unlink(self._blob_path(sha))
+            except FileNotFoundError:
+                pass
+            total -= meta["size"]
+            self._blobs.pop(sha, None)
+            for kid in [k for k, v in self._keys.items() if v == sha]:
+                self._keys.pop(kid, None)
+            self._stats["evictions"] += 1
+        logger.info("asset_cache_evicted", size_bytes=total, max_bytes=self._max_bytes)
+
+    def _load_index(self) -> None:
+        path = os.path.join(self._root, "index.json")
+        try:
+            with open(path) as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return
+        blobs = {
+            sha: meta for sha, meta in (data.get("blobs") or {}).items()
+            if os.path.exists(self._blob_path(sha))
+        }
+        self._blobs = blobs
+        self._keys = {k: v for k, v in (data.get("keys") or {}).items() if v in blobs}
+
+    def _save_index(self) -> None:
+        path = os.path.join(self._root, "index.json")
+        tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp, "w") as fh:
+            json.dump({"keys": self._keys, "blobs": self._blobs}, fh)
+        os.replace(tmp, path)
+
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+def _sha256_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _move(src: str, dest: str) -> None:
+    os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+    shutil.move(src, dest)
+
+
+# ── Singleton ──────────────────────────────────────────────────────────────────
+
+_cache_instance: Optional[AssetCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_asset_cache() -> AssetCache:
+    global _cache_instance
+    with _cache_lock:
+        if _cache_instance is None:
+            _cache_instance = AssetCache()
+        return _cache_instance
@@ -98,11 +98,19 @@ class BaseProvider(ABC):
                     (edge-tts, local Pillow generator, AI Horde, etc.).
     cascade_category One of: 'llm', 'tts', 'footage', 'images', 'ai_images',
                     'ai_video', 'thumbnails'.
+    max_concurrency Maximum simultaneous execute() calls across all threads
+                    in this process.  Enforced by CascadeManager; lower it for
+                    APIs with tight per-second limits or courtesy rules.
+    cost_tier       Adaptive ordering never moves a provider ahead of one in a
+                    lower tier.  Leave at 0 for free / included providers and
+                    raise it for paid backstops that should only run last.
     """
 
     provider_name: str = "base"
     is_free_tier: bool = False
     cascade_category: str = "unknown"
+    max_concurrency: int = 4
+    cost_tier: int = 0
 
     # ── Mandatory overrides ───────────────────────────────────────────────────
 
@@ -144,6 +152,17 @@ class BaseProvider(ABC):
             return match.group(1).strip()
         return text
 
+    @staticmethod
+    def http() -> Any:
+        """
+        Pooled keep-alive requests.Session shared by every provider (see
+        cascade/http_pool.py).  Use it instead of bare requests.get/post so
+        TCP + TLS handshakes are paid once per host per run.  Imported lazily
+        to keep this module dependency-free.
+        """
+        from cascade.http_pool import http_session
+        return http_session()
+
     @staticmethod
     def env_present(*var_names: str) -> bool:
         """
@@ -7,9 +7,29 @@ Generic cascade routing engine used by every category in the system
 Features
 ────────
   Circuit Breaker    Skip a provider that has failed N times recently.
-                     Auto-resets after a configurable timeout.
+                     After a timeout a limited number of half-open probe
+                     calls decide whether it closes again.  State is shared
+                     through Redis across threads and workflow runs.
   Per-provider retry Retry up to max_retries times with exponential back-off
                      before declaring a provider failed and moving to the next.
+  Concurrency slots  Each provider admits at most BaseProvider.max_concurrency
+                     simultaneous execute() calls process-wide, so callers that
+                     fan out across threads (e.g. MediaFetcher) cannot flood a
+                     single API.
+  Adaptive ordering  Every attempt's latency and outcome feed the shared
+                     ProviderStatsStore.  Providers are tried in order of
+                     (pinned, cost_tier, expected time-to-success), so a
+                     cascade drifts away from a provider that is slow or keeps
+                     coming back empty today.  Providers without enough
+                     samples are ranked at cold_start_seconds, and ties keep
+                     the constructor order.  On explore_rate of calls one
+                     demoted provider is moved to the front of its cost tier,
+                     so a provider that was slow earlier still gets fresh
+                     samples and can win its place back once it recovers.
+  Hedged requests    execute_hedged() (idempotent calls only) starts the next
+                     provider when the one in flight exceeds its observed p90
+                     latency; first success wins.  A per-category HedgeBudget
+                     caps hedges at a fraction of calls.
   Structured logging Every skip, retry, success, and failure is logged with
                      full context for post-mortem analysis.
   Graceful exhaustion When all providers fail, returns a rich ProviderResult
@@ -18,15 +38,38 @@ Features
 
 from __future__ import annotations
 
+import random
+import re
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import structlog
 
 from cascade.base_provider import BaseProvider, ProviderResult
+from cascade.provider_stats import ProviderStatsStore, get_provider_stats
 
 logger = structlog.get_logger(__name__)
 
+# Expected seconds-to-success assumed for providers with too few samples
+_COLD_START_SECONDS = 5.0
+
+# Share of adaptive orderings that try one demoted provider early
+_EXPLORE_RATE = 0.05
+
+# Failures that mean "answered, but nothing matched" rather than "broken".
+# Providers can also set metadata={"empty": True} on the failure result.
+_EMPTY_RESULT_RE = re.compile(r"^(No|Empty)\b")
+
+# Hedging: never hedge sooner than this, and allow at most _HEDGE_RATIO extra
+# calls per execute_hedged() call on average (burst of _HEDGE_BURST).
+_MIN_HEDGE_DELAY_SECONDS = 0.5
+_HEDGE_RATIO             = 0.10
+_HEDGE_BURST             = 3.0
+_HEDGE_WORKERS           = 16
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Circuit Breaker
@@ -34,56 +77,89 @@ logger = structlog.get_logger(__name__)
 
 class CircuitBreaker:
     """
-    In-process circuit breaker.  State is local to the current process
-    (i.e. not shared across GitHub Actions jobs), which is intentional —
-    each workflow run starts with a clean slate.
+    Circuit breaker with CLOSED → OPEN → HALF_OPEN → CLOSED transitions.
+
+    When constructed with a namespace (the cascade category), state lives in
+    Redis (RK.circuit_breaker) and every transition runs as one Lua script,
+    so concurrent threads and concurrent workflow runs see the same state.
+    A run that starts after another run opened a circuit skips the dead
+    provider immediately instead of rediscovering it through full retry
+    cycles.  Without a namespace, or while Redis is unreachable, the same
+    state machine runs in process memory.  All in-process state is guarded
+    by a lock so one breaker can be shared by worker threads.
 
     States
     ──────
-    CLOSED   Fewer than failure_threshold consecutive failures → provider is used.
-    OPEN     failure_threshold reached → provider is skipped until reset_timeout.
-    (No HALF-OPEN state: the circuit simply auto-resets after the timeout.)
+    CLOSED     Fewer than failure_threshold consecutive failures → provider is used.
+    OPEN       failure_threshold reached → provider is skipped for reset_timeout.
+    HALF_OPEN  reset_timeout elapsed → up to half_open_max_probes calls are
+               admitted as probes.  A probe success closes the circuit and a
+               probe failure re-opens it for another reset_timeout.  A probe
+               that never reports back frees its slot after probe_timeout.
     """
 
     def __init__(
         self,
         failure_threshold: int = 3,
         reset_timeout_seconds: int = 300,
+        namespace: Optional[str] = None,
+        half_open_max_probes: int = 1,
+        probe_timeout_seconds: int = 120,
     ) -> None:
         self._threshold = failure_threshold
         self._timeout = reset_timeout_seconds
-        self._failures: Dict[str, int] = {}
-        self._first_failure_at: Dict[str, float] = {}
+        self._namespace = namespace
+        self._max_probes = max(1, half_open_max_probes)
+        self._probe_timeout = probe_timeout_seconds
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._synced_at: Dict[str, float] = {}
+        self._remote_down_until = 0.0
+        self._lock = threading.RLock()
 
-    def is_open(self, provider_name: str) -> bool:
-        """Return True if the circuit is open and the provider should be skipped."""
-        failures = self._failures.get(provider_name, 0)
-        if failures < self._threshold:
-            return False
-        elapsed = time.time() - self._first_failure_at.get(provider_name, 0.0)
-        if elapsed > self._timeout:
-            self._reset(provider_name)
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def allow(self, provider_name: str) -> bool:
+        """
+        Return True if a call to the provider may proceed now.  In HALF_OPEN
+        this claims a probe slot, so call it only right before a real call.
+        """
+        with self._lock:
+            record = self._records.get(provider_name)
+            fresh = time.time() - self._synced_at.get(provider_name, 0.0) < _BREAKER_SYNC_SECONDS
+            if record is None and fresh:
+                return True   # recently confirmed closed — skip the round trip
+        before = self._state_of(provider_name)
+        record, allowed = self._apply(provider_name, "allow")
+        if record["state"] == _HALF_OPEN and allowed:
             logger.info(
-                "circuit_breaker_auto_reset",
+                "circuit_breaker_half_open_probe",
                 provider=provider_name,
-                elapsed_seconds=round(elapsed),
+                probes=record["probes"],
+                max_probes=self._max_probes,
             )
-            return False
-        return True
+        elif before == _OPEN and record["state"] == _HALF_OPEN:
+            logger.info("circuit_breaker_half_open", provider=provider_name)
+        return allowed
+
+    def is_open(self, provider_name: str) -> bool:
+        """
+        Return True if the provider would be skipped right now.  Read-only:
+        never claims a half-open probe slot (use allow() before a call).
+        """
+        _, allowed = self._apply(provider_name, "peek")
+        return not allowed
 
     def record_failure(self, provider_name: str) -> None:
-        """Increment the failure counter.  Sets the first-failure timestamp on first call."""
-        if provider_name not in self._failures:
-            self._failures[provider_name] = 0
-            self._first_failure_at[provider_name] = time.time()
-        self._failures[provider_name] += 1
-        new_count = self._failures[provider_name]
-        if new_count >= self._threshold:
+        """Count a failed call.  Opens the circuit at the threshold or on a failed probe."""
+        before = self._state_of(provider_name)
+        record, _ = self._apply(provider_name, "failure")
+        if record["state"] == _OPEN and before != _OPEN:
             logger.warning(
                 "circuit_breaker_opened",
                 provider=provider_name,
-                failures=new_count,
+                failures=record["failures"],
                 threshold=self._threshold,
+                after_probe=before == _HALF_OPEN,
                 will_reset_in_seconds=self._timeout,
             )
 
@@ -95,11 +171,10 @@ class CircuitBreaker:
         failure_threshold separate calls — a single confirmed permanent
         failure is enough to skip this provider for the remainder of the
         reset_timeout window, sparing every subsequent video in this run
-        from repeating a failure that cannot possibly succeed.
+        (and, with a namespace, every concurrent run) from repeating a
+        failure that cannot possibly succeed.
         """
-        if provider_name not in self._first_failure_at:
-            self._first_failure_at[provider_name] = time.time()
-        self._failures[provider_name] = self._threshold
+        self._apply(provider_name, "force_open")
         logger.warning(
             "circuit_breaker_force_opened",
             provider=provider_name,
@@ -108,26 +183,211 @@ class CircuitBreaker:
         )
 
     def record_success(self, provider_name: str) -> None:
-        """Clear the failure record on a successful response."""
-        if provider_name in self._failures:
-            self._reset(provider_name)
-
-    def _reset(self, provider_name: str) -> None:
-        self._failures.pop(provider_name, None)
-        self._first_failure_at.pop(provider_name, None)
+        """Close the circuit and clear the failure record."""
+        before = self._state_of(provider_name)
+        if before is None:
+            with self._lock:
+                fresh = time.time() - self._synced_at.get(provider_name, 0.0) < _BREAKER_SYNC_SECONDS
+            if self._namespace is None or fresh:
+                return   # nothing to clear
+        self._apply(provider_name, "success")
+        if before == _HALF_OPEN:
+            logger.info("circuit_breaker_closed", provider=provider_name, reason="probe_succeeded")
 
     def get_status(self) -> Dict[str, Dict[str, Any]]:
         """Return the current state of all tracked providers."""
-        return {
-            name: {
-                "failures": count,
-                "is_open": self.is_open(name),
-                "seconds_since_first_failure": round(
-                    time.time() - self._first_failure_at.get(name, time.time())
+        with self._lock:
+            tracked = list(self._records)
+        status: Dict[str, Dict[str, Any]] = {}
+        for name in tracked:
+            record, allowed = self._apply(name, "peek")
+            status[name] = {
+                "state": record["state"],
+                "failures": record["failures"],
+                "is_open": not allowed,
+                "seconds_since_opened": (
+                    round(time.time() - record["opened_at"]) if record["opened_at"] else 0
                 ),
+                "shared": self._namespace is not None,
             }
-            for name, count in self._failures.items()
-        }
+        return status
+
+    # ── Internal ──────────────────────────────────────────────────────────────
+
+    def _state_of(self, provider_name: str) -> Optional[str]:
+        with self._lock:
+            record = self._records.get(provider_name)
+            return record["state"] if record else None
+
+    def _apply(self, provider_name: str, op: str) -> Tuple[Dict[str, Any], bool]:
+        """Run one transition remotely if possible, else locally; mirror the result."""
+        remote = self._remote(provider_name, op)
+        with self._lock:
+            if remote is not None:
+                record, allowed = remote
+            else:
+                record, allowed = _breaker_transition(
+                    self._records.get(provider_name), op, time.time(),
+                    self._threshold, self._timeout, self._max_probes, self._probe_timeout,
+                )
+            if record["state"] == _CLOSED and record["failures"] == 0:
+                self._records.pop(provider_name, None)
+            else:
+                self._records[provider_name] = record
+            if remote is not None:
+                self._synced_at[provider_name] = time.time()
+            return record, allowed
+
+    def _remote(self, provider_name: str, op: str) -> Optional[Tuple[Dict[str, Any], bool]]:
+        if self._namespace is None or time.time() < self._remote_down_until:
+            return None
+        try:
+            from storage.redis_client import get_redis
+            out = get_redis().circuit_transition(
+                self._namespace, provider_name, op,
+                threshold=self._threshold,
+                reset_timeout=self._timeout,
+                max_probes=self._max_probes,
+                probe_timeout=self._probe_timeout,
+            )
+        except Exception as exc:
+            self._remote_down_until = time.time() + _BREAKER_REMOTE_BACKOFF_SECONDS
+            logger.warning(
+                "circuit_breaker_redis_unavailable",
+                namespace=self._namespace,
+                error=str(exc)[:120],
+                local_for_seconds=_BREAKER_REMOTE_BACKOFF_SECONDS,
+            )
+            return None
+        allowed = bool(out.pop("allowed"))
+        return out, allowed
+
+
+_CLOSED, _OPEN, _HALF_OPEN = "closed", "open", "half_open"
+
+# Skip the Redis round trip in allow() for this long after Redis said "closed"
+_BREAKER_SYNC_SECONDS = 5.0
+# After a Redis error, run on in-process state for this long before retrying
+_BREAKER_REMOTE_BACKOFF_SECONDS = 60.0
+
+
+def _breaker_transition(
+    record: Optional[Dict[str, Any]],
+    op: str,
+    now: float,
+    threshold: int,
+    reset_timeout: float,
+    max_probes: int,
+    probe_timeout: float,
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    In-process twin of RedisClient's circuit breaker Lua script — the two
+    must stay in step.  op is one of: peek, allow, success, failure, force_open.
+    Returns (new_record, allowed).
+    """
+    rec = dict(record or {"state": _CLOSED, "failures": 0, "opened_at": 0.0, "probes": 0, "probe_at": 0.0})
+    if rec["state"] == _OPEN and now - rec["opened_at"] >= reset_timeout:
+        rec.update(state=_HALF_OPEN, probes=0)
+    if rec["state"] == _HALF_OPEN and rec["probes"] >= max_probes and now - rec["probe_at"] >= probe_timeout:
+        rec["probes"] = 0
+
+    allowed = rec["state"] == _CLOSED or (rec["state"] == _HALF_OPEN and rec["probes"] < max_probes)
+    if op == "allow":
+        if rec["state"] == _HALF_OPEN and allowed:
+            rec.update(probes=rec["probes"] + 1, probe_at=now)
+    elif op == "success":
+        rec.update(state=_CLOSED, failures=0, opened_at=0.0, probes=0)
+    elif op == "failure":
+        if rec["state"] == _HALF_OPEN:
+            rec.update(state=_OPEN, opened_at=now, failures=max(rec["failures"], threshold))
+        else:
+            rec["failures"] += 1
+            if rec["state"] == _CLOSED and rec["failures"] >= threshold:
+                rec.update(state=_OPEN, opened_at=now)
+    elif op == "force_open":
+        rec.update(state=_OPEN, opened_at=now, failures=max(rec["failures"], threshold), probes=0)
+    return rec, allowed
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Per-provider concurrency slots
+# ─────────────────────────────────────────────────────────────────────────────
+
+_PROVIDER_SLOTS: Dict[str, threading.BoundedSemaphore] = {}
+_PROVIDER_SLOTS_LOCK = threading.Lock()
+
+
+@contextmanager
+def provider_slot(provider: BaseProvider) -> Iterator[None]:
+    """
+    Hold one of the provider's process-wide concurrency slots for the
+    duration of the block.  Slots are keyed by provider_name, so every
+    CascadeManager instance (one is built per request) shares the same
+    limit.  Blocks until a slot frees up.
+    """
+    with _PROVIDER_SLOTS_LOCK:
+        sem = _PROVIDER_SLOTS.get(provider.provider_name)
+        if sem is None:
+            sem = threading.BoundedSemaphore(max(1, provider.max_concurrency))
+            _PROVIDER_SLOTS[provider.provider_name] = sem
+    with sem:
+        yield
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Hedging budget and worker pool
+# ─────────────────────────────────────────────────────────────────────────────
+
+class HedgeBudget:
+    """
+    Token bucket limiting hedged (duplicate) provider calls for one category.
+    Every execute_hedged() call earns `ratio` tokens (capped at `burst`);
+    every hedge spends one.
+    """
+
+    def __init__(self, ratio: float = _HEDGE_RATIO, burst: float = _HEDGE_BURST) -> None:
+        self._ratio  = ratio
+        self._burst  = burst
+        self._tokens = burst
+        self._lock   = threading.Lock()
+        self.spent   = 0
+
+    def earn(self) -> None:
+        with self._lock:
+            self._tokens = min(self._burst, self._tokens + self._ratio)
+
+    def spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            self.spent += 1
+            return True
+
+
+_HEDGE_BUDGETS: Dict[str, HedgeBudget] = {}
+_HEDGE_LOCK = threading.Lock()
+_HEDGE_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _hedge_budget(category: str, ratio: float) -> HedgeBudget:
+    with _HEDGE_LOCK:
+        budget = _HEDGE_BUDGETS.get(category)
+        if budget is None:
+            budget = _HEDGE_BUDGETS[category] = HedgeBudget(ratio=ratio)
+        return budget
+
+
+def _hedge_pool() -> ThreadPoolExecutor:
+    # Shared across managers: a discarded hedge loser keeps running here
+    # until its provider call returns, without blocking the caller.
+    global _HEDGE_POOL
+    with _HEDGE_LOCK:
+        if _HEDGE_POOL is None:
+            _HEDGE_POOL = ThreadPoolExecutor(
+                max_workers=_HEDGE_WORKERS, thread_name_prefix="cascade_hedge"
+            )
+        return _HEDGE_POOL
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -151,6 +411,13 @@ class CascadeManager:
             print(result.data)
         else:
             print(result.error)   # full audit trail
+
+    Ordering policy
+    ───────────────
+    adaptive=False keeps the constructor order exactly (used where order
+    encodes quality or quota, e.g. TTS).  pinned names providers that are
+    always tried first, in the order given; the rest are ranked as
+    described in the module docstring.
     """
 
     def __init__(
@@ -159,6 +426,11 @@ class CascadeManager:
         category: str,
         max_retries_per_provider: int = 2,
         circuit_breaker: Optional[CircuitBreaker] = None,
+        adaptive: bool = True,
+        pinned: Sequence[str] = (),
+        cold_start_seconds: float = _COLD_START_SECONDS,
+        hedge_ratio: float = _HEDGE_RATIO,
+        explore_rate: float = _EXPLORE_RATE,
     ) -> None:
         if not providers:
             raise ValueError(
@@ -168,6 +440,12 @@ class CascadeManager:
         self.category = category
         self.max_retries = max_retries_per_provider
         self.breaker = circuit_breaker or CircuitBreaker()
+        self.adaptive = adaptive
+        self.pinned = tuple(pinned)
+        self.cold_start_seconds = cold_start_seconds
+        self.hedge_ratio = hedge_ratio
+        self.explore_rate = explore_rate
+        self.stats: ProviderStatsStore = get_provider_stats()
         self._attempt_log: List[Dict[str, Any]] = []
 
     # ── Public API ────────────────────────────────────────────────────────────
@@ -179,121 +457,333 @@ class CascadeManager:
         Returns a failure ProviderResult (success=False) when all are exhausted.
         Never raises.
         """
-        self._attempt_log = []
+        attempt_log: List[Dict[str, Any]] = []
+        self._attempt_log = attempt_log
 
-        for provider in self.providers:
-            pname = provider.provider_name
+        for provider in self.ordered_providers():
+            if not self._admit(provider, attempt_log):
+                continue
 
-            # ── Circuit breaker gate ──────────────────────────────────────────
-            if self.breaker.is_open(pname):
-                logger.info(
-                    "cascade_skip_circuit_open",
-                    category=self.category,
-                    provider=pname,
-                )
-                self._attempt_log.append(
-                    {"provider": pname, "skipped": "circuit_open"}
-                )
+            result = self._timed_attempt(provider, kwargs)
+            if self._settle(provider, result, attempt_log):
+                return result
+
+        return self._exhausted(attempt_log)
+
+    def execute_hedged(self, **kwargs: Any) -> ProviderResult:
+        """
+        Like execute(), but for idempotent requests only.  If the provider in
+        flight has not answered within its observed p90 latency, the next
+        provider is started as well and the first success wins.  The slower
+        call is left to finish in the background and its result is discarded;
+        it is still settled when it completes, so its latency feeds the
+        statistics and its breaker outcome (and any half-open probe slot it
+        holds) is recorded.  Latency is measured from when a pool worker picks
+        the call up, not from submission.
+
+        Extra calls are capped by a per-category HedgeBudget.  Without p90
+        data for the provider in flight (cold start), no hedge is issued and
+        this behaves exactly like execute().  Never raises.
+        """
+        attempt_log: List[Dict[str, Any]] = []
+        self._attempt_log = attempt_log
+        budget  = _hedge_budget(self.category, self.hedge_ratio)
+        budget.earn()
+        pending = list(self.ordered_providers())
+        in_flight: Dict[Future, BaseProvider] = {}
+        # provider name → monotonic time a pool worker started it (written
+        # by _timed_attempt, so time spent queued on the pool is excluded)
+        started: Dict[str, float] = {}
+        hedged_off: set = set()   # futures that already triggered their hedge
+
+        def launch_next() -> bool:
+            while pending:
+                provider = pending.pop(0)
+                if self._admit(provider, attempt_log):
+                    fut = _hedge_pool().submit(self._timed_attempt, provider, kwargs, started)
+                    in_flight[fut] = provider
+                    return True
+            return False
+
+        launch_next()
+        while in_flight:
+            timeout: Optional[float] = None
+            if pending and len(in_flight) == 1:
+                (fut,) = in_flight
+                delay = self._hedge_delay(in_flight[fut])
+                if delay is not None and fut not in hedged_off:
+                    began = started.get(in_flight[fut].provider_name)
+                    if began is None:
+                        # Still queued on the pool: not slow yet, look again shortly
+                        timeout = _MIN_HEDGE_DELAY_SECONDS
+                    else:
+                        timeout = max(0.0, began + delay - time.monotonic())
+
+            done, _ = wait(list(in_flight), timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                (fut,) = in_flight
+                began = started.get(in_flight[fut].provider_name)
+                if began is None:
+                    continue
+                hedged_off.add(fut)
+                if budget.spend():
+                    slow = in_flight[fut].provider_name
+                    if launch_next():
+                        logger.info(
+                            "cascade_hedge_issued",
+                            category=self.category,
+                            slow_provider=slow,
+                            waited_seconds=round(time.monotonic() - began, 2),
+                        )
+                else:
+                    logger.debug("cascade_hedge_budget_exhausted", category=self.category)
                 continue
 
-            # ── Availability gate ─────────────────────────────────────────────
-            try:
-                available = provider.is_available()
-            except Exception as chk_exc:
-                logger.warning(
-                    "cascade_availability_check_error",
-                    category=self.category,
-                    provider=pname,
-                    error=str(chk_exc),
-                )
-                available = False
+            for fut in done:
+                provider = in_flight.pop(fut)
+                result = fut.result()
+                if self._settle(provider, result, attempt_log):
+                    if in_flight:
+                        logger.info(
+                            "cascade_hedge_won",
+                            category=self.category,
+                            provider=provider.provider_name,
+                            discarded=[p.provider_name for p in in_flight.values()],
+                        )
+                        for loser, loser_provider in in_flight.items():
+                            loser.add_done_callback(
+                                lambda f, p=loser_provider: self._settle_discarded(p, f)
+                            )
+                    return result
+
+            if not in_flight:
+                launch_next()
+
+        return self._exhausted(attempt_log)
+
+    def ordered_providers(self) -> List[BaseProvider]:
+        """Providers in the order execute() will try them right now."""
+        if not self.adaptive:
+            return list(self.providers)
+
+        def rank(indexed: Any) -> tuple:
+            index, provider = indexed
+            name = provider.provider_name
+            if name in self.pinned:
+                return (0, self.pinned.index(name), 0.0, index)
+            expected = self.stats.expected_seconds(self.category, name)
+            if expected is None:
+                expected = self.cold_start_seconds
+            return (1, getattr(provider, "cost_tier", 0), expected, index)
+
+        ranked = sorted((rank(item), item[1]) for item in enumerate(self.providers))
+        ordered = [p for _, p in ranked]
+        if self.explore_rate and random.random() < self.explore_rate:
+            ordered = self._explore(ordered, [key for key, _ in ranked])
+        if [p.provider_name for p in ordered] != [p.provider_name for p in self.providers]:
+            logger.debug(
+                "cascade_adaptive_order",
+                category=self.category,
+                order=[p.provider_name for p in ordered],
+            )
+        return ordered
 
-            if not available:
-                logger.info(
-                    "cascade_skip_unavailable",
-                    category=self.category,
-                    provider=pname,
-                )
-                self._attempt_log.append(
-                    {"provider": pname, "skipped": "unavailable"}
-                )
+    def _explore(self, ordered: List[BaseProvider], ranks: List[tuple]) -> List[BaseProvider]:
+        """
+        Move one random demoted provider (not pinned, not first in its cost
+        tier) to the front of its tier.  Its next result refreshes the
+        statistics that demoted it.
+        """
+        tier_start: Dict[Any, int] = {}
+        candidates: List[int] = []
+        for pos, key in enumerate(ranks):
+            if key[0] == 0:
                 continue
+            if key[1] in tier_start:
+                candidates.append(pos)
+            else:
+                tier_start[key[1]] = pos
+        if not candidates:
+            return ordered
+        pos = random.choice(candidates)
+        explored = ordered.pop(pos)
+        ordered.insert(tier_start[ranks[pos][1]], explored)
+        logger.debug(
+            "cascade_explore",
+            category=self.category,
+            provider=explored.provider_name,
+            from_position=pos,
+        )
+        return ordered
 
-            # ── Execute with per-provider retry ───────────────────────────────
-            logger.info(
-                "cascade_trying_provider",
+    def get_provider_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Rolling latency / outcome statistics for this category."""
+        return self.stats.category_snapshot(self.category)
+
+    def get_attempt_log(self) -> List[Dict[str, Any]]:
+        """Return a copy of the detailed attempt log from the last execute() call."""
+        return list(self._attempt_log)
+
+    def get_available_providers(self) -> List[str]:
+        """Return names of providers whose circuit is currently closed."""
+        return [
+            p.provider_name
+            for p in self.providers
+            if not self.breaker.is_open(p.provider_name)
+        ]
+
+    def get_circuit_status(self) -> Dict[str, Any]:
+        """Return circuit breaker state for all providers."""
+        return self.breaker.get_status()
+
+    def provider_count(self) -> int:
+        return len(self.providers)
+
+    # ── Internal helpers ──────────────────────────────────────────────────────
+
+    def _admit(self, provider: BaseProvider, attempt_log: List[Dict[str, Any]]) -> bool:
+        """Availability and circuit-breaker gates.  Logs and records skips."""
+        pname = provider.provider_name
+
+        # ── Availability gate (checked first: no I/O, claims nothing) ─────────
+        try:
+            available = provider.is_available()
+        except Exception as chk_exc:
+            logger.warning(
+                "cascade_availability_check_error",
                 category=self.category,
                 provider=pname,
+                error=str(chk_exc),
             )
-            result = self._attempt_with_retry(provider, **kwargs)
+            available = False
 
-            if result.success:
-                self.breaker.record_success(pname)
-                self._attempt_log.append(
-                    {"provider": pname, "outcome": "success"}
-                )
-                logger.info(
-                    "cascade_success",
-                    category=self.category,
-                    provider=pname,
-                )
-                return result
+        if not available:
+            logger.info(
+                "cascade_skip_unavailable",
+                category=self.category,
+                provider=pname,
+            )
+            attempt_log.append({"provider": pname, "skipped": "unavailable"})
+            return False
 
-            # Provider failed all retries
-            self.breaker.record_failure(pname)
-            if not result.retriable:
-                self.breaker.force_open(pname)
-            self._attempt_log.append(
-                {"provider": pname, "outcome": "failed", "error": result.error}
+        # ── Circuit breaker gate (may claim a half-open probe slot) ───────────
+        if not self.breaker.allow(pname):
+            logger.info(
+                "cascade_skip_circuit_open",
+                category=self.category,
+                provider=pname,
             )
-            logger.warning(
-                "cascade_provider_exhausted",
+            attempt_log.append({"provider": pname, "skipped": "circuit_open"})
+            return False
+
+        logger.info(
+            "cascade_trying_provider",
+            category=self.category,
+            provider=pname,
+        )
+        return True
+
+    def _timed_attempt(
+        self,
+        provider: BaseProvider,
+        kwargs: Dict[str, Any],
+        start_times: Optional[Dict[str, float]] = None,
+    ) -> ProviderResult:
+        """
+        Execute with per-provider retry and feed the latency statistics.
+        The start time is also written to start_times[provider_name] when
+        given (execute_hedged reads it to time its hedge).
+        """
+        started = time.monotonic()
+        if start_times is not None:
+            start_times[provider.provider_name] = started
+        result = self._attempt_with_retry(provider, **kwargs)
+        self.stats.record(
+            self.category, provider.provider_name,
+            time.monotonic() - started, self._outcome(result),
+        )
+        return result
+
+    def _settle(
+        self,
+        provider: BaseProvider,
+        result: ProviderResult,
+        attempt_log: List[Dict[str, Any]],
+    ) -> bool:
+        """Update the breaker and attempt log.  Returns True on success."""
+        pname = provider.provider_name
+        if result.success:
+            self.breaker.record_success(pname)
+            attempt_log.append({"provider": pname, "outcome": "success"})
+            logger.info(
+                "cascade_success",
                 category=self.category,
                 provider=pname,
-                error=result.error,
             )
+            return True
 
-        # All providers exhausted
+        # Provider failed all retries
+        self.breaker.record_failure(pname)
+        if not result.retriable:
+            self.breaker.force_open(pname)
+        attempt_log.append({"provider": pname, "outcome": "failed", "error": result.error})
+        logger.warning(
+            "cascade_provider_exhausted",
+            category=self.category,
+            provider=pname,
+            error=result.error,
+        )
+        return False
+
+    def _settle_discarded(self, provider: BaseProvider, fut: Future) -> None:
+        """Done-callback for a hedge loser: record its breaker outcome."""
+        try:
+            result = fut.result()
+        except Exception as exc:
+            result = ProviderResult.failure(provider.provider_name, f"Hedged call raised: {exc}")
+        logger.debug(
+            "cascade_hedge_loser_settled",
+            category=self.category,
+            provider=provider.provider_name,
+            success=result.success,
+        )
+        self._settle(provider, result, [])
+
+    def _exhausted(self, attempt_log: List[Dict[str, Any]]) -> ProviderResult:
         audit = " | ".join(
             "{provider}:{info}".format(
                 provider=a["provider"],
                 info=a.get("error", a.get("skipped", "unknown")),
             )
-            for a in self._attempt_log
+            for a in attempt_log
         )
         logger.error(
             "cascade_all_providers_exhausted",
             category=self.category,
-            attempts=self._attempt_log,
+            attempts=attempt_log,
         )
         return ProviderResult(
             success=False,
             data=None,
             provider_used="none",
             error=f"All {self.category} providers exhausted. [{audit}]",
-            metadata={"attempts": self._attempt_log},
+            metadata={"attempts": attempt_log},
         )
 
-    def get_attempt_log(self) -> List[Dict[str, Any]]:
-        """Return a copy of the detailed attempt log from the last execute() call."""
-        return list(self._attempt_log)
-
-    def get_available_providers(self) -> List[str]:
-        """Return names of providers whose circuit is currently closed."""
-        return [
-            p.provider_name
-            for p in self.providers
-            if not self.breaker.is_open(p.provider_name)
-        ]
+    def _hedge_delay(self, provider: BaseProvider) -> Optional[float]:
+        p90 = self.stats.latency_percentile(self.category, provider.provider_name, 0.90)
+        if p90 is None:
+            return None
+        return max(_MIN_HEDGE_DELAY_SECONDS, p90)
 
-    def get_circuit_status(self) -> Dict[str, Any]:
-        """Return circuit breaker state for all providers."""
-        return self.breaker.get_status()
-
-    def provider_count(self) -> int:
-        return len(self.providers)
-
-    # ── Internal helpers ──────────────────────────────────────────────────────
+    @staticmethod
+    def _outcome(result: ProviderResult) -> str:
+        if result.success:
+            return "success"
+        if result.metadata.get("empty") or _EMPTY_RESULT_RE.match(result.error or ""):
+            return "empty"
+        return "error"
 
     def _attempt_with_retry(
         self, provider: BaseProvider, **kwargs: Any
@@ -310,7 +800,8 @@ class CascadeManager:
 
         for attempt in range(1, self.max_retries + 1):
             try:
-                result = provider.execute(**kwargs)
+                with provider_slot(provider):
+                    result = provider.execute(**kwargs)
             except Exception as exc:
                 # provider.execute() violated the no-raise contract; handle it here
                 result = ProviderResult.failure(
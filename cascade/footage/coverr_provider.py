@@ -13,7 +13,9 @@ from typing import Any, Dict, List, Optional
 import requests
 import structlog
 
+from cascade.asset_cache import AssetCache, get_asset_cache
 from cascade.base_provider import BaseProvider, ProviderResult
+from cascade.http_pool import http_session
 
 logger = structlog.get_logger(__name__)
 
@@ -46,7 +48,7 @@ class CoverrProvider(BaseProvider):
         auth_header = f"Bearer {api_key}"
 
         try:
-            resp = requests.get(
+            resp = self.http().get(
                 _SEARCH_URL,
                 headers={"Authorization": auth_header},
                 params={"q": query, "page": 1, "limit": 10},
@@ -54,7 +56,7 @@ class CoverrProvider(BaseProvider):
             )
             if resp.status_code in (401, 403):
                 # Try alternative: api_id as token
-                resp = requests.get(
+                resp = self.http().get(
                     _SEARCH_URL,
                     headers={"Authorization": f"Bearer {api_id}"},
                     params={"q": query, "page": 1, "limit": 10},
@@ -97,7 +99,12 @@ class CoverrProvider(BaseProvider):
         local_path = str(Path(download_dir) / filename)
 
         try:
-            file_bytes = _stream_download(download_url, local_path)
+            file_bytes = get_asset_cache().fetch(
+                self.provider_name, source_id,
+                AssetCache.rendition_from_url(download_url),
+                local_path, lambda tmp: _stream_download(download_url, tmp),
+                min_bytes=_MIN_FILE_BYTES,
+            )
         except Exception as exc:
             return ProviderResult.failure(
                 self.provider_name, f"Coverr download failed: {exc}"
@@ -160,7 +167,7 @@ class CoverrProvider(BaseProvider):
 def _stream_download(url: str, dest_path: str, timeout: int = 120) -> int:
     Path(dest_path).parent.mkdir(parents=True, exist_ok=True)
     total = 0
-    with requests.get(url, stream=True, timeout=timeout) as r:
+    with http_session().get(url, stream=True, timeout=timeout) as r:
         r.raise_for_status()
         with open(dest_path, "wb") as fh:
             for chunk in r.iter_content(chunk_size=32_768):
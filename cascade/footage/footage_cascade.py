@@ -4,6 +4,8 @@ cascade/footage/footage_cascade.py
 Footage Cascade Coordinator — single import point for all video clip retrieval.
 
 Provider order (Pexels → Pixabay → Coverr → Internet Archive → Vecteezy)
+is the cold-start order; CascadeManager re-ranks it by observed latency,
+success rate and empty-result rate (see cascade/provider_stats.py).
 """
 
 from __future__ import annotations
@@ -15,8 +17,11 @@ from typing import Dict, Optional
 
 import structlog
 
+from cascade.asset_cache import get_asset_cache
 from cascade.base_provider import ProviderResult
 from cascade.cascade_manager import CascadeManager, CircuitBreaker
+from cascade.http_pool import get_http
+from cascade.provider_stats import get_provider_stats
 from cascade.footage.coverr_provider import CoverrProvider
 from cascade.footage.internet_archive_provider import InternetArchiveProvider
 from cascade.footage.pexels_video_provider import PexelsVideoProvider
@@ -25,7 +30,7 @@ from cascade.footage.vecteezy_provider import VecteezyProvider
 
 logger = structlog.get_logger(__name__)
 
-_SHARED_BREAKER = CircuitBreaker(failure_threshold=3, reset_timeout_seconds=300)
+_SHARED_BREAKER = CircuitBreaker(failure_threshold=3, reset_timeout_seconds=300, namespace="footage")
 
 
 @dataclass
@@ -183,12 +188,15 @@ class FootageCascade:
                 p.provider_name for p in self._ordered_providers()
             ],
             "circuit_status": _SHARED_BREAKER.get_status(),
+            "asset_cache": get_asset_cache().get_stats(),
+            "provider_stats": get_provider_stats().category_snapshot("footage"),
+            "http_pool": get_http().get_stats(),
         }
 
     # ── Internal ──────────────────────────────────────────────────────────────
 
     def _ordered_providers(self) -> list:
-        """Return providers in fixed priority order."""
+        """Return providers in cold-start priority order."""
         return [
             self._pexels,
             self._pixabay,
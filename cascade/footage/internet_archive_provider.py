@@ -15,10 +15,11 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote
 
-import requests
 import structlog
 
+from cascade.asset_cache import get_asset_cache
 from cascade.base_provider import BaseProvider, ProviderResult
+from cascade.http_pool import http_session
 
 logger = structlog.get_logger(__name__)
 
@@ -34,6 +35,7 @@ class InternetArchiveProvider(BaseProvider):
     provider_name = "internet_archive"
     is_free_tier = True     # No per-call cost
     cascade_category = "footage"
+    max_concurrency = 2     # courtesy limit — archive.org throttles bursts
 
     def is_available(self) -> bool:
         # Can search without keys; secrets just enable faster downloads
@@ -80,7 +82,7 @@ class InternetArchiveProvider(BaseProvider):
         """Return a list of archive.org item identifiers matching the query."""
         ia_query = f"({query}) AND mediatype:movies"
         try:
-            resp = requests.get(
+            resp = http_session().get(
                 _SEARCH_URL,
                 params={
                     "q": ia_query,
@@ -111,7 +113,7 @@ class InternetArchiveProvider(BaseProvider):
     ) -> Optional[ProviderResult]:
         """Try to find and download an MP4 from one archive.org item."""
         try:
-            meta_resp = requests.get(
+            meta_resp = self.http().get(
                 _METADATA_URL.format(identifier=identifier),
                 timeout=20,
             )
@@ -148,7 +150,11 @@ class InternetArchiveProvider(BaseProvider):
             if access and secret:
                 headers["Authorization"] = f"LOW {access}:{secret}"
 
-            actual_bytes = _stream_download(download_url, local_path, headers=headers)
+            actual_bytes = get_asset_cache().fetch(
+                self.provider_name, identifier, filename,
+                local_path, lambda tmp: _stream_download(download_url, tmp, headers=headers),
+                min_bytes=_MIN_FILE_BYTES,
+            )
         except Exception as exc:
             logger.debug("ia_download_error", identifier=identifier, error=str(exc))
             return None
@@ -219,7 +225,7 @@ def _stream_download(
 ) -> int:
     Path(dest_path).parent.mkdir(parents=True, exist_ok=True)
     total = 0
-    with requests.get(url, stream=True, timeout=timeout, headers=headers or {}) as r:
+    with http_session().get(url, stream=True, timeout=timeout, headers=headers or {}) as r:
         r.raise_for_status()
         with open(dest_path, "wb") as fh:
             for chunk in r.iter_content(chunk_size=32_768):
@@ -14,7 +14,9 @@ from typing import Any, Dict, List, Optional
 import requests
 import structlog
 
+from cascade.asset_cache import get_asset_cache
 from cascade.base_provider import BaseProvider, ProviderResult
+from cascade.http_pool import http_session
 
 logger = structlog.get_logger(__name__)
 
@@ -45,7 +47,7 @@ class PexelsVideoProvider(BaseProvider):
         headers = {"Authorization": api_key}
 
         try:
-            resp = requests.get(
+            resp = self.http().get(
                 _SEARCH_URL,
                 headers=headers,
                 params={
@@ -89,7 +91,12 @@ class PexelsVideoProvider(BaseProvider):
         local_path = str(Path(download_dir) / filename)
 
         try:
-            file_bytes = _stream_download(download_url, local_path)
+            file_bytes = get_asset_cache().fetch(
+                self.provider_name, source_id,
+                f"{file_meta.get('quality', 'sd')}_{file_meta.get('width', 0)}",
+                local_path, lambda tmp: _stream_download(download_url, tmp),
+                min_bytes=_MIN_FILE_BYTES,
+            )
         except Exception as exc:
             return ProviderResult.failure(
                 self.provider_name, f"Pexels download failed: {exc}"
@@ -163,7 +170,7 @@ def _stream_download(url: str, dest_path: str, timeout: int = 120) -> int:
     """Stream a file to dest_path. Returns bytes written."""
     Path(dest_path).parent.mkdir(parents=True, exist_ok=True)
     total = 0
-    with requests.get(url, stream=True, timeout=timeout) as r:
+    with http_session().get(url, stream=True, timeout=timeout) as r:
         r.raise_for_status()
         with open(dest_path, "wb") as fh:
             for chunk in r.iter_content(chunk_size=32_768):
@@ -13,7 +13,9 @@ from typing import Any, Dict, List, Optional
 import requests
 import structlog
 
+from cascade.asset_cache import AssetCache, get_asset_cache
 from cascade.base_provider import BaseProvider, ProviderResult
+from cascade.http_pool import http_session
 
 logger = structlog.get_logger(__name__)
 
@@ -51,7 +53,7 @@ class VecteezyProvider(BaseProvider):
         headers = {"Authorization": f"Bearer {token}"}
 
         try:
-            resp = requests.get(
+            resp = self.http().get(
                 f"{_API_BASE}/videos",
                 headers=headers,
                 params={
@@ -108,7 +110,12 @@ class VecteezyProvider(BaseProvider):
         local_path = str(Path(download_dir) / filename)
 
         try:
-            file_bytes = _stream_download(download_url, local_path, headers=headers)
+            file_bytes = get_asset_cache().fetch(
+                self.provider_name, source_id,
+                AssetCache.rendition_from_url(download_url),
+                local_path, lambda tmp: _stream_download(download_url, tmp, headers=headers),
+                min_bytes=_MIN_FILE_BYTES,
+            )
         except Exception as exc:
             return ProviderResult.failure(
                 self.provider_name, f"Vecteezy download failed: {exc}"
@@ -144,7 +151,7 @@ class VecteezyProvider(BaseProvider):
     def _get_token(client_id: str, client_secret: str) -> Optional[str]:
         """Try OAuth2 client_credentials; fall back to using secret as bearer."""
         try:
-            resp = requests.post(
+            resp = http_session().post(
                 f"{_API_BASE}/oauth/token",
                 data={
                     "grant_type": "client_credentials",
@@ -186,7 +193,7 @@ def _stream_download(
 ) -> int:
     Path(dest_path).parent.mkdir(parents=True, exist_ok=True)
     total = 0
-    with requests.get(url, stream=True, timeout=timeout, headers=headers or {}) as r:
+    with http_session().get(url, stream=True, timeout=timeout, headers=headers or {}) as r:
         r.raise_for_status()
         with open(dest_path, "wb") as fh:
             for chunk in r.iter_content(chunk_size=32_768):
@@ -0,0 +1,169 @@
+"""
+cascade/http_pool.py
+
+Shared keep-alive HTTP transport for providers and engines.
+
+Every provider used to call bare requests.get / requests.post.  Each call
+opened a fresh TCP + TLS connection, even though dozens of calls per video go
+to the same few hosts (api.pexels.com, videos.pexels.com, pixabay.com, …).
+This module keeps one pooled transport per process so a handshake is paid
+once per host per run.
+
+  http_session()   requests.Session for the calling thread.  All thread
+                   sessions mount the same HTTPAdapter, so they share its
+                   per-host urllib3 connection pools.  Cookies and headers
+                   stay per thread.  Drop-in for the requests module API.
+  http_client()    httpx.Client (thread-safe) for new code.  Uses HTTP/2 when
+                   the optional `h2` package is installed, else keep-alive
+                   HTTP/1.1.
+  get_stats()      Requests, new connections and reuse ratio per host.
+
+Providers reach it through BaseProvider.http().  Requests without an
+explicit timeout get _DEFAULT_TIMEOUT instead of waiting forever.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+import structlog
+from requests.adapters import HTTPAdapter
+
+logger = structlog.get_logger(__name__)
+
+_POOL_HOSTS       = 32                 # distinct hosts kept in the pool manager
+_POOL_PER_HOST    = 16                 # idle keep-alive connections kept per host
+_DEFAULT_TIMEOUT  = (5.0, 60.0)        # (connect, read) seconds
+
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout and counts requests per host."""
+
+    def __init__(self, default_timeout: Tuple[float, float], **kwargs: Any) -> None:
+        self._default_timeout = default_timeout
+        self._requests: Dict[str, int] = {}
+        self._count_lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout=None, **kwargs):  # type: ignore[override]
+        host = urlsplit(request.url).netloc
+        with self._count_lock:
+            self._requests[host] = self._requests.get(host, 0) + 1
+        return super().send(request, timeout=timeout or self._default_timeout, **kwargs)
+
+    def host_stats(self) -> Dict[str, Dict[str, int]]:
+        connections: Dict[str, int] = {}
+        pools = self.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = pool.host if pool.port in (None, 80, 443) else f"{pool.host}:{pool.port}"
+            connections[host] = connections.get(host, 0) + int(getattr(pool, "num_connections", 0))
+        with self._count_lock:
+            counts = dict(self._requests)
+        return {
+            host: {"requests": n, "connections": connections.get(host, 0)}
+            for host, n in counts.items()
+        }
+
+
+class HttpTransport:
+    """Process-wide pooled HTTP transport.  Use http_session() / http_client()."""
+
+    def __init__(
+        self,
+        pool_hosts: int = _POOL_HOSTS,
+        pool_per_host: int = _POOL_PER_HOST,
+        default_timeout: Tuple[float, float] = _DEFAULT_TIMEOUT,
+    ) -> None:
+        self._pool_hosts = pool_hosts
+        self._pool_per_host = pool_per_host
+        self._default_timeout = default_timeout
+        self._adapter = _PooledAdapter(
+            default_timeout=default_timeout,
+            pool_connections=pool_hosts,
+            pool_maxsize=pool_per_host,
+            max_retries=0,            # CascadeManager owns retries
+        )
+        self._local = threading.local()
+        self._httpx: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def session(self) -> requests.Session:
+        sess = getattr(self._local, "session", None)
+        if sess is None:
+            sess = requests.Session()
+            sess.mount("https://", self._adapter)
+            sess.mount("http://", self._adapter)
+            self._local.session = sess
+        return sess
+
+    def client(self) -> Any:
+        with self._lock:
+            if self._httpx is None:
+                import httpx
+                try:
+                    import h2  # noqa: F401
+                    http2 = True
+                except ImportError:
+                    http2 = False
+                self._httpx = httpx.Client(
+                    http2=http2,
+                    timeout=httpx.Timeout(self._default_timeout[1], connect=self._default_timeout[0]),
+                    limits=httpx.Limits(
+                        max_connections=self._pool_hosts * self._pool_per_host,
+                        max_keepalive_connections=self._pool_per_host * 4,
+                    ),
+                    follow_redirects=True,
+                )
+                logger.debug("http_client_ready", http2=http2)
+            return self._httpx
+
+    def get_stats(self) -> Dict[str, Any]:
+        hosts = self._adapter.host_stats()
+        total_requests = sum(h["requests"] for h in hosts.values())
+        total_connections = sum(h["connections"] for h in hosts.values())
+        for h in hosts.values():
+            h["reused"] = max(0, h["requests"] - h["connections"])
+        return {
+            "requests": total_requests,
+            "connections_opened": total_connections,
+            "reuse_ratio": (
+                round(1 - total_connections / total_requests, 3) if total_requests else 0.0
+            ),
+            "hosts": hosts,
+        }
+
+    def close(self) -> None:
+        self._adapter.close()
+        with self._lock:
+            if self._httpx is not None:
+                self._httpx.close()
+                self._httpx = None
+
+
+# ── Singleton ──────────────────────────────────────────────────────────────────
+
+_transport_instance: Optional[HttpTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_http() -> HttpTransport:
+    global _transport_instance
+    with _transport_lock:
+        if _transport_instance is None:
+            _transport_instance = HttpTransport()
+        return _transport_instance
+
+
+def http_session() -> requests.Session:
+    """Pooled requests.Session for the calling thread."""
+    return get_http().session()
+
+
+def http_client() -> Any:
+    """Shared pooled httpx.Client (HTTP/2 when `h2` is installed)."""
+    return get_http().client()
@@ -13,7 +13,9 @@ from typing import Any, Dict, List, Optional
 import requests
 import structlog
 
+from cascade.asset_cache import AssetCache, get_asset_cache
 from cascade.base_provider import BaseProvider, ProviderResult
+from cascade.http_pool import http_session
 
 logger = structlog.get_logger(__name__)
 
@@ -44,7 +46,7 @@ class FreepikProvider(BaseProvider):
         }
 
         try:
-            resp = requests.get(
+            resp = self.http().get(
                 f"{_API_BASE}/resources",
                 headers=headers,
                 params={
@@ -100,7 +102,12 @@ class FreepikProvider(BaseProvider):
             local_path = str(Path(download_dir) / filename)
 
             try:
-                file_bytes = _download_image(img_url, local_path, headers=headers)
+                file_bytes = get_asset_cache().fetch(
+                    self.provider_name, source_id,
+                    AssetCache.rendition_from_url(img_url),
+                    local_path, lambda tmp: _download_image(img_url, tmp, headers=headers),
+                    min_bytes=_MIN_FILE_BYTES,
+                )
             except Exception as exc:
                 logger.debug(
                     "freepik_download_attempt_failed",
@@ -143,7 +150,7 @@ def _download_image(
 ) -> int:
     Path(dest_path).parent.mkdir(parents=True, exist_ok=True)
     total = 0
-    with requests.get(url, stream=True, timeout=timeout, headers=headers or {}) as r:
+    with http_session().get(url, stream=True, timeout=timeout, headers=headers or {}) as r:
         r.raise_for_status()
         with open(dest_path, "wb") as fh:
             for chunk in r.iter_content(chunk_size=16_384):
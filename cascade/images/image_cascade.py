@@ -11,15 +11,18 @@ from typing import Dict, Optional
 
 import structlog
 
+from cascade.asset_cache import get_asset_cache
 from cascade.base_provider import ProviderResult
 from cascade.cascade_manager import CascadeManager, CircuitBreaker
+from cascade.http_pool import get_http
+from cascade.provider_stats import get_provider_stats
 from cascade.images.freepik_provider import FreepikProvider
 from cascade.images.pexels_photo_provider import PexelsPhotoProvider
 from cascade.images.pixabay_photo_provider import PixabayPhotoProvider
 from cascade.images.unsplash_provider import UnsplashProvider
 
 logger = structlog.get_logger(__name__)
-_SHARED_BREAKER = CircuitBreaker(failure_threshold=3, reset_timeout_seconds=300)
+_SHARED_BREAKER = CircuitBreaker(failure_threshold=3, reset_timeout_seconds=300, namespace="images")
 
 
 @dataclass
@@ -61,7 +64,8 @@ class ImageCascade:
             max_retries_per_provider=1,
             circuit_breaker=_SHARED_BREAKER,
         )
-        result: ProviderResult = manager.execute(
+        # Idempotent search + download: hedge a slow provider with the next one
+        result: ProviderResult = manager.execute_hedged(
             query=query,
             download_dir=download_dir,
             orientation=orientation,
@@ -95,6 +99,9 @@ class ImageCascade:
         return {
             "category": "images",
             "circuit_status": _SHARED_BREAKER.get_status(),
+            "provider_stats": get_provider_stats().category_snapshot("images"),
+            "http_pool": get_http().get_stats(),
+            "asset_cache": get_asset_cache().get_stats(),
         }
 
 
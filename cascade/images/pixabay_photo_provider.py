@@ -13,7 +13,9 @@ from typing import Any, Dict, List, Optional
 import requests
 import structlog
 
+from cascade.asset_cache import AssetCache, get_asset_cache
 from cascade.base_provider import BaseProvider, ProviderResult
+from cascade.http_pool import http_session
 
 logger = structlog.get_logger(__name__)
 
@@ -42,7 +44,7 @@ class PixabayPhotoProvider(BaseProvider):
         pix_orient = "vertical" if orientation.lower() == "portrait" else "horizontal"
 
         try:
-            resp = requests.get(
+            resp = self.http().get(
                 _SEARCH_URL,
                 params={
                     "key": os.environ["PIXABAY_API_KEY"],
@@ -88,7 +90,12 @@ class PixabayPhotoProvider(BaseProvider):
         local_path = str(Path(download_dir) / f"pixabay_{source_id}.jpg")
 
         try:
-            file_bytes = _download_image(download_url, local_path)
+            file_bytes = get_asset_cache().fetch(
+                self.provider_name, source_id,
+                AssetCache.rendition_from_url(download_url),
+                local_path, lambda tmp: _download_image(download_url, tmp),
+                min_bytes=_MIN_FILE_BYTES,
+            )
         except Exception as exc:
             return ProviderResult.failure(
                 self.provider_name, f"Pixabay photo download failed: {exc}"
@@ -121,7 +128,7 @@ class PixabayPhotoProvider(BaseProvider):
 def _download_image(url: str, dest_path: str, timeout: int = 60) -> int:
     Path(dest_path).parent.mkdir(parents=True, exist_ok=True)
     total = 0
-    with requests.get(url, stream=True, timeout=timeout) as r:
+    with http_session().get(url, stream=True, timeout=timeout) as r:
         r.raise_for_status()
         with open(dest_path, "wb") as fh:
             for chunk in r.iter_content(chunk_size=16_384):
@@ -13,7 +13,9 @@ from typing import Any, Dict, List, Optional
 import requests
 import structlog
 
+from cascade.asset_cache import AssetCache, get_asset_cache
 from cascade.base_provider import BaseProvider, ProviderResult
+from cascade.http_pool import http_session
 
 logger = structlog.get_logger(__name__)
 
@@ -50,7 +52,7 @@ class UnsplashProvider(BaseProvider):
         )
 
         try:
-            resp = requests.get(
+            resp = self.http().get(
                 _SEARCH_URL,
                 headers=headers,
                 params={
@@ -97,7 +99,12 @@ class UnsplashProvider(BaseProvider):
         local_path = str(Path(download_dir) / filename)
 
         try:
-            file_bytes = _download_image(download_url, local_path)
+            file_bytes = get_asset_cache().fetch(
+                self.provider_name, source_id,
+                AssetCache.rendition_from_url(download_url),
+                local_path, lambda tmp: _download_image(download_url, tmp),
+                min_bytes=_MIN_FILE_BYTES,
+            )
         except Exception as exc:
             return ProviderResult.failure(
                 self.provider_name, f"Unsplash download failed: {exc}"
@@ -113,7 +120,7 @@ class UnsplashProvider(BaseProvider):
         dl_link = photo.get("links", {}).get("download_location")
         if dl_link:
             try:
-                requests.get(
+                self.http().get(
                     dl_link, headers=headers, timeout=10
                 )
             except Exception:
@@ -160,7 +167,7 @@ class UnsplashProvider(BaseProvider):
 def _download_image(url: str, dest_path: str, timeout: int = 60) -> int:
     Path(dest_path).parent.mkdir(parents=True, exist_ok=True)
     total = 0
-    with requests.get(url, stream=True, timeout=timeout) as r:
+    with http_session().get(url, stream=True, timeout=timeout) as r:
         r.raise_for_status()
         with open(dest_path, "wb") as fh:
             for chunk in r.iter_content(chunk_size=16_384):
@@ -15,18 +15,31 @@ Provider cascade order
   4. Together Llama 70B  (4th     — fast paid inference)
   5. OpenAI GPT-4o-mini  (last    — most reliable, cost backstop)
 
+This is the cold-start order.  CascadeManager re-ranks the free providers by
+observed time-to-success.  Together and OpenAI have cost_tier=1 and always
+stay behind them.
+
 Public interface
 ────────────────
-  generate_text(prompt, system_prompt, max_tokens, temperature) → str
-  generate_json(prompt, system_prompt, max_tokens)              → dict
-  get_llm()                                                     → LLMCascade singleton
+  generate_text(prompt, system_prompt, max_tokens, temperature, cache) → str
+  generate_json(prompt, system_prompt, max_tokens, cache)              → dict
+  get_llm()                                                            → LLMCascade singleton
+
+Response cache
+──────────────
+Deterministic calls are answered from LLMResponseCache (in-process LRU +
+Redis TTL) when an identical request was answered before.  The key is a
+sha256 of (system prompt, prompt, temperature, max_tokens, format) with
+whitespace normalised.  cache=None (the default) caches only calls at or
+below _CACHE_MAX_TEMPERATURE.  Pass cache=False for creative generations
+that must differ between attempts, or cache=True to force caching.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import structlog
 
@@ -37,12 +50,16 @@ from cascade.llm.groq_provider import GroqProvider
 from cascade.llm.openai_provider import OpenAIProvider
 from cascade.llm.openrouter_provider import OpenRouterProvider
 from cascade.llm.together_provider import TogetherProvider
+from cascade.llm.response_cache import LLMResponseCache, get_llm_response_cache
 
 logger = structlog.get_logger(__name__)
 
 # Shared circuit breaker instance so failures persist across multiple
-# LLMCascade.generate_*() calls within the same process/workflow run
-_SHARED_BREAKER = CircuitBreaker(failure_threshold=3, reset_timeout_seconds=300)
+# LLMCascade.generate_*() calls, and (via Redis) across workflow runs
+_SHARED_BREAKER = CircuitBreaker(failure_threshold=3, reset_timeout_seconds=300, namespace="llm")
+
+# Calls at or below this temperature are cached unless the caller opts out
+_CACHE_MAX_TEMPERATURE = 0.3
 
 
 class LLMCascade:
@@ -65,6 +82,7 @@ class LLMCascade:
             max_retries_per_provider=2,
             circuit_breaker=_SHARED_BREAKER,
         )
+        self._cache: LLMResponseCache = get_llm_response_cache()
 
     # ═════════════════════════════════════════════════════════════════════════
     # Core public methods — used by every engine
@@ -76,6 +94,7 @@ class LLMCascade:
         system_prompt: Optional[str] = None,
         max_tokens: int = 1_000,
         temperature: float = 0.7,
+        cache: Optional[bool] = None,
     ) -> str:
         """
         Generate a plain-text response.
@@ -84,6 +103,15 @@ class LLMCascade:
         The caller is responsible for deciding how to handle that error
         (log + skip the job vs. mark the queue entry as failed).
         """
+        fingerprint = self._cache_fingerprint(
+            "text", prompt, system_prompt, max_tokens, temperature, cache
+        )
+        if fingerprint:
+            cached = self._cache.get(fingerprint)
+            if isinstance(cached, str) and cached.strip():
+                logger.debug("llm_cache_hit", format="text", fingerprint=fingerprint[:12])
+                return cached
+
         result: ProviderResult = self._manager.execute(
             prompt=prompt,
             system_prompt=system_prompt,
@@ -107,6 +135,8 @@ class LLMCascade:
             tokens=result.metadata.get("total_tokens", "?"),
             chars=len(text),
         )
+        if fingerprint:
+            self._cache.put(fingerprint, text.strip())
         return text.strip()
 
     def generate_json(
@@ -114,14 +144,28 @@ class LLMCascade:
         prompt: str,
         system_prompt: Optional[str] = None,
         max_tokens: int = 1_500,
+        cache: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """
         Generate a structured JSON response and return it as a Python dict.
 
-        Always uses a lower temperature (0.3) for deterministic JSON output.
+        Always uses a lower temperature (0.3) for deterministic JSON output,
+        so responses are cached by default; pass cache=False when a retry
+        must produce a different answer.  Provider calls are hedged (see
+        CascadeManager.execute_hedged).
         Raises RuntimeError if every provider fails or if none returns valid JSON.
         """
-        result: ProviderResult = self._manager.execute(
+        fingerprint = self._cache_fingerprint(
+            "json", prompt, system_prompt, max_tokens, 0.3, cache
+        )
+        if fingerprint:
+            cached = self._cache.get(fingerprint)
+            if isinstance(cached, dict):
+                logger.debug("llm_cache_hit", format="json", fingerprint=fingerprint[:12])
+                return cached
+
+        # Low-temperature JSON is idempotent, so a slow provider is hedged
+        result: ProviderResult = self._manager.execute_hedged(
             prompt=prompt,
             system_prompt=system_prompt,
             response_format="json",
@@ -154,6 +198,8 @@ class LLMCascade:
             tokens=result.metadata.get("total_tokens", "?"),
             keys=list(data.keys())[:6],
         )
+        if fingerprint:
+            self._cache.put(fingerprint, data)
         return data
 
     # ═════════════════════════════════════════════════════════════════════════
@@ -231,7 +277,8 @@ Rules:
 - search_query must be specific enough to find real footage (e.g. "orca hunting shark" not "ocean").
 - Do not add any text outside the JSON object.
 """
-        return self.generate_json(prompt=prompt, system_prompt=system, max_tokens=1_200)
+        # Never cached: a topic retry after a duplicate rejection needs a new script
+        return self.generate_json(prompt=prompt, system_prompt=system, max_tokens=1_200, cache=False)
 
     def generate_video_title(
         self,
@@ -330,6 +377,53 @@ Rules:
             # the pipeline can continue with human review flagging
             return {"plausible": True, "confidence": 50, "concern": "Fact verification LLM call failed — manual review recommended."}
 
+    def verify_fact_batch(
+        self, facts: List[Tuple[str, list]], topic: str
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Batched form of verify_fact_consistency: one prompt, one verdict per
+        fact.  `facts` is a list of (fact_text, source_names).  Returns a
+        list aligned with `facts`; an entry is None when the model omitted or
+        garbled that fact's verdict, so the caller can re-check it alone.
+        Raises RuntimeError if the cascade fails.
+        """
+        lines = []
+        for i, (fact_text, source_names) in enumerate(facts):
+            sources_str = ", ".join(source_names) if source_names else "none provided"
+            lines.append(f"[{i}] {fact_text}\n    Sources cited: {sources_str}")
+        prompt = (
+            f"Evaluate each of these scientific facts for plausibility.\n\n"
+            f"Topic: {topic}\n\n"
+            "Facts:\n" + "\n".join(lines) + "\n\n"
+            "Return a JSON object with one verdict per fact, in any order:\n"
+            "{\n"
+            '  "verdicts": [\n'
+            "    {\n"
+            '      "index": integer index of the fact above,\n'
+            '      "plausible": true or false,\n'
+            '      "confidence": integer 0–100 (how confident you are it is accurate),\n'
+            '      "concern": "describe any scientific concern" or null\n'
+            "    }\n"
+            "  ]\n"
+            "}"
+        )
+        data = self.generate_json(
+            prompt=prompt,
+            system_prompt="You are a science fact-checker with expertise in biology, astronomy, and natural history.",
+            max_tokens=120 + 80 * len(facts),
+        )
+        verdicts: List[Optional[Dict[str, Any]]] = [None] * len(facts)
+        for v in data.get("verdicts") or []:
+            if not isinstance(v, dict):
+                continue
+            try:
+                idx = int(v.get("index"))
+            except (TypeError, ValueError):
+                continue
+            if 0 <= idx < len(facts) and "confidence" in v:
+                verdicts[idx] = v
+        return verdicts
+
     # ═════════════════════════════════════════════════════════════════════════
     # Diagnostics
     # ═════════════════════════════════════════════════════════════════════════
@@ -341,8 +435,44 @@ Rules:
             "provider_count": self._manager.provider_count(),
             "available_providers": self._manager.get_available_providers(),
             "circuit_status": self._manager.get_circuit_status(),
+            "provider_stats": self._manager.get_provider_stats(),
+            "response_cache": self._cache.get_stats(),
         }
 
+    # ═════════════════════════════════════════════════════════════════════════
+    # Response cache
+    # ═════════════════════════════════════════════════════════════════════════
+
+    def _cache_fingerprint(
+        self,
+        response_format: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        cache: Optional[bool],
+    ) -> Optional[str]:
+        """
+        Cache key for this call, or None when the call must not be cached.
+        Whitespace runs are collapsed so re-indented f-string prompts match.
+        """
+        if cache is None:
+            cache = temperature <= _CACHE_MAX_TEMPERATURE
+        if not cache:
+            self._cache.record_bypass()
+            return None
+        payload = json.dumps(
+            [
+                response_format,
+                " ".join((system_prompt or "").split()),
+                " ".join(prompt.split()),
+                round(float(temperature), 3),
+                int(max_tokens),
+            ],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Module-level singleton accessor
@@ -41,6 +41,7 @@ class OpenAIProvider(BaseProvider):
     provider_name = "openai"
     is_free_tier = False
     cascade_category = "llm"
+    cost_tier = 1   # paid backstop: adaptive ordering keeps it behind free providers
 
     def __init__(self) -> None:
         self._client: Optional[Any] = None
@@ -0,0 +1,131 @@
+"""
+cascade/llm/response_cache.py
+
+Two-tier cache for deterministic LLM responses.
+
+  Tier 1  In-process LRU (OrderedDict) — topic retries inside one
+          ShortPipeline.run and repeated fact checks in one batch.
+  Tier 2  Redis with TTL (RK.llm_response) — reruns of the same workflow,
+          e.g. seed_topics batches or FactVerifier across jobs.
+
+Entries are keyed by a fingerprint that LLMCascade builds from
+(system prompt, prompt, temperature, max_tokens, response format).  Only
+successful responses are stored.  Redis is best-effort: any Redis error is
+logged at debug level and treated as a miss, never raised.
+"""
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_LOCAL_MAX_ENTRIES = 256
+_TTL_SECONDS       = 24 * 3_600
+
+
+class LLMResponseCache:
+    """Thread-safe LRU in front of a Redis TTL cache."""
+
+    def __init__(
+        self,
+        max_entries: int = _LOCAL_MAX_ENTRIES,
+        ttl_seconds: int = _TTL_SECONDS,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl         = ttl_seconds
+        self._lock        = threading.Lock()
+        self._local: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._stats = {
+            "memory_hits": 0, "redis_hits": 0, "misses": 0,
+            "stores": 0, "bypassed": 0,
+        }
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def get(self, fingerprint: str) -> Optional[Any]:
+        """Return a copy of the cached response, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._local.get(fingerprint)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._local.move_to_end(fingerprint)
+                    self._stats["memory_hits"] += 1
+                    return copy.deepcopy(value)
+                self._local.pop(fingerprint, None)
+
+        value = self._redis_get(fingerprint)
+        with self._lock:
+            if value is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["redis_hits"] += 1
+            self._remember(fingerprint, value, now)
+        return copy.deepcopy(value)
+
+    def put(self, fingerprint: str, value: Any) -> None:
+        with self._lock:
+            self._remember(fingerprint, copy.deepcopy(value), time.time())
+            self._stats["stores"] += 1
+        self._redis_put(fingerprint, value)
+
+    def record_bypass(self) -> None:
+        with self._lock:
+            self._stats["bypassed"] += 1
+
+    def clear(self) -> None:
+        """Drop the in-process tier (Redis entries expire on their own)."""
+        with self._lock:
+            self._local.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits    = self._stats["memory_hits"] + self._stats["redis_hits"]
+            lookups = hits + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+                "entries":  len(self._local),
+            }
+
+    # ── Internal ──────────────────────────────────────────────────────────────
+
+    def _remember(self, fingerprint: str, value: Any, now: float) -> None:
+        self._local[fingerprint] = (now + self._ttl, value)
+        self._local.move_to_end(fingerprint)
+        while len(self._local) > self._max_entries:
+            self._local.popitem(last=False)
+
+    def _redis_get(self, fingerprint: str) -> Optional[Any]:
+        try:
+            from storage.redis_client import RK, get_redis
+            return get_redis().get_json(RK.llm_response(fingerprint))
+        except Exception as exc:
+            logger.debug("llm_cache_redis_get_failed", error=str(exc)[:80])
+            return None
+
+    def _redis_put(self, fingerprint: str, value: Any) -> None:
+        try:
+            from storage.redis_client import RK, get_redis
+            get_redis().set_with_ttl(RK.llm_response(fingerprint), value, self._ttl)
+        except Exception as exc:
+            logger.debug("llm_cache_redis_put_failed", error=str(exc)[:80])
+
+
+_cache_instance: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    global _cache_instance
+    with _cache_lock:
+        if _cache_instance is None:
+            _cache_instance = LLMResponseCache()
+        return _cache_instance
@@ -42,6 +42,7 @@ class TogetherProvider(BaseProvider):
     provider_name = "together"
     is_free_tier = False
     cascade_category = "llm"
+    cost_tier = 1   # paid backstop: adaptive ordering keeps it behind free providers
 
     def __init__(self) -> None:
         self._client: Optional[Any] = None
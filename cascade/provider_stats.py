@@ -0,0 +1,202 @@
+"""
+cascade/provider_stats.py
+
+Rolling per-provider latency and outcome statistics shared by every
+CascadeManager in the process, used to order providers adaptively.
+
+Each (category, provider) keeps its last _WINDOW calls as
+(latency_seconds, outcome) samples, where outcome is one of
+
+  success   provider returned usable data
+  empty     provider answered but had nothing for this request
+            ("No Pexels videos found for …")
+  error     anything else (timeouts, 4xx/5xx, bad payloads)
+
+From the window we derive p50 / p95 latency, success rate, empty rate and
+the expected time-to-success, p50 / success_rate.  This is the ranking key
+CascadeManager sorts by.
+
+Samples are persisted to Redis (RK.cascade_stats, one JSON blob per
+category, 7-day TTL) at most every _FLUSH_SECONDS.  The next workflow run
+therefore starts with warm statistics.  Persistence is best-effort and
+last-writer-wins across concurrent runs.  Any Redis failure is ignored.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_WINDOW          = 50
+_MIN_SAMPLES     = 5             # below this a provider is "cold" and not ranked on its stats
+_FLUSH_SECONDS   = 30.0
+_TTL_SECONDS     = 7 * 86_400
+_SUCCESS_FLOOR   = 0.05          # keeps expected time finite for providers that never succeed
+
+OUTCOMES = ("success", "empty", "error")
+
+Sample = Tuple[float, str]
+
+
+class ProviderStatsStore:
+    """Thread-safe rolling windows of provider call outcomes."""
+
+    def __init__(self, window: int = _WINDOW) -> None:
+        self._window  = window
+        self._lock    = threading.Lock()
+        self._samples: Dict[str, Dict[str, Deque[Sample]]] = {}   # category → provider → samples
+        self._loaded: set = set()
+        self._last_flush: Dict[str, float] = {}
+
+    # ── Recording ─────────────────────────────────────────────────────────────
+
+    def record(self, category: str, provider: str, latency: float, outcome: str) -> None:
+        if outcome not in OUTCOMES:
+            outcome = "error"
+        self._ensure_loaded(category)
+        with self._lock:
+            window = self._samples.setdefault(category, {}).setdefault(
+                provider, deque(maxlen=self._window)
+            )
+            window.append((round(float(latency), 3), outcome))
+            due = time.time() - self._last_flush.get(category, 0.0) >= _FLUSH_SECONDS
+            if due:
+                self._last_flush[category] = time.time()
+                payload = self._serialise(category)
+        if due:
+            self._redis_save(category, payload)
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    def expected_seconds(self, category: str, provider: str) -> Optional[float]:
+        """
+        Expected seconds until this provider yields a success, or None while
+        it has fewer than _MIN_SAMPLES recorded calls.
+        """
+        snap = self.snapshot(category, provider)
+        if snap["calls"] < _MIN_SAMPLES:
+            return None
+        return snap["p50_seconds"] / max(snap["success_rate"], _SUCCESS_FLOOR)
+
+    def latency_percentile(self, category: str, provider: str, pct: float) -> Optional[float]:
+        """Latency percentile over the window, or None while the provider is cold."""
+        self._ensure_loaded(category)
+        with self._lock:
+            samples = list(self._samples.get(category, {}).get(provider, ()))
+        if len(samples) < _MIN_SAMPLES:
+            return None
+        return _percentile(sorted(s[0] for s in samples), pct)
+
+    def snapshot(self, category: str, provider: str) -> Dict[str, Any]:
+        self._ensure_loaded(category)
+        with self._lock:
+            samples = list(self._samples.get(category, {}).get(provider, ()))
+        return _summarise(samples)
+
+    def category_snapshot(self, category: str) -> Dict[str, Dict[str, Any]]:
+        self._ensure_loaded(category)
+        with self._lock:
+            providers = list(self._samples.get(category, {}))
+        return {p: self.snapshot(category, p) for p in providers}
+
+    def flush(self) -> None:
+        """Persist every category now (e.g. at the end of a batch)."""
+        with self._lock:
+            payloads = {c: self._serialise(c) for c in self._samples}
+            for c in payloads:
+                self._last_flush[c] = time.time()
+        for category, payload in payloads.items():
+            self._redis_save(category, payload)
+
+    # ── Persistence ───────────────────────────────────────────────────────────
+
+    def _ensure_loaded(self, category: str) -> None:
+        with self._lock:
+            if category in self._loaded:
+                return
+            self._loaded.add(category)
+        stored = self._redis_load(category)
+        if not isinstance(stored, dict):
+            return
+        with self._lock:
+            bucket = self._samples.setdefault(category, {})
+            for provider, rows in stored.items():
+                window = bucket.setdefault(provider, deque(maxlen=self._window))
+                persisted = [
+                    (float(r[0]), str(r[1])) for r in rows
+                    if isinstance(r, (list, tuple)) and len(r) == 2
+                ]
+                # Persisted samples are older than anything recorded in-process
+                for sample in reversed(persisted[-self._window:]):
+                    if len(window) < self._window:
+                        window.appendleft(sample)
+
+    def _serialise(self, category: str) -> Dict[str, List[List[Any]]]:
+        return {
+            provider: [list(s) for s in window]
+            for provider, window in self._samples.get(category, {}).items()
+        }
+
+    @staticmethod
+    def _redis_load(category: str) -> Optional[Any]:
+        try:
+            from storage.redis_client import RK, get_redis
+            return get_redis().get_json(RK.cascade_stats(category))
+        except Exception as exc:
+            logger.debug("provider_stats_load_failed", category=category, error=str(exc)[:80])
+            return None
+
+    @staticmethod
+    def _redis_save(category: str, payload: Dict[str, List[List[Any]]]) -> None:
+        try:
+            from storage.redis_client import RK, get_redis
+            get_redis().set_with_ttl(RK.cascade_stats(category), payload, _TTL_SECONDS)
+        except Exception as exc:
+            logger.debug("provider_stats_save_failed", category=category, error=str(exc)[:80])
+
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, int(round(pct * (len(sorted_values) - 1)))))
+    return sorted_values[idx]
+
+
+def _summarise(samples: List[Sample]) -> Dict[str, Any]:
+    calls = len(samples)
+    if not calls:
+        return {
+            "calls": 0, "p50_seconds": 0.0, "p95_seconds": 0.0,
+            "success_rate": 0.0, "empty_rate": 0.0,
+        }
+    latencies = sorted(s[0] for s in samples)
+    successes = sum(1 for s in samples if s[1] == "success")
+    empties   = sum(1 for s in samples if s[1] == "empty")
+    return {
+        "calls":        calls,
+        "p50_seconds":  round(_percentile(latencies, 0.50), 3),
+        "p95_seconds":  round(_percentile(latencies, 0.95), 3),
+        "success_rate": round(successes / calls, 3),
+        "empty_rate":   round(empties / calls, 3),
+    }
+
+
+# ── Singleton ──────────────────────────────────────────────────────────────────
+
+_stats_instance: Optional[ProviderStatsStore] = None
+_stats_lock = threading.Lock()
+
+
+def get_provider_stats() -> ProviderStatsStore:
+    global _stats_instance
+    with _stats_lock:
+        if _stats_instance is None:
+            _stats_instance = ProviderStatsStore()
+        return _stats_instance
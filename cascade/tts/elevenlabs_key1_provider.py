@@ -202,15 +202,50 @@ class ElevenLabsBaseProvider(BaseProvider):
 
         char_count = len(text)
 
+        # Claim the characters before calling the API so two workflows
+        # cannot both pass the quota check and overrun the key together.
+        reserved = self._reserve_chars(char_count)
+        if reserved is False:
+            return ProviderResult.failure(
+                self.provider_name,
+                f"Key {self._key_index} has fewer than {char_count} characters "
+                f"left this month.",
+                retriable=False,
+            )
+
         try:
-            return self._call_with_timestamps(
+            result = self._call_with_timestamps(
                 text=text,
                 voice_id=voice_id,
                 model_id=model_id,
                 char_count=char_count,
             )
         except Exception as exc:
-            return self._classify_and_fail(exc, voice_id)
+            result = self._classify_and_fail(exc, voice_id)
+
+        self._settle_chars(char_count, reserved, result.success)
+        return result
+
+    def _reserve_chars(self, char_count: int) -> Optional[bool]:
+        """True = reserved, False = key cannot fit it, None = Redis unavailable."""
+        try:
+            from storage.redis_client import get_redis
+            key = get_redis().reserve_tts_chars(
+                char_count, key_indexes=(self._key_index,), monthly_limit=_MONTHLY_CHAR_LIMIT,
+            )
+            return key is not None
+        except Exception:
+            return None   # proceed optimistically, record after the call
+
+    def _settle_chars(self, char_count: int, reserved: Optional[bool], success: bool) -> None:
+        try:
+            from storage.redis_client import get_redis
+            if reserved is None and success:
+                get_redis().add_tts_chars_used(self._key_index, char_count)
+            elif reserved and not success:
+                get_redis().release_tts_chars(self._key_index, char_count)
+        except Exception:
+            pass
 
     def _resolve_accessible_voice_id(self, preferred_voice_id: str, gender: str) -> str:
         """
@@ -417,14 +452,7 @@ class ElevenLabsBaseProvider(BaseProvider):
         voice_id: str,
         char_count: int,
     ) -> ProviderResult:
-        """Build a successful ProviderResult and record quota usage."""
-        # Record quota usage in Redis (non-blocking)
-        try:
-            from storage.redis_client import get_redis
-            get_redis().add_tts_chars_used(self._key_index, char_count)
-        except Exception:
-            pass
-
+        """Build a successful ProviderResult (quota is settled by execute())."""
         data: Dict[str, Any] = {
             "audio_bytes": audio_bytes,
             "alignment": alignment,
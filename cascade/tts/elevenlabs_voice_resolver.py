@@ -38,6 +38,8 @@ from typing import Dict, List, Optional
 import requests
 import structlog
 
+from cascade.http_pool import http_session
+
 logger = structlog.get_logger(__name__)
 
 _VOICES_URL = "https://api.elevenlabs.io/v1/voices"
@@ -135,7 +137,7 @@ class ElevenLabsVoiceResolver:
 
     def _fetch_from_api(self, api_key: str) -> Optional[Dict[str, Dict]]:
         try:
-            resp = requests.get(
+            resp = http_session().get(
                 _VOICES_URL, headers={"xi-api-key": api_key}, timeout=_REQUEST_TIMEOUT
             )
         except requests.RequestException as exc:
@@ -38,7 +38,7 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import structlog
 
@@ -52,8 +52,8 @@ from cascade.tts.openai_tts_provider import OpenAITTSProvider
 
 logger = structlog.get_logger(__name__)
 
-# Shared circuit breaker so failures carry across multiple calls in the same run
-_SHARED_BREAKER = CircuitBreaker(failure_threshold=3, reset_timeout_seconds=300)
+# Shared circuit breaker so failures carry across calls and (via Redis) across runs
+_SHARED_BREAKER = CircuitBreaker(failure_threshold=3, reset_timeout_seconds=300, namespace="tts")
 
 # ── Voice ID secret names ─────────────────────────────────────────────────────
 _FEMALE_VOICE_ENVS: List[str] = [
@@ -149,8 +149,14 @@ class TTSCascade:
         if gender not in ("female", "male"):
             gender = "female"
 
-        # Resolve the ElevenLabs voice_id to pass to providers
-        el_voice_id = voice_id_override or self._select_elevenlabs_voice(gender)
+        # Resolve the ElevenLabs voice_id to pass to providers.  A rotation
+        # pick is recorded in Redis as part of the selection itself, and
+        # taken back below if synthesis fails.
+        if voice_id_override:
+            el_voice_id, assignment = voice_id_override, None
+        else:
+            el_voice_id, assignment = self._select_elevenlabs_voice(gender)
+        recorded = assignment is not None
         # Resolve the edge-tts voice name (used only by EdgeTTSProvider)
         edge_voice = self._select_edge_voice(gender)
 
@@ -162,6 +168,7 @@ class TTSCascade:
             category="tts",
             max_retries_per_provider=2,
             circuit_breaker=_SHARED_BREAKER,
+            adaptive=False,   # order encodes voice quality and remaining quota
         )
 
         result: ProviderResult = manager.execute(
@@ -172,6 +179,8 @@ class TTSCascade:
         )
 
         if not result.success:
+            if assignment is not None:
+                self._undo_voice_assignment(assignment)
             raise RuntimeError(
                 f"TTS cascade exhausted for all providers. "
                 f"Error: {result.error}"
@@ -180,7 +189,11 @@ class TTSCascade:
         # ── Post-success: update rotation state ───────────────────────────────
         used_provider = result.provider_used
         actual_voice_id = result.data.get("voice_id", el_voice_id)
-        self._update_rotation_state(gender=gender, voice_id=actual_voice_id)
+        if not recorded:
+            self._update_rotation_state(gender=gender, voice_id=actual_voice_id)
+        elif actual_voice_id != el_voice_id:
+            # Assignment already counted the gender; only correct the voice
+            self._update_rotation_state(gender=None, voice_id=actual_voice_id)
 
         logger.info(
             "tts_cascade_success",
@@ -204,16 +217,20 @@ class TTSCascade:
     # Voice selection
     # ═════════════════════════════════════════════════════════════════════════
 
-    def _select_elevenlabs_voice(self, gender: str) -> str:
+    def _select_elevenlabs_voice(self, gender: str) -> Tuple[str, Optional[Dict[str, Any]]]:
         """
         Select the ElevenLabs voice_id for the requested gender, respecting
         the consecutive-use limits stored in Redis.
 
         Logic:
           - Load all available voice IDs for the gender from environment.
-          - Read Redis rotation state.
-          - If the current voice has been used consecutively >= limit, rotate.
-          - Otherwise return the primary voice.
+          - In one atomic Redis call (RedisClient.assign_voice): if the
+            current voice has been used consecutively >= limit, rotate;
+            otherwise keep it.  The pick is recorded in the same call.
+          - If Redis is unavailable, return the primary voice.
+
+        Returns (voice_id, assignment).  assignment is the undo token from
+        assign_voice(), or None when nothing was recorded.
         """
         voice_ids = self._get_elevenlabs_voice_ids(gender)
         if not voice_ids:
@@ -222,41 +239,24 @@ class TTSCascade:
                 gender=gender,
                 hint="Set ELEVENLABS_VOICE_ID_FEMALE / ELEVENLABS_VOICE_ID_MALE in secrets.",
             )
-            return ""
+            return "", None
 
         # Check rotation limits (non-blocking — if Redis fails use primary voice)
+        # Load configured limit (default: rotate after 3 consecutive uses)
         try:
-            from storage.redis_client import get_redis
-            state = get_redis().get_voice_state()
-            last_id = state.get("last_voice_id", "")
-            consecutive_voice_uses = state.get("voice_id_consecutive", 0)
-
-            # Load configured limit (default: rotate after 3 consecutive uses)
-            try:
-                from storage.supabase_client import get_db
-                rule = get_db().get_rule("voice_consecutive_limit")
-                max_consecutive = int(
-                    (rule or {}).get("max_same_voice_id_consecutive", 3)
-                )
-            except Exception:
-                max_consecutive = 3
-
-            if consecutive_voice_uses >= max_consecutive and len(voice_ids) > 1:
-                # Rotate to the next available voice
-                try:
-                    idx = voice_ids.index(last_id)
-                    return voice_ids[(idx + 1) % len(voice_ids)]
-                except ValueError:
-                    return voice_ids[0]
-
-            # Keep using the same voice if it matches gender
-            if last_id in voice_ids:
-                return last_id
-
+            from storage.supabase_client import get_db
+            rule = get_db().get_rule("voice_consecutive_limit")
+            max_consecutive = int(
+                (rule or {}).get("max_same_voice_id_consecutive", 3)
+            )
         except Exception:
-            pass  # Redis unavailable — use primary voice
+            max_consecutive = 3
 
-        return voice_ids[0]
+        try:
+            from storage.redis_client import get_redis
+            return get_redis().assign_voice(gender, voice_ids, max_consecutive)
+        except Exception:
+            return voice_ids[0], None  # Redis unavailable — use primary voice
 
     @staticmethod
     def _get_elevenlabs_voice_ids(gender: str) -> List[str]:
@@ -285,11 +285,7 @@ class TTSCascade:
         try:
             from storage.redis_client import get_redis
             redis = get_redis()
-            key_remaining = {
-                1: 100_000 - redis.get_tts_chars_used(1),
-                2: 100_000 - redis.get_tts_chars_used(2),
-                3: 100_000 - redis.get_tts_chars_used(3),
-            }
+            key_remaining = {k: 100_000 - used for k, used in redis.get_tts_usage().items()}
             provider_map = {
                 1: self._key1,
                 2: self._key2,
@@ -315,7 +311,7 @@ class TTSCascade:
     # ═════════════════════════════════════════════════════════════════════════
 
     @staticmethod
-    def _update_rotation_state(gender: str, voice_id: str) -> None:
+    def _update_rotation_state(gender: Optional[str], voice_id: str) -> None:
         """Update Redis voice rotation state after a successful synthesis."""
         try:
             from storage.redis_client import get_redis
@@ -323,6 +319,16 @@ class TTSCascade:
         except Exception:
             pass  # Non-critical — pipeline continues regardless
 
+    @staticmethod
+    def _undo_voice_assignment(assignment: Dict[str, Any]) -> None:
+        """Take back a rotation pick whose synthesis failed."""
+        try:
+            from storage.redis_client import get_redis
+            undone = get_redis().unassign_voice(assignment)
+            logger.info("tts_voice_assignment_undone", restored=undone)
+        except Exception:
+            pass
+
     # ═════════════════════════════════════════════════════════════════════════
     # Diagnostics
     # ═════════════════════════════════════════════════════════════════════════
@@ -333,8 +339,8 @@ class TTSCascade:
             from storage.redis_client import get_redis
             redis = get_redis()
             quota = {
-                f"key{i}_chars_used": redis.get_tts_chars_used(i)
-                for i in [1, 2, 3]
+                f"key{i}_chars_used": used
+                for i, used in redis.get_tts_usage().items()
             }
             voice_state = redis.get_voice_state()
         except Exception:
@@ -51,7 +51,7 @@ class GrowthManager:
         if best_cat == worst_cat:
             return None
 
-        current = self._db.get_rule("category_allocation")
+        current = self._db.get_rule("category_allocation", fresh=True)
         if not isinstance(current, dict) or not current:
             logger.warning("growth_manager_category_allocation_rule_missing")
             return None
@@ -89,7 +89,7 @@ class GrowthManager:
             )
             return None
 
-        current = self._db.get_rule("voice_split")
+        current = self._db.get_rule("voice_split", fresh=True)
         if not isinstance(current, dict) or not current:
             logger.warning("growth_manager_voice_split_rule_missing")
             return None
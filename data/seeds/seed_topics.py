@@ -368,7 +368,9 @@ Rules:
 - All numeric scores are integers 0-100."""
 
     try:
-        data = llm.generate_json(prompt=prompt, system_prompt=_SYSTEM, max_tokens=3000)
+        # Never cached: a batch that adds nothing leaves the prompt unchanged,
+        # and a cached answer would then repeat until the batch budget runs out
+        data = llm.generate_json(prompt=prompt, system_prompt=_SYSTEM, max_tokens=3000, cache=False)
         topics = data.get("topics", [])
         return [t for t in topics if isinstance(t, dict) and t.get("name")]
     except Exception as exc:
@@ -0,0 +1,200 @@
+"""
+engines/asset_library.py
+
+Reusable library of approved, visually verified footage.
+
+Every clip that passes visual verification with a strong score and ends up
+in an approved video is copied to R2 under its content hash
+(R2Paths.library_asset) and its visual_assets row gets the r2_path.  On the
+next run MediaFetcher asks the library first: "a verified clip for these
+keywords, this orientation, this duration range".  A hit costs one indexed
+Supabase query plus one R2 download (or a local AssetCache hit).  It makes no
+provider API calls and needs no Gemini vision call, because the clip was
+verified when it entered the library.
+
+Lookup
+──────
+  keywords     Lower-cased words of the search query, minus stop words.
+  match        topic_tags && keywords (GIN index), r2_path set,
+               visual_match_score ≥ _MIN_LIBRARY_SCORE, no watermark.
+  rank         keyword overlap ↓, visual_match_score ↓, usage_count ↑
+               (least-used first, so recurring topics rotate their clips).
+
+Failures of any kind (Supabase, R2) degrade to a miss.  The footage
+cascade is always the fallback.
+"""
+from __future__ import annotations
+
+import os
+import re
+from typing import Callable, Dict, List, Optional
+
+import structlog
+
+from cascade.asset_cache import get_asset_cache
+from engines.video_assembler import MediaItem
+from storage.r2_client import R2Paths, get_r2
+from storage.supabase_client import get_db
+
+logger = structlog.get_logger(__name__)
+
+_MIN_LIBRARY_SCORE = 70     # vision confidence needed to enter / be served from the library
+_MAX_CANDIDATES    = 25
+_LIBRARY_TYPES     = frozenset({"video"})
+_STOP_WORDS = frozenset({
+    "the", "and", "for", "with", "from", "into", "onto", "over", "under",
+    "its", "their", "this", "that", "these", "those", "are", "was", "were",
+    "close", "closeup", "footage", "video", "shot", "view", "scene",
+})
+
+
+def query_keywords(text: str) -> List[str]:
+    """Distinct lower-case keywords of a search query, in order of appearance."""
+    seen: Dict[str, None] = {}
+    for word in re.findall(r"[a-z]+", (text or "").lower()):
+        if len(word) >= 3 and word not in _STOP_WORDS:
+            seen.setdefault(word, None)
+    return list(seen)
+
+
+class AssetLibrary:
+
+    def __init__(self) -> None:
+        self._db    = get_db()
+        self._r2    = get_r2()
+        self._cache = get_asset_cache()
+
+    # ── Lookup ────────────────────────────────────────────────────────────────
+
+    def lookup(
+        self,
+        query:        str,
+        download_dir: str,
+        orientation:  str,
+        index:        int,
+        min_duration: float = 3.0,
+        max_duration: float = 30.0,
+        claim:        Optional[Callable[[str], bool]] = None,
+    ) -> Optional[MediaItem]:
+        """
+        Return a library clip for `query` downloaded into download_dir, or
+        None on a miss.  claim(file_hash) lets the caller reject clips already
+        used elsewhere in the same video; it must return True to accept.
+        """
+        keywords = query_keywords(query)
+        if not keywords:
+            return None
+        try:
+            rows = self._db.find_library_assets(
+                keywords, asset_type="video",
+                min_score=_MIN_LIBRARY_SCORE, limit=_MAX_CANDIDATES,
+            )
+        except Exception as exc:
+            logger.debug("asset_library_query_failed", query=query[:40], error=str(exc)[:80])
+            return None
+
+        needed = min(2, len(keywords))
+        kw     = set(keywords)
+        ranked = sorted(
+            (
+                (len(kw.intersection(r.get("topic_tags") or [])), r)
+                for r in rows
+                if self._fits(r, orientation, min_duration, max_duration)
+            ),
+            key=lambda t: (
+                -t[0],
+                -(t[1].get("visual_match_score") or 0),
+                t[1].get("usage_count") or 0,
+            ),
+        )
+
+        for overlap, row in ranked:
+            if overlap < needed:
+                break
+            if claim is not None and not claim(row["file_hash"]):
+                continue
+            item = self._materialise(row, download_dir, index, query)
+            if item is not None:
+                logger.debug(
+                    "asset_library_hit", query=query[:40],
+                    asset_id=str(row.get("asset_id"))[:8], overlap=overlap,
+                )
+                return item
+        return None
+
+    # ── Persist ───────────────────────────────────────────────────────────────
+
+    def persist(self, item: MediaItem, file_hash: str) -> Optional[str]:
+        """
+        Copy an approved clip into the library if it qualifies.  Returns the
+        R2 key (existing or new), or None if the item is not library material.
+        """
+        if item.asset_type not in _LIBRARY_TYPES:
+            return None
+        if (item.visual_match_score or 0) < _MIN_LIBRARY_SCORE:
+            return None
+        ext = os.path.splitext(item.local_path)[1].lower() or ".mp4"
+        key = R2Paths.library_asset(file_hash, ext)
+        try:
+            if not self._r2.file_exists(key):
+                self._r2.upload_file(
+                    item.local_path, key, content_type="video/mp4",
+                    metadata={"provider": item.provider, "score": item.visual_match_score},
+                )
+        except Exception as exc:
+            logger.warning("asset_library_persist_failed", key=key, error=str(exc)[:120])
+            return None
+        return key
+
+    # ── Internal ──────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _fits(row: Dict, orientation: str, min_duration: float, max_duration: float) -> bool:
+        width, height = row.get("width") or 0, row.get("height") or 0
+        if width and height:
+            if orientation == "portrait" and width > height:
+                return False
+            if orientation == "landscape" and height > width:
+                return False
+        duration = row.get("duration_seconds")
+        if duration is not None and not (min_duration <= float(duration) <= max_duration):
+            return False
+        return True
+
+    def _materialise(
+        self, row: Dict, download_dir: str, index: int, query: str,
+    ) -> Optional[MediaItem]:
+        key       = row["r2_path"]
+        file_hash = row["file_hash"]
+        dest      = os.path.join(download_dir, f"library_{file_hash[:16]}{os.path.splitext(key)[1]}")
+
+        def download(tmp_path: str) -> int:
+            self._r2.download_file(key, tmp_path)
+            return os.path.getsize(tmp_path)
+
+        try:
+            size = self._cache.fetch("library", file_hash, "r2", dest, download)
+        except Exception as exc:
+            logger.warning("asset_library_download_failed", key=key, error=str(exc)[:120])
+            return None
+
+        return MediaItem(
+            local_path=dest, asset_type=row["asset_type"],
+            provider=row["source_provider"],
+            width=int(row.get("width") or 0), height=int(row.get("height") or 0),
+            segment_index=index, search_query=query,
+            duration_seconds=float(row["duration_seconds"]) if row.get("duration_seconds") is not None else None,
+            provider_source_id=row.get("source_id"),
+            file_size_bytes=size,
+            visual_match_score=row.get("visual_match_score"),
+            library_asset_id=row.get("asset_id"),
+        )
+
+
+_instance: Optional[AssetLibrary] = None
+
+def get_asset_library() -> AssetLibrary:
+    global _instance
+    if _instance is None:
+        _instance = AssetLibrary()
+    return _instance
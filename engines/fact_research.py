@@ -1,10 +1,21 @@
 """
 engines/fact_research.py
+
+Web search fans out: every generated query goes to Tavily at once on a
+shared pool, and results are de-duplicated by URL.  The whole search stage
+is bounded by deadline_seconds.  When it expires, whatever evidence has
+arrived is used, so latency tracks the slowest query rather than the sum.
+
+With race=True, SerpAPI is queried alongside Tavily instead of after it.
+The search returns as soon as _RACE_TARGET distinct results are in, which
+is the number of snippets fact extraction actually reads.
 """
 from __future__ import annotations
-import os, re
-from typing import Dict, List, Optional
-import requests, structlog
+import os, re, threading, time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+import structlog
+from cascade.http_pool import http_session
 from cascade.llm.llm_cascade import get_llm
 from storage.supabase_client import get_db
 
@@ -17,6 +28,15 @@ _APPROVED_DOMAINS = [
     "nasa.gov", "noaa.gov", "smithsonianmag.com", "bbcearth.com",
 ]
 _MIN_FACTS_THRESHOLD = 4
+_TAVILY_QUERIES          = 4
+_SERPAPI_QUERIES         = 1      # SerpAPI is metered per query; keep the fallback cheap
+_SEARCH_DEADLINE_SECONDS = 20.0
+_RACE_TARGET             = 8      # _extract_facts reads the first 8 snippets
+_SEARCH_WORKERS          = 8
+
+# (engine rank, query index, result rank, url, snippet) — sorts Tavily first,
+# then by query and result order, whatever order the responses arrived in.
+_Hit = Tuple[int, int, int, str, str]
 _EXTRACT_SYSTEM = (
     "You are a science fact extractor. "
     "Only state facts that are directly supported by the provided source text. "
@@ -88,11 +108,35 @@ def _normalize_fact_type(raw: Optional[str], fact_text: str = "") -> str:
     return "biology"
 
 
+def _url_key(url: str) -> str:
+    return url.split("#", 1)[0].rstrip("/").lower()
+
+
+_search_pool: Optional[ThreadPoolExecutor] = None
+_search_pool_lock = threading.Lock()
+
+
+def _pool() -> ThreadPoolExecutor:
+    # Shared and never shut down per call, so a query still running at the
+    # deadline is simply abandoned rather than waited for.
+    global _search_pool
+    with _search_pool_lock:
+        if _search_pool is None:
+            _search_pool = ThreadPoolExecutor(max_workers=_SEARCH_WORKERS, thread_name_prefix="fact_search")
+        return _search_pool
+
+
 class FactResearch:
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        deadline_seconds: float = _SEARCH_DEADLINE_SECONDS,
+        race: bool = False,
+    ) -> None:
         self._llm = get_llm()
         self._db  = get_db()
+        self._deadline_seconds = deadline_seconds
+        self._race = race
 
     def research(
         self,
@@ -144,57 +188,129 @@ class FactResearch:
         return [f"{topic_name} facts", f"{topic_name} biology record", f"{topic_name} science"]
 
     def _search(self, queries: List[str]) -> List[str]:
-        snippets = self._tavily_search(queries)
-        if not snippets:
-            snippets = self._serpapi_search(queries)
+        deadline = time.monotonic() + self._deadline_seconds
+        tavily  = self._tavily_jobs(queries)
+        serpapi = self._serpapi_jobs(queries)
+
+        if self._race:
+            hits = self._gather(tavily + serpapi, deadline, stop_at=_RACE_TARGET)
+        else:
+            hits = self._gather(tavily, deadline)
+            if not hits and serpapi:
+                if time.monotonic() < deadline:
+                    hits = self._gather(serpapi, deadline)
+                else:
+                    # SerpAPI bills per query: never submit jobs whose results
+                    # would be discarded by an already-spent deadline
+                    logger.info("fact_search_fallback_skipped", reason="deadline_passed")
+
+        seen: set = set()
+        snippets: List[str] = []
+        for _, _, _, url, snippet in sorted(hits):
+            key = _url_key(url)
+            if key and key in seen:
+                continue
+            seen.add(key)
+            snippets.append(snippet)
+        logger.debug("fact_search_done", queries=len(queries), results=len(hits), unique=len(snippets))
         return snippets
 
-    def _tavily_search(self, queries: List[str]) -> List[str]:
+    def _gather(self, jobs: List, deadline: float, stop_at: int = 0) -> List[_Hit]:
+        """
+        Run search jobs concurrently and collect their hits until all are
+        done, the deadline passes, or stop_at distinct URLs have arrived.
+        """
+        if not jobs or time.monotonic() >= deadline:
+            return []
+        pending = {_pool().submit(job) for job in jobs}
+        hits: List[_Hit] = []
+        urls: set = set()
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for fut in done:
+                for hit in self._result(fut):
+                    hits.append(hit)
+                    urls.add(_url_key(hit[3]))
+            if stop_at and len(urls) >= stop_at:
+                break
+        if pending:
+            for fut in pending:
+                fut.cancel()
+            logger.info("fact_search_cut_short", outstanding=len(pending), collected=len(hits))
+        return hits
+
+    @staticmethod
+    def _result(fut: Future) -> List[_Hit]:
+        try:
+            return fut.result()
+        except Exception as exc:
+            logger.debug("fact_search_job_failed", err=str(exc)[:60])
+            return []
+
+    def _tavily_jobs(self, queries: List[str]) -> List:
         api_key = os.getenv("TAVILY_API_KEY", "")
         if not api_key:
             return []
-        snippets: List[str] = []
-        for q in queries[:4]:
-            try:
-                resp = requests.post(
-                    _TAVILY_URL,
-                    json={
-                        "api_key": api_key,
-                        "query": q,
-                        "max_results": 3,
-                        "search_depth": "basic",
-                        "include_domains": _APPROVED_DOMAINS,
-                    },
-                    timeout=15,
-                )
-                if resp.status_code == 200:
-                    for r in resp.json().get("results", []):
-                        c = r.get("content", "")
-                        if len(c) > 60:
-                            snippets.append(f"[{r.get('url','')}] {c[:600]}")
-            except Exception as exc:
-                logger.debug("tavily_miss", q=q[:40], err=str(exc)[:60])
-        return snippets
+        return [
+            (lambda i=i, q=q: self._tavily_query(api_key, i, q))
+            for i, q in enumerate(queries[:_TAVILY_QUERIES])
+        ]
 
-    def _serpapi_search(self, queries: List[str]) -> List[str]:
+    def _serpapi_jobs(self, queries: List[str]) -> List:
         api_key = os.getenv("SERPAPI", "") or os.getenv("ZENSERP", "")
         if not api_key:
             return []
-        snippets: List[str] = []
+        return [
+            (lambda i=i, q=q: self._serpapi_query(api_key, i, q))
+            for i, q in enumerate(queries[:_SERPAPI_QUERIES])
+        ]
+
+    @staticmethod
+    def _tavily_query(api_key: str, index: int, q: str) -> List[_Hit]:
+        hits: List[_Hit] = []
         try:
-            resp = requests.get(
+            resp = http_session().post(
+                _TAVILY_URL,
+                json={
+                    "api_key": api_key,
+                    "query": q,
+                    "max_results": 3,
+                    "search_depth": "basic",
+                    "include_domains": _APPROVED_DOMAINS,
+                },
+                timeout=15,
+            )
+            if resp.status_code == 200:
+                for rank, r in enumerate(resp.json().get("results", [])):
+                    c = r.get("content", "")
+                    if len(c) > 60:
+                        url = r.get("url", "")
+                        hits.append((0, index, rank, url, f"[{url}] {c[:600]}"))
+        except Exception as exc:
+            logger.debug("tavily_miss", q=q[:40], err=str(exc)[:60])
+        return hits
+
+    @staticmethod
+    def _serpapi_query(api_key: str, index: int, q: str) -> List[_Hit]:
+        hits: List[_Hit] = []
+        try:
+            resp = http_session().get(
                 _SERPAPI_URL,
-                params={"q": queries[0], "api_key": api_key, "num": 5},
+                params={"q": q, "api_key": api_key, "num": 5},
                 timeout=15,
             )
             if resp.status_code == 200:
-                for r in resp.json().get("organic_results", []):
+                for rank, r in enumerate(resp.json().get("organic_results", [])):
                     snip = r.get("snippet", "")
                     if len(snip) > 40:
-                        snippets.append(f"[{r.get('link','')}] {snip}")
+                        url = r.get("link", "")
+                        hits.append((1, index, rank, url, f"[{url}] {snip}"))
         except Exception as exc:
             logger.debug("serpapi_miss", err=str(exc)[:60])
-        return snippets
+        return hits
 
     # ── Extraction ────────────────────────────────────────────────────────────
 
@@ -239,13 +355,20 @@ Return JSON: {{"facts":[{{"fact_text":"...","fact_type":"biology","curiosity_lev
     # ── Persistence ───────────────────────────────────────────────────────────
 
     def _persist(self, topic_id: str, facts: List[Dict]) -> None:
+        try:
+            source_ids = self._db.resolve_source_ids(
+                [f.get("source_name", "general_knowledge") for f in facts if f.get("fact_text")]
+            )
+        except Exception as exc:
+            logger.warning("source_resolve_failed", err=str(exc)[:100])
+            source_ids = {}
         rows = []
         for f in facts:
             fact_text = f.get("fact_text")
             if not fact_text:
                 continue
             src_name = f.get("source_name", "general_knowledge")
-            src = self._db.get_source_by_name(src_name)
+            src_id = source_ids.get(str(src_name).strip())
             raw_type = f.get("fact_type", "biology")
             normalized_type = _normalize_fact_type(raw_type, fact_text)
             if normalized_type != str(raw_type or "").strip().lower():
@@ -262,8 +385,8 @@ Return JSON: {{"facts":[{{"fact_text":"...","fact_type":"biology","curiosity_lev
                 "evergreen_score": 90,
                 "viral_potential": int(f.get("curiosity_level", 50)),
                 "confidence_score":int(f.get("confidence_score", 70)),
-                "source_ids":      [src["source_id"]] if src else [],
-                "source_count":    1 if src else 0,
+                "source_ids":      [src_id] if src_id else [],
+                "source_count":    1 if src_id else 0,
                 "is_verified":     int(f.get("confidence_score", 0)) >= 75,
                 "status":          "verified" if int(f.get("confidence_score", 0)) >= 75 else "new",
             })
@@ -24,10 +24,12 @@ class ImageProcessor:
         width:  int = 1920,
         height: int = 1080,
         fps:    int = 25,
+        threads: Optional[int] = None,
     ) -> str:
         """
         Convert a static image to an animated MP4 using a slow Ken Burns zoom.
         Output has no audio stream.  Raises RuntimeError on FFmpeg failure.
+        `threads` caps FFmpeg's worker threads (None = FFmpeg default).
         """
         duration = max(0.5, float(duration))
         frames   = max(1, int(duration * fps))
@@ -54,6 +56,7 @@ class ImageProcessor:
             "-c:v", "libx264", "-preset", "fast", "-crf", "23",
             "-pix_fmt", "yuv420p",
             "-an",
+            *self._thread_args(threads),
             output_path,
         ]
         self._run(cmd, timeout=180, context="image_to_video_clip")
@@ -89,6 +92,7 @@ class ImageProcessor:
         width:  int,
         height: int,
         fps:    int = 30,
+        threads: Optional[int] = None,
     ) -> str:
         """
         Scale, crop, and trim (or loop) a video clip to exact duration.
@@ -110,6 +114,7 @@ class ImageProcessor:
             "-c:v", "libx264", "-preset", "ultrafast", "-crf", "18",
             "-pix_fmt", "yuv420p",
             "-an",
+            *self._thread_args(threads),
             output_path,
         ]
         self._run(cmd, timeout=120, context="preprocess_video_clip")
@@ -122,6 +127,7 @@ class ImageProcessor:
         width:  int,
         height: int,
         fps:    int = 30,
+        threads: Optional[int] = None,
     ) -> str:
         """Generate a plain black MP4 clip — used when all media sources fail."""
         duration = max(0.1, float(duration))
@@ -134,6 +140,7 @@ class ImageProcessor:
             "-c:v", "libx264", "-preset", "ultrafast", "-crf", "18",
             "-pix_fmt", "yuv420p",
             "-an",
+            *self._thread_args(threads),
             output_path,
         ]
         self._run(cmd, timeout=30, context="generate_black_clip")
@@ -175,6 +182,10 @@ class ImageProcessor:
 
     # ── Internal ───────────────────────────────────────────────────────────────
 
+    @staticmethod
+    def _thread_args(threads: Optional[int]) -> list:
+        return ["-threads", str(threads)] if threads else []
+
     @staticmethod
     def _run(cmd: list, timeout: int, context: str) -> None:
         result = subprocess.run(cmd, capture_output=True, timeout=timeout)
@@ -1,17 +1,32 @@
 """
 engines/media_fetcher.py
+
+Segments are fetched concurrently on a bounded thread pool.  Each worker
+runs the full footage → image → AI image fallback for its own segment;
+per-provider limits are enforced inside CascadeManager (see
+BaseProvider.max_concurrency) and the shared circuit breakers are
+thread-safe, so a provider that dies mid-batch is skipped by every worker.
+
+Before any provider is asked, the segment is looked up in the asset library
+(engines/asset_library.py): verified clips from earlier approved videos are
+reused straight from R2, and each clip is used at most once per batch.
 """
 from __future__ import annotations
-import os, tempfile
-from typing import List, Optional
+import os, tempfile, threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
 import structlog
 from engines.video_assembler import MediaItem
 from cascade.footage.footage_cascade import get_footage
 from cascade.images.image_cascade import get_images
 from cascade.ai_images.ai_images_cascade import get_ai_images
+from cascade.asset_cache import get_asset_cache
+from engines.asset_library import get_asset_library
 
 logger = structlog.get_logger(__name__)
 
+_FETCH_WORKERS = 6   # segments in flight at once; 1 = sequential
+
 
 class MediaFetcher:
 
@@ -19,26 +34,43 @@ class MediaFetcher:
         self._footage    = get_footage()
         self._images     = get_images()
         self._ai_images  = get_ai_images()
+        self._library    = get_asset_library()
 
     def fetch_all_segments(
         self,
         segments:     List[dict],
         download_dir: str,
         video_type:   str = "short",
+        max_workers:  Optional[int] = None,
     ) -> List[Optional[MediaItem]]:
         """
         For each segment dict (keys: sentence, search_query) fetch one media item.
         Order: real footage → still image → AI-generated image → None (black frame).
+
+        Up to max_workers segments (default _FETCH_WORKERS) are fetched at once.
+        The returned list is always aligned with `segments`.
         """
         os.makedirs(download_dir, exist_ok=True)
         orientation = "portrait" if video_type == "short" else "landscape"
-        results: List[Optional[MediaItem]] = []
+        workers = max(1, min(max_workers or _FETCH_WORKERS, len(segments) or 1))
+        used: set = set()
+        used_lock = threading.Lock()
 
-        for i, seg in enumerate(segments):
+        def claim(file_hash: str) -> bool:
+            with used_lock:
+                if file_hash in used:
+                    return False
+                used.add(file_hash)
+                return True
+
+        def fetch(i: int) -> Optional[MediaItem]:
+            seg      = segments[i]
             query    = (seg.get("search_query") or seg.get("sentence", "nature")).strip()
             sentence = seg.get("sentence", query)
-            item     = self._fetch_one(query, sentence, i, download_dir, orientation)
-            results.append(item)
+            # Each segment downloads into its own directory so two workers that
+            # pick the same provider clip never write the same file at once.
+            seg_dir  = os.path.join(download_dir, f"seg_{i:03d}") if workers > 1 else download_dir
+            item     = self._fetch_one(query, sentence, i, seg_dir, orientation, claim)
             logger.debug(
                 "segment_media_result",
                 index=i,
@@ -46,10 +78,20 @@ class MediaFetcher:
                 found=item is not None,
                 provider=item.provider if item else "none",
             )
+            return item
+
+        if workers == 1:
+            results = [fetch(i) for i in range(len(segments))]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="media") as pool:
+                results = list(pool.map(fetch, range(len(segments))))
 
         found = sum(1 for r in results if r is not None)
-        logger.info("media_fetched_all", total=len(segments), found=found,
-                    ai_count=sum(1 for r in results if r and r.provider.startswith(("ai_","getimg","stability","dezgo","horde"))))
+        cache = get_asset_cache().get_stats()
+        logger.info("media_fetched_all", total=len(segments), found=found, workers=workers,
+                    library_hits=sum(1 for r in results if r and r.library_asset_id),
+                    ai_count=sum(1 for r in results if r and r.provider.startswith(("ai_","getimg","stability","dezgo","horde"))),
+                    cache_hits=cache["hits"], cache_bytes_saved=cache["bytes_saved"])
         return results
 
     def _fetch_one(
@@ -59,8 +101,17 @@ class MediaFetcher:
         index:       int,
         download_dir:str,
         orientation: str,
+        claim:       Optional[Callable[[str], bool]] = None,
     ) -> Optional[MediaItem]:
 
+        # ── 0. Asset library (previously verified clips in R2) ────────────────
+        item = self._library.lookup(
+            query, download_dir, orientation, index,
+            min_duration=3.0, max_duration=30.0, claim=claim,
+        )
+        if item is not None:
+            return item
+
         # ── 1. Real footage (video clip) ──────────────────────────────────────
         try:
             f = self._footage.search_and_download(
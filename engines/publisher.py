@@ -2,15 +2,15 @@
 engines/publisher.py
 """
 from __future__ import annotations
-import os, tempfile
+import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Union
 import structlog
 
 from storage.supabase_client import get_db
 from storage.redis_client import get_redis
-from storage.r2_client import get_r2
+from storage.r2_client import R2RangeReader, get_r2
 from storage.cleanup_manager import CleanupManager
 from youtube.upload.upload_client import get_upload_client
 from youtube.upload.upload_scheduler import get_upload_scheduler
@@ -43,7 +43,8 @@ class Publisher:
 
         If local_video_path is not provided (or no longer exists — production
         and publishing typically run in separate workflow executions), the
-        final video is downloaded from R2 using final_video_r2_path.
+        final video is streamed from R2 (final_video_r2_path) into the upload
+        with parallel ranged reads, without a local copy.
         """
         job = self._db.get_video_job(queue_id)
         if not job:
@@ -55,33 +56,25 @@ class Publisher:
                               f"'{job.get('status')}', expected 'approved'."
             )
 
-        downloaded_temp: Optional[str] = None
-        if local_video_path is None or not os.path.exists(local_video_path):
-            final_r2_key = job.get("final_video_r2_path")
-            if not final_r2_key:
-                return PublishResult(False, error="Queue job has no final_video_r2_path to publish.")
+        if local_video_path is not None and os.path.exists(local_video_path):
+            return self._do_publish(queue_id, job, local_video_path)
 
-            fd, downloaded_temp = tempfile.mkstemp(suffix=".mp4", prefix=f"yta_pub_{queue_id[:8]}_")
-            os.close(fd)
-            try:
-                self._r2.download_file(final_r2_key, downloaded_temp)
-            except Exception as exc:
-                os.unlink(downloaded_temp)
-                return PublishResult(False, error=f"Failed to download final video from R2: {exc}")
-            local_video_path = downloaded_temp
+        final_r2_key = job.get("final_video_r2_path")
+        if not final_r2_key:
+            return PublishResult(False, error="Queue job has no final_video_r2_path to publish.")
 
+        # Stream the final video from R2 straight into the YouTube upload:
+        # ranged reads feed the upload chunks, no temp file is written.
         try:
-            return self._do_publish(queue_id, job, local_video_path)
-        finally:
-            if downloaded_temp:
-                try:
-                    os.unlink(downloaded_temp)
-                except OSError:
-                    pass
+            reader = self._r2.open_reader(final_r2_key)
+        except Exception as exc:
+            return PublishResult(False, error=f"Failed to open final video in R2: {exc}")
+        with reader:
+            return self._do_publish(queue_id, job, reader)
 
     # ── Internal ──────────────────────────────────────────────────────────────
 
-    def _do_publish(self, queue_id: str, job: dict, local_video_path: str) -> PublishResult:
+    def _do_publish(self, queue_id: str, job: dict, video: Union[str, R2RangeReader]) -> PublishResult:
         video_type  = job["video_type"]
         title       = job.get("title") or "Untitled"
         description = job.get("description") or ""
@@ -101,13 +94,14 @@ class Publisher:
         privacy        = "public" if publish_now else "private"
 
         result = self._upload.upload_video(
-            file_path=local_video_path,
+            file_path=video,
             title=title,
             description=description,
             tags=tags,
             privacy_status=privacy,
             publish_at=publish_at_iso,
             is_short=(video_type == "short"),
+            upload_id=queue_id,
         )
 
         if not result.success:
@@ -86,7 +86,7 @@ Rules:
 
         try:
             script = self._llm.generate_json(
-                prompt=prompt, system_prompt=_SYSTEM, max_tokens=1800
+                prompt=prompt, system_prompt=_SYSTEM, max_tokens=1800, cache=False
             )
         except RuntimeError as exc:
             logger.error("script_llm_failed", topic=topic_name, error=str(exc))
@@ -8,11 +8,17 @@ Pipeline
 ────────
   1. Probe audio duration via ffprobe
   2. Distribute that duration across N segments (alignment-aware when available)
-  3. Pre-process every media item (scale+crop+trim/loop for video; Ken Burns for images)
-  4. Concatenate with the concat demuxer
-  5. Mix narration + optional music (music at 12 % volume)
-  6. Burn subtitles and encode the final deliverable
-  7. Clean up all temp files
+  3. Single pass (default): one filter_complex graph covering every segment's
+     trim/loop/scale/zoompan, the concat, the audio mix and the subtitle
+     burn-in, encoded exactly once with no intermediate files.
+  4. If the single-pass graph fails, fall back to the multi-pass path:
+     a. Pre-process every media item (scale+crop+trim/loop for video; Ken
+        Burns for images), several FFmpeg jobs at once sized from CPU count
+        and free memory
+     b. Concatenate with the concat demuxer
+     c. Mix narration + optional music (music at 12 % volume)
+     d. Burn subtitles and encode the final deliverable
+  5. Clean up all temp files
 """
 from __future__ import annotations
 
@@ -21,9 +27,10 @@ import os
 import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import structlog
 
@@ -44,6 +51,15 @@ _SUB_STYLE_LONG = (
     "Alignment=2,MarginV=30"
 )
 _MUSIC_VOLUME = 0.12
+_OUTPUT_FPS   = 30
+_SINGLE_PASS  = True   # False forces the legacy segment-encode + concat path
+
+# Segment encode pool (multi-pass path).  Each concurrent FFmpeg job is
+# budgeted this much RAM — zoompan at 2× output resolution is the worst case.
+_SEGMENT_JOB_MEM_MB = 512
+_MAX_SEGMENT_JOBS   = 8
+# Relative cost per second of output, used to start the heaviest jobs first.
+_SEGMENT_COST = {"image": 4.0, "video": 1.0, "black": 0.1}
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -63,6 +79,8 @@ class MediaItem:
     duration_seconds:   Optional[float] = None  # available for video clips only
     provider_source_id: Optional[str]   = None  # original ID from the provider API
     file_size_bytes:    Optional[int]   = None  # populated after download
+    visual_match_score: Optional[int]   = None  # set by VisualVerifier on pass
+    library_asset_id:   Optional[str]   = None  # set when served from the asset library
 
 
 @dataclass
@@ -113,22 +131,55 @@ class VideoAssembler:
         seg_durs = self._calc_segment_durations(
             total_dur, n, job.alignment, job.script_segments
         )
+        seg_durs = [
+            seg_durs[i] if i < len(seg_durs) else (total_dur / n)
+            for i in range(len(job.media_items))
+        ]
+        Path(job.output_path).parent.mkdir(parents=True, exist_ok=True)
 
-        # Stage 3 – pre-process every media item
-        processed: List[str] = []
-        for i, item in enumerate(job.media_items):
-            dur = seg_durs[i] if i < len(seg_durs) else (total_dur / n)
-            out = os.path.join(temp_dir, f"seg_{i:04d}.mp4")
-            processed.append(
-                self._prepare_segment(item, dur, out, W, H)
-            )
+        # Stage 3 – single-pass graph, falling back to multi-pass on failure
+        mode = "multi_pass"
+        if _SINGLE_PASS and job.media_items:
+            try:
+                self._single_pass_encode(job, seg_durs, total_dur, W, H, sub_style)
+                mode = "single_pass"
+            except (RuntimeError, subprocess.TimeoutExpired) as exc:
+                logger.warning(
+                    "single_pass_assembly_failed_falling_back",
+                    queue_id=job.queue_id[:8],
+                    error=str(exc)[:300],
+                )
+        if mode == "multi_pass":
+            self._multi_pass_encode(job, seg_durs, total_dur, W, H, sub_style, temp_dir)
+
+        size = os.path.getsize(job.output_path)
+        logger.info(
+            "video_assembled",
+            queue_id=job.queue_id[:8],
+            video_type=job.video_type,
+            segments=n,
+            mode=mode,
+            duration=round(total_dur, 2),
+            size_mb=round(size / 1_048_576, 1),
+        )
+        return job.output_path
+
+    def _multi_pass_encode(
+        self,
+        job: VideoAssemblyJob,
+        seg_durs: List[float],
+        total_dur: float,
+        width: int,
+        height: int,
+        sub_style: str,
+        temp_dir: str,
+    ) -> None:
+        """Legacy path: encode each segment, concat, then re-encode the whole."""
+        processed = self._encode_segments(job.media_items, seg_durs, width, height, temp_dir)
 
-        # Stage 4 – concatenate
         concat_path = os.path.join(temp_dir, "concat.mp4")
         self._concat_clips(processed, concat_path)
 
-        # Stage 5 – final encode
-        Path(job.output_path).parent.mkdir(parents=True, exist_ok=True)
         self._final_encode(
             video_path=concat_path,
             audio_path=job.audio_path,
@@ -139,19 +190,153 @@ class VideoAssembler:
             total_dur=total_dur,
         )
 
-        size = os.path.getsize(job.output_path)
-        logger.info(
-            "video_assembled",
-            queue_id=job.queue_id[:8],
-            video_type=job.video_type,
-            segments=n,
-            duration=round(total_dur, 2),
-            size_mb=round(size / 1_048_576, 1),
+    # ── Single-pass graph ─────────────────────────────────────────────────────
+
+    def _single_pass_encode(
+        self,
+        job: VideoAssemblyJob,
+        seg_durs: List[float],
+        total_dur: float,
+        width: int,
+        height: int,
+        sub_style: str,
+    ) -> None:
+        """
+        Build one filter_complex graph for the whole video and encode once.
+        Every frame goes through libx264 a single time and no intermediate
+        clips touch the disk.
+        """
+        cmd = ["ffmpeg", "-y"]
+        chains: List[str] = []
+        labels: List[str] = []
+
+        for i, (item, dur) in enumerate(zip(job.media_items, seg_durs)):
+            in_args, chain = self._segment_graph(item, dur, width, height)
+            cmd += in_args
+            chains.append(f"[{i}:v]{chain}[v{i}]")
+            labels.append(f"[v{i}]")
+
+        n = len(labels)
+        chains.append(f"{''.join(labels)}concat=n={n}:v=1:a=0[vcat]")
+
+        has_subs = bool(job.subtitle_path and os.path.exists(job.subtitle_path))
+        if has_subs:
+            esc_path = job.subtitle_path.replace("\\", "/").replace(":", "\\:")
+            chains.append(f"[vcat]subtitles={esc_path}:force_style='{sub_style}'[vout]")
+            video_map = "[vout]"
+        else:
+            video_map = "[vcat]"
+
+        cmd += ["-i", job.audio_path]
+        narration = n
+        has_music = bool(job.music_path and os.path.exists(job.music_path))
+        if has_music:
+            cmd += ["-i", job.music_path]
+            chains.append(
+                f"[{n + 1}:a]volume={_MUSIC_VOLUME},"
+                f"atrim=duration={total_dur},"
+                f"asetpts=PTS-STARTPTS[bg];"
+                f"[{narration}:a][bg]amix=inputs=2:duration=first[outa]"
+            )
+            audio_map = "[outa]"
+        else:
+            audio_map = f"{narration}:a"
+
+        cmd += [
+            "-filter_complex", ";".join(chains),
+            "-map", video_map,
+            "-map", audio_map,
+            "-c:v", "libx264", "-preset", "fast", "-crf", "23",
+            "-c:a", "aac", "-b:a", "128k",
+            "-r", str(_OUTPUT_FPS), "-pix_fmt", "yuv420p",
+            "-movflags", "+faststart",
+            job.output_path,
+        ]
+        # One process now does all the work the per-segment encodes used to
+        # share, so scale the timeout with the programme length.
+        _ffmpeg(cmd, "single_pass_encode", timeout=max(300, int(total_dur * 4)))
+
+    @staticmethod
+    def _segment_graph(
+        item: Optional[MediaItem],
+        duration: float,
+        width: int,
+        height: int,
+    ) -> tuple:
+        """
+        Return (input_args, filter_chain) for one segment.  Mirrors the
+        per-clip filters in ImageProcessor (called with fps=_OUTPUT_FPS in the
+        fallback) so both paths render identically.
+        """
+        fps = _OUTPUT_FPS
+        dur = max(0.1, float(duration))
+        tail = f"setsar=1,format=yuv420p,trim=duration={dur},setpts=PTS-STARTPTS"
+
+        if item is None:
+            return (
+                ["-f", "lavfi", "-t", str(dur), "-i", f"color=c=black:s={width}x{height}:r={fps}"],
+                tail,
+            )
+
+        if item.asset_type == "image":
+            frames = max(1, int(dur * fps))
+            sw, sh = width * 2, height * 2
+            chain = (
+                f"scale={sw}:{sh}:force_original_aspect_ratio=increase,"
+                f"crop={sw}:{sh},"
+                f"zoompan="
+                f"z='min(zoom+0.0008,1.06)':"
+                f"x='iw/2-(iw/zoom/2)':"
+                f"y='ih/2-(ih/zoom/2)':"
+                f"d={frames}:s={width}x{height}:fps={fps},"
+                f"{tail}"
+            )
+            return ["-i", item.local_path], chain
+
+        chain = (
+            f"scale={width}:{height}:force_original_aspect_ratio=increase,"
+            f"crop={width}:{height},"
+            f"fps={fps},"
+            f"{tail}"
         )
-        return job.output_path
+        return ["-stream_loop", "-1", "-t", str(dur), "-i", item.local_path], chain
 
     # ── Segment preparation ───────────────────────────────────────────────────
 
+    def _encode_segments(
+        self,
+        items: List[Optional[MediaItem]],
+        seg_durs: List[float],
+        width: int,
+        height: int,
+        temp_dir: str,
+    ) -> List[str]:
+        """
+        Encode every segment clip, running several FFmpeg processes at once.
+        Jobs are submitted longest-estimated-first (zoompan images dominate)
+        so the pool never ends waiting on one big job started last.  Returns
+        clip paths in segment order; the first failure is re-raised.
+        """
+        outputs = [os.path.join(temp_dir, f"seg_{i:04d}.mp4") for i in range(len(items))]
+        workers, threads = _segment_pool_size()
+
+        def cost(i: int) -> float:
+            kind = "black" if items[i] is None else items[i].asset_type
+            return _SEGMENT_COST.get(kind, 1.0) * seg_durs[i]
+
+        order = sorted(range(len(items)), key=cost, reverse=True)
+        logger.debug("segment_pool", jobs=len(items), workers=workers, threads_per_job=threads)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="seg_enc") as pool:
+            futures = {
+                i: pool.submit(
+                    self._prepare_segment, items[i], seg_durs[i], outputs[i],
+                    width, height, threads,
+                )
+                for i in order
+            }
+            return [futures[i].result() for i in range(len(items))]
+
     def _prepare_segment(
         self,
         item: Optional[MediaItem],
@@ -159,16 +344,23 @@ class VideoAssembler:
         output_path: str,
         width: int,
         height: int,
+        threads: Optional[int] = None,
     ) -> str:
+        # fps=_OUTPUT_FPS everywhere: the Ken Burns zoom advances per frame,
+        # so it only matches the single-pass graph at the same frame rate
         if item is None:
-            return self._proc.generate_black_clip(duration, output_path, width, height)
+            return self._proc.generate_black_clip(
+                duration, output_path, width, height, fps=_OUTPUT_FPS, threads=threads
+            )
         if item.asset_type == "image":
             return self._proc.image_to_video_clip(
-                item.local_path, duration, output_path, width, height
+                item.local_path, duration, output_path, width, height,
+                fps=_OUTPUT_FPS, threads=threads,
             )
         # video
         return self._proc.preprocess_video_clip(
-            item.local_path, duration, output_path, width, height
+            item.local_path, duration, output_path, width, height,
+            fps=_OUTPUT_FPS, threads=threads,
         )
 
     # ── Concat ────────────────────────────────────────────────────────────────
@@ -315,6 +507,33 @@ class VideoAssembler:
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
+def _available_memory_mb() -> Optional[int]:
+    """MemAvailable from /proc/meminfo (Linux runners); None if unknown."""
+    try:
+        with open("/proc/meminfo") as fh:
+            for line in fh:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _segment_pool_size() -> Tuple[int, int]:
+    """
+    Return (concurrent FFmpeg jobs, -threads per job) for this machine.
+    Jobs are bounded by CPU count and by available RAM / _SEGMENT_JOB_MEM_MB;
+    the cores are then split evenly between the jobs.
+    """
+    cpus = os.cpu_count() or 1
+    jobs = min(cpus, _MAX_SEGMENT_JOBS)
+    mem_mb = _available_memory_mb()
+    if mem_mb is not None:
+        jobs = min(jobs, mem_mb // _SEGMENT_JOB_MEM_MB)
+    jobs = max(1, jobs)
+    return jobs, max(1, cpus // jobs)
+
+
 def _ffmpeg(cmd: List[str], context: str, timeout: int = 300) -> None:
     result = subprocess.run(cmd, capture_output=True, timeout=timeout)
     if result.returncode != 0:
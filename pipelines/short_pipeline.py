@@ -12,6 +12,7 @@ from typing import Optional
 import structlog
 
 from storage.supabase_client import get_db
+from storage.status_writer import get_status_writer
 from storage.redis_client import get_redis
 from storage.r2_client import R2Paths, get_r2
 
@@ -34,10 +35,13 @@ from protection.duplicate_guard import get_duplicate_guard
 from protection.visual_verifier import get_visual_verifier
 from protection.copyright_checker import get_copyright_checker
 
+from pipelines.stage_graph import StageGraph
+
 logger = structlog.get_logger(__name__)
 
 _MAX_TOPIC_ATTEMPTS    = 5
 _VISUAL_MIN_CONFIDENCE = 55
+_STAGE_WORKERS         = 4   # voice, media, music, metadata in flight together
 
 
 @dataclass
@@ -54,6 +58,7 @@ class ShortPipeline:
 
     def __init__(self) -> None:
         self._db            = get_db()
+        self._status        = get_status_writer()
         self._redis         = get_redis()
         self._r2            = get_r2()
 
@@ -124,25 +129,27 @@ class ShortPipeline:
             return self._run_stages(queue_id, topic, work_dir)
         except Exception as exc:
             logger.error("short_pipeline_exception", queue_id=queue_id[:8], error=str(exc)[:300])
+            self._flush_status(queue_id)
             self._db.log_job_error(queue_id, "pipeline", str(exc)[:500])
             return PipelineResult(False, queue_id=queue_id, status="failed", reason=str(exc)[:300], error=str(exc)[:400])
         finally:
+            self._flush_status(queue_id)
             shutil.rmtree(work_dir, ignore_errors=True)
 
     # ── Stage pipeline ────────────────────────────────────────────────────────
 
     def _run_stages(self, queue_id: str, topic: TopicSelection, work_dir: str) -> PipelineResult:
-        db = self._db
+        status = self._status
 
         # ── Research ─────────────────────────────────────────────────────────
-        db.update_video_status(queue_id, "researching")
+        status.update(queue_id, "researching")
         facts = self._facts.research(topic.topic_id, topic.topic_name, topic.category, count=10)
         facts = self._fact_verifier.verify_facts(facts, topic.topic_name)
         facts = self._fact_verifier.filter_usable(facts)
         facts = self._policy.filter_facts(facts)
 
         # ── Hook + Script ────────────────────────────────────────────────────
-        db.update_video_status(queue_id, "scripting")
+        status.update(queue_id, "scripting")
         hook_type = self._hooks.select_hook_type(topic.topic_dna, topic.category)
         hook = self._hooks.select_hook(hook_type, topic.topic_name)
 
@@ -157,7 +164,7 @@ class ShortPipeline:
 
         policy_check = self._policy.check_script_text(script["full_text"])
         if not policy_check.allowed:
-            db.update_video_status(queue_id, "rejected", extra={
+            status.update(queue_id, "rejected", extra={
                 "script": script,
                 "rejection_reason": f"policy:{policy_check.reason}",
             })
@@ -165,69 +172,82 @@ class ShortPipeline:
 
         dup = self._dup.check_full_text(script["full_text"])
         if dup.is_duplicate:
-            db.update_video_status(queue_id, "rejected", extra={
+            status.update(queue_id, "rejected", extra={
                 "script": script,
                 "rejection_reason": f"duplicate:{dup.reason}",
             })
             return PipelineResult(True, queue_id=queue_id, status="duplicate_retry", reason=dup.reason)
 
-        # ── Voice ────────────────────────────────────────────────────────────
-        db.update_video_status(queue_id, "voicing", extra={"script": script})
-        voice = self._voice.generate(
-            script_text=script["full_text"], queue_id=queue_id,
-            gender=self._pick_gender(), local_dir=work_dir,
-        )
-
-        # ── Media ────────────────────────────────────────────────────────────
-        db.update_video_status(queue_id, "fetching_media", extra={
-            "voice_gender":  voice.voice_gender,
-            "voice_id":      voice.voice_id,
-            "audio_r2_path": voice.r2_audio_path,
-        })
+        # ── Voice / Media / Music / Metadata (overlapped) ───────────────────
+        # Voice, media, music and metadata depend only on the script, so they
+        # run concurrently on a stage graph.  Status transitions below are
+        # still written from this thread in the original order.
+        status.update(queue_id, "voicing", extra={"script": script})
         media_dir = os.path.join(work_dir, "media")
-        media_items = self._media.fetch_all_segments(script["segments"], media_dir, video_type="short")
-        media_items = self._visual.verify_batch(
-            media_items, topic.topic_name, topic.category, min_confidence=_VISUAL_MIN_CONFIDENCE
-        )
-        media_items = self._refetch_missing(media_items, script["segments"], media_dir, topic, "short")
-
-        # ── Subtitles + Music ────────────────────────────────────────────────
-        srt_path = os.path.join(work_dir, "subtitles.srt")
-        self._subs.generate_srt(
-            alignment=voice.alignment, output_path=srt_path,
-            full_text=script["full_text"], audio_duration=voice.duration_seconds,
-        )
-        music = self._music.select_track(topic.category, download_dir=work_dir)
-
-        # ── Assembly ─────────────────────────────────────────────────────────
-        db.update_video_status(queue_id, "assembling")
-        final_path = os.path.join(work_dir, "final.mp4")
-        self._assembler.assemble(VideoAssemblyJob(
-            queue_id=queue_id, video_type="short",
-            audio_path=voice.local_audio_path,
-            media_items=media_items,
-            output_path=final_path,
-            subtitle_path=srt_path,
-            music_path=music.local_path,
-            alignment=voice.alignment,
-            script_segments=script["segments"],
-        ))
-
-        # ── Metadata ─────────────────────────────────────────────────────────
-        meta = self._meta.generate(
-            topic_name=topic.topic_name, category=topic.category,
-            script=script, facts=facts, video_type="short",
-        )
+        srt_path  = os.path.join(work_dir, "subtitles.srt")
+        gender    = self._pick_gender()
+
+        with StageGraph("short", max_workers=_STAGE_WORKERS) as graph:
+            graph.provide("script", script)
+            graph.add("voice", lambda script: self._voice.generate(
+                script_text=script["full_text"], queue_id=queue_id,
+                gender=gender, local_dir=work_dir,
+            ), inputs=("script",))
+            graph.add("raw_media", lambda script: self._media.fetch_all_segments(
+                script["segments"], media_dir, video_type="short",
+            ), inputs=("script",))
+            graph.add("media", lambda script, raw_media: self._verify_media(
+                raw_media, script["segments"], media_dir, topic, "short",
+            ), inputs=("script", "raw_media"))
+            graph.add("subtitles", lambda script, voice: self._subs.generate_srt(
+                alignment=voice.alignment, output_path=srt_path,
+                full_text=script["full_text"], audio_duration=voice.duration_seconds,
+            ), inputs=("script", "voice"))
+            graph.add("music", lambda: self._music.select_track(topic.category, download_dir=work_dir))
+            graph.add("meta", lambda script: self._meta.generate(
+                topic_name=topic.topic_name, category=topic.category,
+                script=script, facts=facts, video_type="short",
+            ), inputs=("script",))
+
+            # ── Media ────────────────────────────────────────────────────────
+            voice = graph.get("voice")
+            status.update(queue_id, "fetching_media", extra={
+                "voice_gender":  voice.voice_gender,
+                "voice_id":      voice.voice_id,
+                "audio_r2_path": voice.r2_audio_path,
+            })
+            media_items = graph.get("media")
+
+            # ── Subtitles + Music ────────────────────────────────────────────
+            graph.get("subtitles")
+            music = graph.get("music")
+
+            # ── Assembly (metadata keeps generating alongside) ───────────────
+            status.update(queue_id, "assembling")
+            final_path = os.path.join(work_dir, "final.mp4")
+            self._assembler.assemble(VideoAssemblyJob(
+                queue_id=queue_id, video_type="short",
+                audio_path=voice.local_audio_path,
+                media_items=media_items,
+                output_path=final_path,
+                subtitle_path=srt_path,
+                music_path=music.local_path,
+                alignment=voice.alignment,
+                script_segments=script["segments"],
+            ))
+
+            # ── Metadata ─────────────────────────────────────────────────────
+            meta = graph.get("meta")
 
         title_dup = self._dup.check_title(meta.title)
         if title_dup.is_duplicate:
-            db.update_video_status(queue_id, "rejected", extra={
+            status.update(queue_id, "rejected", extra={
                 "rejection_reason": f"duplicate_title:{title_dup.reason}",
             })
             return PipelineResult(True, queue_id=queue_id, status="duplicate_retry", reason=title_dup.reason)
 
         # ── Quality Gate ─────────────────────────────────────────────────────
-        db.update_video_status(queue_id, "quality_check")
+        status.update(queue_id, "quality_check")
         qscore = self._gate.score(QualityGateInput(
             queue_id=queue_id, topic_name=topic.topic_name, category=topic.category,
             curiosity_score=topic.curiosity_score, visual_availability=topic.visual_availability,
@@ -237,7 +257,7 @@ class ShortPipeline:
         ))
 
         if not qscore.passed:
-            db.update_video_status(queue_id, "rejected", extra={
+            status.update(queue_id, "rejected", extra={
                 "quality_score":    qscore.total,
                 "gate_scores":      qscore.gate_scores,
                 "rejection_reason": qscore.rejection_reason,
@@ -268,7 +288,7 @@ class ShortPipeline:
         self._hooks.register_usage(hook)
 
         # ── Approve ──────────────────────────────────────────────────────────
-        db.update_video_status(queue_id, "approved", extra={
+        status.update(queue_id, "approved", extra={
             "final_video_r2_path": final_r2_key,
             "subtitle_r2_path":    sub_r2_key,
             "title":               meta.title,
@@ -286,6 +306,14 @@ class ShortPipeline:
 
     # ── Helpers ───────────────────────────────────────────────────────────────
 
+    def _flush_status(self, queue_id: str) -> None:
+        # Buffered intermediate transitions must land before log_job_error
+        # reads the job row, and before the run moves on to another topic.
+        try:
+            self._status.flush(queue_id)
+        except Exception as exc:
+            logger.warning("job_status_flush_failed", queue_id=queue_id[:8], error=str(exc)[:120])
+
     def _pick_gender(self) -> str:
         try:
             rule = self._db.get_rule("voice_split")
@@ -306,6 +334,16 @@ class ShortPipeline:
                 return gender
         return "female"
 
+    def _verify_media(
+        self, media_items: list, segments: list, media_dir: str,
+        topic: TopicSelection, video_type: str,
+    ) -> list:
+        """Visual verification plus one broadened refetch pass for rejects."""
+        media_items = self._visual.verify_batch(
+            media_items, topic.topic_name, topic.category, min_confidence=_VISUAL_MIN_CONFIDENCE
+        )
+        return self._refetch_missing(media_items, segments, media_dir, topic, video_type)
+
     def _refetch_missing(
         self, media_items: list, segments: list, media_dir: str,
         topic: TopicSelection, video_type: str,
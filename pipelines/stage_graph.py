@@ -0,0 +1,180 @@
+"""
+pipelines/stage_graph.py
+
+Tiny dependency-graph executor used by the production pipelines to overlap
+stages that do not depend on each other (e.g. voice generation and media
+fetching both need only the script).
+
+Each stage declares the named values it consumes (`inputs`) and the single
+named value it produces (`output`, defaults to the stage name).  A stage is
+submitted to the worker pool the moment all of its inputs are available;
+the calling thread pulls values with get(), which blocks until ready and
+re-raises the producing stage's exception.
+
+Status transitions (VideoStatusWriter.update) deliberately stay on the
+calling thread between get() calls, so the dashboard observes exactly the
+same ordering as the old strictly-sequential pipeline — only the waits shrink.
+
+Usage
+─────
+    with StageGraph("short", max_workers=4) as g:
+        g.provide("script", script)
+        g.add("voice", lambda script: tts(script), inputs=("script",))
+        g.add("media", lambda script: fetch(script), inputs=("script",))
+        voice = g.get("voice")       # media keeps running in the background
+        media = g.get("media")
+
+Leaving the `with` block waits for every submitted stage to finish (so temp
+directories are not removed under a running stage) and cancels stages whose
+inputs never arrived.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class StageGraphError(RuntimeError):
+    """Raised for graph wiring mistakes (unknown or duplicate value names)."""
+
+
+@dataclass
+class Stage:
+    name:    str
+    fn:      Callable[..., Any]
+    inputs:  Tuple[str, ...] = ()
+    output:  Optional[str] = None
+
+    @property
+    def output_key(self) -> str:
+        return self.output or self.name
+
+
+class StageGraph:
+
+    def __init__(self, label: str, max_workers: int = 4) -> None:
+        self._label   = label
+        self._pool    = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"stage_{label}")
+        self._values: Dict[str, Future] = {}
+        self._lock    = threading.Lock()
+        self._timings: Dict[str, float] = {}
+
+    # ── Context management ────────────────────────────────────────────────────
+
+    def __enter__(self) -> "StageGraph":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Cancel stages that never started and wait for running ones."""
+        with self._lock:
+            pending = [f for f in self._values.values() if not f.done()]
+        for fut in pending:
+            fut.cancel()
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        if self._timings:
+            logger.debug("stage_graph_timings", graph=self._label, seconds=self._timings)
+
+    # ── Wiring ────────────────────────────────────────────────────────────────
+
+    def provide(self, key: str, value: Any) -> None:
+        """Seed a named value that stages can consume."""
+        self._slot(key, create=True).set_result(value)
+
+    def add(
+        self,
+        name:   str,
+        fn:     Callable[..., Any],
+        inputs: Tuple[str, ...] = (),
+        output: Optional[str] = None,
+    ) -> None:
+        """
+        Register a stage.  fn is called with one keyword argument per input
+        name.  Every input must already be provided or be the output of a
+        previously added stage.
+        """
+        stage = Stage(name=name, fn=fn, inputs=tuple(inputs), output=output)
+        with self._lock:
+            missing = [k for k in stage.inputs if k not in self._values]
+            if missing:
+                raise StageGraphError(
+                    f"Stage {name!r} in graph {self._label!r} depends on unknown value(s): {missing}"
+                )
+        out = self._slot(stage.output_key, create=True)
+        deps = [self._values[k] for k in stage.inputs]
+
+        if not deps:
+            self._submit(stage, out)
+            return
+
+        remaining = [len(deps)]
+        remaining_lock = threading.Lock()
+
+        def on_dep_done(_: Future) -> None:
+            with remaining_lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            failed = next((d for d in deps if d.cancelled() or d.exception() is not None), None)
+            if failed is not None:
+                if not out.done():
+                    if failed.cancelled():
+                        out.cancel()
+                    else:
+                        out.set_exception(failed.exception())
+                return
+            self._submit(stage, out)
+
+        for dep in deps:
+            dep.add_done_callback(on_dep_done)
+
+    # ── Retrieval ─────────────────────────────────────────────────────────────
+
+    def get(self, key: str, timeout: Optional[float] = None) -> Any:
+        """Block until `key` is available and return it (re-raises stage errors)."""
+        with self._lock:
+            fut = self._values.get(key)
+        if fut is None:
+            raise StageGraphError(f"Graph {self._label!r} has no value named {key!r}")
+        return fut.result(timeout=timeout)
+
+    # ── Internal ──────────────────────────────────────────────────────────────
+
+    def _slot(self, key: str, create: bool) -> Future:
+        with self._lock:
+            if create:
+                if key in self._values:
+                    raise StageGraphError(f"Value {key!r} already defined in graph {self._label!r}")
+                self._values[key] = Future()
+            return self._values[key]
+
+    def _submit(self, stage: Stage, out: Future) -> None:
+        if not out.set_running_or_notify_cancel():
+            return
+        kwargs = {k: self._values[k].result() for k in stage.inputs}
+
+        def run() -> None:
+            t0 = time.monotonic()
+            try:
+                result = stage.fn(**kwargs)
+            except BaseException as exc:
+                logger.warning("stage_failed", graph=self._label, stage=stage.name, error=str(exc)[:200])
+                out.set_exception(exc)
+            else:
+                out.set_result(result)
+            finally:
+                self._timings[stage.name] = round(time.monotonic() - t0, 2)
+
+        try:
+            self._pool.submit(run)
+        except RuntimeError as exc:   # pool already shut down
+            out.set_exception(exc)
@@ -7,6 +7,7 @@ from typing import Dict, List, Optional
 import structlog
 from storage.supabase_client import get_db
 from storage.r2_client import get_r2
+from engines.asset_library import get_asset_library, query_keywords
 
 logger = structlog.get_logger(__name__)
 
@@ -36,6 +37,7 @@ class CopyrightChecker:
     def __init__(self) -> None:
         self._db = get_db()
         self._r2 = get_r2()
+        self._library = get_asset_library()
 
     # ── Single item ───────────────────────────────────────────────────────────
 
@@ -78,11 +80,24 @@ class CopyrightChecker:
         Register every successfully-fetched media item in visual_assets.
         Returns the count of assets registered.  Failures on individual
         items are logged and skipped — never raises.
+
+        Strongly verified clips are also copied into the R2 asset library
+        (r2_path + visual_match_score) and tagged with their search-query
+        keywords so MediaFetcher can reuse them.  Items that came from the
+        library only have their usage counter bumped.
         """
         registered = 0
         for item in media_items:
             if item is None:
                 continue
+            library_id = getattr(item, "library_asset_id", None)
+            if library_id:
+                try:
+                    self._db.increment_asset_usage(library_id)
+                    registered += 1
+                except Exception as exc:
+                    logger.debug("asset_usage_skip", queue_id=queue_id[:8], error=str(exc)[:80])
+                continue
             try:
                 file_hash = self._r2.compute_file_hash(item.local_path)
             except Exception as exc:
@@ -90,13 +105,15 @@ class CopyrightChecker:
                 continue
 
             check = self.check_media_item(item)
+            query = getattr(item, "search_query", "") or ""
+            tags  = list(dict.fromkeys(list(topic_tags) + query_keywords(query)))
             asset_data = {
                 "file_hash":          file_hash,
                 "source_provider":    item.provider,
                 "source_id":          str(getattr(item, "provider_source_id", "") or "")[:255],
                 "asset_type":         item.asset_type,
-                "topic_tags":         topic_tags,
-                "search_query_used":  getattr(item, "search_query", "")[:500],
+                "topic_tags":         tags,
+                "search_query_used":  query[:500],
                 "width":              item.width,
                 "height":             item.height,
                 "duration_seconds":   getattr(item, "duration_seconds", None),
@@ -105,6 +122,13 @@ class CopyrightChecker:
                 "license_type":       check.license_type,
                 "has_watermark":      False,
             }
+            score = getattr(item, "visual_match_score", None)
+            if score is not None:
+                asset_data["visual_match_score"] = int(score)
+            if check.license_type != "generated":
+                r2_path = self._library.persist(item, file_hash)
+                if r2_path:
+                    asset_data["r2_path"] = r2_path
             try:
                 self._db.register_asset(asset_data)
                 registered += 1
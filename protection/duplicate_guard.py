@@ -1,12 +1,22 @@
 """
 protection/duplicate_guard.py
+
+Titles and scripts are looked up in a MinHash/LSH index that covers the
+whole published history (protection/near_duplicate_index.py).  The top
+candidates are then confirmed with SequenceMatcher against the same
+thresholds as before.  Titles are shingled by character trigrams, so
+inflected variants ("This Animal Never Sleeps" / "These Animals Never
+Sleep") land in the same buckets.  If the index is unavailable, the checks
+fall back to the last _RECENT_CHECK_COUNT titles and scripts.
 """
 from __future__ import annotations
+import time
 from dataclasses import dataclass
 from difflib import SequenceMatcher
-from typing import Optional
+from typing import Dict, List, Optional
 import structlog
-from storage.redis_client import get_redis
+from protection.near_duplicate_index import NearDuplicateIndex
+from storage.redis_client import RK, get_redis
 from storage.supabase_client import get_db
 
 logger = structlog.get_logger(__name__)
@@ -17,6 +27,12 @@ _RECENT_CHECK_COUNT = 40
 _RECENT_TEXTS_KEY   = "yta:dedup:recent_full_texts"
 _RECENT_TEXTS_MAX   = 40
 
+# LSH candidates are confirmed with SequenceMatcher, most similar first
+_CANDIDATES_TO_VERIFY = 5
+_TITLE_SHINGLE        = 3        # titles are short: character trigrams
+_TEXT_SHINGLE         = 3
+_BACKFILL_TITLES      = 5_000
+
 
 @dataclass
 class DuplicateCheckResult:
@@ -31,6 +47,9 @@ class DuplicateGuard:
     def __init__(self) -> None:
         self._redis = get_redis()
         self._db    = get_db()
+        self._titles  = NearDuplicateIndex("title", shingle_size=_TITLE_SHINGLE, unit="char")
+        self._scripts = NearDuplicateIndex("script", shingle_size=_TEXT_SHINGLE)
+        self._index_ready = False
 
     # ── Exact checks (Redis hash) ────────────────────────────────────────────
 
@@ -43,6 +62,15 @@ class DuplicateGuard:
         if self._redis.is_title_duplicate(title):
             return DuplicateCheckResult(True, "exact_title_match_within_60_days")
 
+        try:
+            self._ensure_index()
+            match = self._best_match(self._titles, title, _TITLE_SIMILARITY_THRESHOLD)
+            if match:
+                return DuplicateCheckResult(True, "title_too_similar_to_published", *match)
+            return DuplicateCheckResult(False)
+        except Exception as exc:
+            logger.debug("duplicate_title_index_skip", error=str(exc)[:80])
+
         try:
             recent = self._db.get_recent_published(limit=_RECENT_CHECK_COUNT)
             for r in recent:
@@ -59,9 +87,18 @@ class DuplicateGuard:
 
         return DuplicateCheckResult(False)
 
-    # ── Near-duplicate full-text check (Redis list of recent scripts) ────────
+    # ── Near-duplicate full-text check (LSH index, recent list as fallback) ──
 
     def check_full_text(self, full_text: str) -> DuplicateCheckResult:
+        try:
+            self._ensure_index()
+            match = self._best_match(self._scripts, full_text, _TEXT_SIMILARITY_THRESHOLD)
+            if match:
+                return DuplicateCheckResult(True, "script_too_similar_to_published", None, match[1])
+            return DuplicateCheckResult(False)
+        except Exception as exc:
+            logger.debug("duplicate_text_index_skip", error=str(exc)[:80])
+
         try:
             recents = self._redis.r.lrange(_RECENT_TEXTS_KEY, 0, _RECENT_TEXTS_MAX - 1)
             for other in recents:
@@ -105,6 +142,54 @@ class DuplicateGuard:
             pipe.execute()
         except Exception as exc:
             logger.debug("register_full_text_skip", error=str(exc)[:80])
+        try:
+            self._titles.add(title)
+            self._scripts.add(full_text)
+        except Exception as exc:
+            logger.debug("register_lsh_index_skip", error=str(exc)[:80])
+
+    # ── LSH index ─────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _best_match(index: NearDuplicateIndex, text: str, threshold: float):
+        """
+        (other_text, ratio) for the first LSH candidate whose SequenceMatcher
+        ratio reaches threshold, else None.
+        """
+        lowered = text.lower()
+        for cand in index.query(text, limit=_CANDIDATES_TO_VERIFY):
+            if not cand.text:
+                continue
+            ratio = SequenceMatcher(None, lowered, cand.text.lower()).ratio()
+            if ratio >= threshold:
+                return cand.text, round(ratio, 3)
+        return None
+
+    def _ensure_index(self) -> None:
+        """
+        Backfill the index once per deployment from published_log titles and
+        the recent-scripts list.  RK.DEDUP_LSH_READY marks a completed backfill.
+        """
+        if self._index_ready:
+            return
+        if self._redis.r.exists(RK.DEDUP_LSH_READY):
+            self._index_ready = True
+            return
+        self.rebuild_index()
+
+    def rebuild_index(self) -> Dict[str, int]:
+        titles: List[str] = [
+            r.get("title") or "" for r in self._db.get_recent_published(limit=_BACKFILL_TITLES)
+        ]
+        scripts: List[str] = self._redis.r.lrange(_RECENT_TEXTS_KEY, 0, _RECENT_TEXTS_MAX - 1)
+        counts = {
+            "titles":  self._titles.add_many([t for t in titles if t]),
+            "scripts": self._scripts.add_many(scripts),
+        }
+        self._redis.r.set(RK.DEDUP_LSH_READY, int(time.time()))
+        self._index_ready = True
+        logger.info("duplicate_index_backfilled", **counts)
+        return counts
 
 
 _instance: Optional[DuplicateGuard] = None
@@ -1,7 +1,14 @@
 """
 protection/fact_verifier.py
+
+Facts that need an LLM check are packed _BATCH_SIZE at a time into one
+structured verification prompt (LLMCascade.verify_fact_batch).  Up to
+_MAX_CONCURRENT_BATCHES batches run at once, so 18 long-form facts cost
+about three concurrent round trips instead of 18 serial ones.  Facts whose
+verdict is missing from a batch answer are re-checked one by one.
 """
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 import structlog
@@ -12,6 +19,15 @@ logger = structlog.get_logger(__name__)
 _MIN_CONFIDENCE = 65
 _HIGH_CONFIDENCE_SKIP = 85
 _MIN_SOURCES_FOR_SKIP = 2
+_BATCH_SIZE             = 6
+_MAX_CONCURRENT_BATCHES = 3   # on top of per-provider slots in CascadeManager
+
+# Same verdict verify_fact_consistency returns when the LLM cascade is down
+_OUTAGE_VERDICT = {
+    "plausible": True,
+    "confidence": 50,
+    "concern": "Fact verification LLM call failed — manual review recommended.",
+}
 
 
 @dataclass
@@ -29,15 +45,39 @@ class FactVerifier:
 
     # ── Public API ────────────────────────────────────────────────────────────
 
-    def verify_facts(self, facts: List[Dict], topic_name: str) -> List[Dict]:
+    def verify_facts(
+        self, facts: List[Dict], topic_name: str, batch_size: int = _BATCH_SIZE,
+    ) -> List[Dict]:
         """
         Return a new list of fact dicts annotated with:
             is_verified (bool), confidence_score (int, possibly adjusted),
             verification_concern (str, optional)
+
+        batch_size=1 restores one LLM call per fact.
         """
+        results: List[Optional[FactVerificationResult]] = [
+            self._skip_result(f) for f in facts
+        ]
+        pending = [i for i, r in enumerate(results) if r is None]
+        batches = [pending[i:i + max(1, batch_size)] for i in range(0, len(pending), max(1, batch_size))]
+
+        def run(batch: List[int]) -> None:
+            if len(batch) == 1:
+                results[batch[0]] = self._verify_one(facts[batch[0]], topic_name)
+                return
+            for i, r in zip(batch, self._verify_batch([facts[i] for i in batch], topic_name)):
+                results[i] = r
+
+        if len(batches) > 1:
+            workers = min(_MAX_CONCURRENT_BATCHES, len(batches))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fact_verify") as pool:
+                list(pool.map(run, batches))
+        else:
+            for batch in batches:
+                run(batch)
+
         verified: List[Dict] = []
-        for f in facts:
-            result = self._verify_one(f, topic_name)
+        for f, result in zip(facts, results):
             f2 = dict(f)
             f2["is_verified"]    = result.is_verified
             f2["confidence_score"] = result.confidence
@@ -46,7 +86,10 @@ class FactVerifier:
             verified.append(f2)
 
         n_ok = sum(1 for f in verified if f["is_verified"])
-        logger.info("facts_verified", topic=topic_name, total=len(verified), passed=n_ok)
+        logger.info(
+            "facts_verified", topic=topic_name, total=len(verified), passed=n_ok,
+            llm_checked=len(pending), batches=len(batches),
+        )
         return verified
 
     def filter_usable(self, facts: List[Dict]) -> List[Dict]:
@@ -58,32 +101,73 @@ class FactVerifier:
 
     # ── Internal ──────────────────────────────────────────────────────────────
 
-    def _verify_one(self, fact: Dict, topic_name: str) -> FactVerificationResult:
-        fact_text     = fact.get("fact_text", "")
+    @staticmethod
+    def _skip_result(fact: Dict) -> Optional[FactVerificationResult]:
+        """Already high-confidence multi-source facts skip the LLM call."""
         existing_conf = int(fact.get("confidence_score", 0))
         source_count  = int(fact.get("source_count", 0))
-
-        # Already high-confidence multi-source facts skip the LLM call
         if existing_conf >= _HIGH_CONFIDENCE_SKIP and source_count >= _MIN_SOURCES_FOR_SKIP:
-            return FactVerificationResult(fact_text, True, existing_conf)
+            return FactVerificationResult(fact.get("fact_text", ""), True, existing_conf)
+        return None
 
+    @staticmethod
+    def _source_names(fact: Dict) -> List[str]:
         source_names = fact.get("source_names")
         if not source_names:
             single = fact.get("source_name")
             source_names = [single] if single else []
+        return source_names
 
+    @staticmethod
+    def _to_result(fact: Dict, check: Dict) -> FactVerificationResult:
+        existing_conf = int(fact.get("confidence_score", 0))
+        plausible  = bool(check.get("plausible", True))
+        confidence = int(check.get("confidence", existing_conf or 60))
+        concern    = check.get("concern")
+        is_verified = plausible and confidence >= _MIN_CONFIDENCE
+        return FactVerificationResult(fact.get("fact_text", ""), is_verified, confidence, concern)
+
+    @staticmethod
+    def _neutral_result(fact: Dict) -> FactVerificationResult:
+        # Neutral fallback — do not block the pipeline on verifier outage
+        existing_conf = int(fact.get("confidence_score", 0))
+        is_verified = existing_conf >= _MIN_CONFIDENCE
+        return FactVerificationResult(fact.get("fact_text", ""), is_verified, existing_conf or 60)
+
+    def _verify_batch(self, facts: List[Dict], topic_name: str) -> List[FactVerificationResult]:
+        try:
+            verdicts = self._llm.verify_fact_batch(
+                [(f.get("fact_text", ""), self._source_names(f)) for f in facts], topic_name
+            )
+        except RuntimeError as exc:
+            logger.debug("fact_verify_batch_llm_skip", size=len(facts), error=str(exc)[:80])
+            return [self._to_result(f, _OUTAGE_VERDICT) for f in facts]
+        except Exception as exc:
+            logger.debug("fact_verify_batch_llm_skip", size=len(facts), error=str(exc)[:80])
+            return [self._neutral_result(f) for f in facts]
+
+        results: List[FactVerificationResult] = []
+        for fact, verdict in zip(facts, verdicts):
+            try:
+                if verdict is None:
+                    raise ValueError("missing verdict")
+                results.append(self._to_result(fact, verdict))
+            except (TypeError, ValueError):
+                results.append(self._verify_one(fact, topic_name))
+        return results
+
+    def _verify_one(self, fact: Dict, topic_name: str) -> FactVerificationResult:
+        skipped = self._skip_result(fact)
+        if skipped is not None:
+            return skipped
         try:
-            check = self._llm.verify_fact_consistency(fact_text, topic_name, source_names)
-            plausible  = bool(check.get("plausible", True))
-            confidence = int(check.get("confidence", existing_conf or 60))
-            concern    = check.get("concern")
-            is_verified = plausible and confidence >= _MIN_CONFIDENCE
-            return FactVerificationResult(fact_text, is_verified, confidence, concern)
+            check = self._llm.verify_fact_consistency(
+                fact.get("fact_text", ""), topic_name, self._source_names(fact)
+            )
+            return self._to_result(fact, check)
         except Exception as exc:
             logger.debug("fact_verify_llm_skip", error=str(exc)[:80])
-            # Neutral fallback — do not block the pipeline on verifier outage
-            is_verified = existing_conf >= _MIN_CONFIDENCE
-            return FactVerificationResult(fact_text, is_verified, existing_conf or 60)
+            return self._neutral_result(fact)
 
 
 _instance: Optional[FactVerifier] = None
@@ -0,0 +1,190 @@
+"""
+protection/near_duplicate_index.py
+
+MinHash / LSH index of every registered title and script, stored in Redis.
+DuplicateGuard uses it to find near-duplicates across the whole history
+instead of a window of the last 40 items.
+
+Signature
+─────────
+  Text is lower-cased and split into words.  With unit="word" the shingles
+  are runs of shingle_size words.  With unit="char" they are runs of
+  shingle_size characters of the space-joined words, padded with a space
+  at each end.  Character shingles suit short titles: "Animal" and
+  "Animals" share most of theirs, where word shingles share none.
+
+  Each shingle is hashed once (blake2b, 64 bit) and pushed through
+  _NUM_PERM universal hash functions (a·x + b mod 2^61-1).  The
+  per-function minima form the signature.  The fraction of equal slots
+  between two signatures estimates the Jaccard similarity of their shingle
+  sets.
+
+LSH banding
+───────────
+  The signature is cut into _BANDS bands of _ROWS rows.  Each band is hashed
+  to a bucket key (RK.dedup_lsh_bucket), a Redis set of document ids.  Two
+  texts become candidates when any band collides.  The probability is
+  1 - (1 - J^rows)^bands: with 32 bands of 3 rows it is about 0.98 at
+  J = 0.48, 0.6 at J = 0.31, 0.08 at J = 0.14 and 0.03 at J = 0.1.  The
+  steep part sits below the Jaccard of the weakest pairs SequenceMatcher
+  still flags (about 0.48 on character trigrams of titles) and above that
+  of unrelated titles (95% of them score below 0.14).
+
+  A query is one pipelined SMEMBERS round trip for all bands, one HMGET of
+  the candidates' signatures, and one HMGET of the texts of the best
+  `limit` of them.  Its cost depends on the number of near neighbours, not
+  on the size of the history.
+
+Signatures (RK.dedup_lsh_docs) and original texts (RK.dedup_lsh_texts) live
+in separate hashes per kind, so candidates are ranked on their signatures
+and only the few worth confirming have their full text fetched.  Nothing
+expires: the index is meant to cover the entire published history.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+import structlog
+
+from storage.redis_client import RK, get_redis
+
+logger = structlog.get_logger(__name__)
+
+_BANDS    = 32
+_ROWS     = 3
+_NUM_PERM = _BANDS * _ROWS
+_PRIME    = (1 << 61) - 1
+
+# Fixed seed: signatures must be comparable across processes and runs.
+_rng   = random.Random(0x5EED_D0C5)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(_NUM_PERM)]
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+@dataclass
+class NearDuplicate:
+    doc_id:     str
+    text:       str
+    similarity: float        # estimated Jaccard of the shingle sets
+
+
+class NearDuplicateIndex:
+    """One index per kind of text ("title", "script")."""
+
+    def __init__(self, kind: str, shingle_size: int = 3, unit: str = "word") -> None:
+        if unit not in ("word", "char"):
+            raise ValueError(f"Unknown shingle unit: {unit}")
+        self._kind = kind
+        self._k    = shingle_size
+        self._unit = unit
+        self._redis = get_redis()
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def add(self, text: str) -> Optional[str]:
+        """Insert text (idempotent).  Returns its doc id, or None for empty text."""
+        sig = self.signature(text)
+        if sig is None:
+            return None
+        doc_id = self.doc_id(text)
+        pipe = self._redis.r.pipeline(transaction=False)
+        self._queue_add(pipe, doc_id, sig, text)
+        pipe.execute()
+        return doc_id
+
+    def add_many(self, texts: Sequence[str]) -> int:
+        """Bulk insert (backfill).  Returns the number of documents indexed."""
+        pipe = self._redis.r.pipeline(transaction=False)
+        n = 0
+        for text in texts:
+            sig = self.signature(text)
+            if sig is None:
+                continue
+            self._queue_add(pipe, self.doc_id(text), sig, text)
+            n += 1
+        if n:
+            pipe.execute()
+        return n
+
+    def query(self, text: str, min_similarity: float = 0.0, limit: int = 5) -> List[NearDuplicate]:
+        """Indexed documents sharing an LSH band with text, most similar first."""
+        sig = self.signature(text)
+        if sig is None:
+            return []
+        pipe = self._redis.r.pipeline(transaction=False)
+        for bucket in self._buckets(sig):
+            pipe.smembers(bucket)
+        candidates = set().union(*pipe.execute())
+        if not candidates:
+            return []
+
+        ids = sorted(candidates)
+        ranked: List[Tuple[float, str]] = []
+        for doc_id, raw in zip(ids, self._redis.r.hmget(RK.dedup_lsh_docs(self._kind), ids)):
+            if not raw:
+                continue
+            other = json.loads(raw)
+            if len(other) != _NUM_PERM:
+                continue
+            sim = sum(1 for a, b in zip(sig, other) if a == b) / _NUM_PERM
+            if sim >= min_similarity:
+                ranked.append((sim, doc_id))
+        ranked.sort(key=lambda r: r[0], reverse=True)
+        ranked = ranked[:limit]
+        if not ranked:
+            return []
+
+        texts = self._redis.r.hmget(RK.dedup_lsh_texts(self._kind), [d for _, d in ranked])
+        return [
+            NearDuplicate(doc_id, text or "", sim)
+            for (sim, doc_id), text in zip(ranked, texts)
+        ]
+
+    def size(self) -> int:
+        return int(self._redis.r.hlen(RK.dedup_lsh_docs(self._kind)))
+
+    # ── Signatures ────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def doc_id(text: str) -> str:
+        normalised = " ".join(_WORD_RE.findall(text.lower()))
+        return hashlib.sha1(normalised.encode("utf-8")).hexdigest()[:16]
+
+    def signature(self, text: str) -> Optional[List[int]]:
+        words = _WORD_RE.findall((text or "").lower())
+        if not words:
+            return None
+        if self._unit == "char":
+            joined = f" {' '.join(words)} "
+            k = min(self._k, len(joined))
+            shingles = {joined[i:i + k] for i in range(len(joined) - k + 1)}
+        else:
+            k = min(self._k, len(words))
+            shingles = {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+            for s in shingles
+        ]
+        return [min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMS]
+
+    def _queue_add(self, pipe: Any, doc_id: str, sig: List[int], text: str) -> None:
+        for bucket in self._buckets(sig):
+            pipe.sadd(bucket, doc_id)
+        pipe.hset(RK.dedup_lsh_docs(self._kind), doc_id, json.dumps(sig))
+        pipe.hset(RK.dedup_lsh_texts(self._kind), doc_id, text)
+
+    def _buckets(self, sig: List[int]) -> List[str]:
+        out = []
+        for band in range(_BANDS):
+            rows = sig[band * _ROWS:(band + 1) * _ROWS]
+            digest = hashlib.blake2b(
+                ",".join(map(str, rows)).encode(), digest_size=8
+            ).hexdigest()
+            out.append(RK.dedup_lsh_bucket(self._kind, band, digest))
+        return out
@@ -1,11 +1,15 @@
 """
 protection/policy_guard.py
+
+All keyword and pattern lists are compiled once at import into a
+PolicyMatcher (protection/policy_matcher.py).  Each check is therefore one
+pass over the text, however many rules there are.
 """
 from __future__ import annotations
-import re
 from dataclasses import dataclass
 from typing import Optional
 import structlog
+from protection.policy_matcher import PolicyMatcher
 
 logger = structlog.get_logger(__name__)
 
@@ -34,6 +38,11 @@ _VIOLENCE_PATTERNS: list = [
     r"\bhow to (kill|harm|hurt)\b",
 ]
 
+_MATCHER = PolicyMatcher(
+    literals={"banned": _BANNED_TOPIC_KEYWORDS},
+    patterns={"medical": _MEDICAL_CLAIM_PATTERNS, "violence": _VIOLENCE_PATTERNS},
+)
+
 
 @dataclass
 class PolicyCheckResult:
@@ -46,10 +55,9 @@ class PolicyGuard:
     # ── Topic-level checks ────────────────────────────────────────────────────
 
     def check_topic(self, topic_name: str, category: str) -> PolicyCheckResult:
-        text = f" {topic_name.lower()} "
-        for kw in _BANNED_TOPIC_KEYWORDS:
-            if kw in text:
-                return PolicyCheckResult(False, f"banned_keyword_in_topic:{kw.strip()}")
+        kw = _MATCHER.first(PolicyMatcher.normalise(topic_name), "banned")
+        if kw:
+            return PolicyCheckResult(False, f"banned_keyword_in_topic:{kw.strip()}")
 
         if category not in _ALLOWED_CATEGORIES:
             return PolicyCheckResult(False, f"category_not_in_constitution:{category}")
@@ -59,29 +67,23 @@ class PolicyGuard:
     # ── Script-level checks ───────────────────────────────────────────────────
 
     def check_script_text(self, full_text: str) -> PolicyCheckResult:
-        text = f" {full_text.lower()} "
-
-        for kw in _BANNED_TOPIC_KEYWORDS:
-            if kw in text:
-                return PolicyCheckResult(False, f"banned_keyword_in_script:{kw.strip()}")
-
-        for pattern in _MEDICAL_CLAIM_PATTERNS:
-            if re.search(pattern, text):
-                return PolicyCheckResult(False, f"medical_claim_detected:{pattern}")
+        found = _MATCHER.scan(PolicyMatcher.normalise(full_text))
 
-        for pattern in _VIOLENCE_PATTERNS:
-            if re.search(pattern, text):
-                return PolicyCheckResult(False, f"violence_against_humans:{pattern}")
+        if "banned" in found:
+            return PolicyCheckResult(False, f"banned_keyword_in_script:{found['banned'].strip()}")
+        if "medical" in found:
+            return PolicyCheckResult(False, f"medical_claim_detected:{found['medical']}")
+        if "violence" in found:
+            return PolicyCheckResult(False, f"violence_against_humans:{found['violence']}")
 
         return PolicyCheckResult(True)
 
     # ── Fact-level checks ─────────────────────────────────────────────────────
 
     def check_fact(self, fact_text: str) -> PolicyCheckResult:
-        text = f" {fact_text.lower()} "
-        for pattern in _MEDICAL_CLAIM_PATTERNS:
-            if re.search(pattern, text):
-                return PolicyCheckResult(False, f"medical_claim_in_fact:{pattern}")
+        pattern = _MATCHER.first(PolicyMatcher.normalise(fact_text), "medical")
+        if pattern:
+            return PolicyCheckResult(False, f"medical_claim_in_fact:{pattern}")
         return PolicyCheckResult(True)
 
     def filter_facts(self, facts: list) -> list:
@@ -17,12 +17,27 @@ fallback. gemini-1.5-flash was retired in 2025 and returns 404;
 the old hardcoded reference caused 5 vision_call_failed log entries
 per video, which added log noise and failed to provide the content
 verification the architecture requires.
+
+Concurrency and caching
+───────────────────────
+verify_batch checks up to _MAX_CONCURRENT_ITEMS items at once (ffprobe,
+ffmpeg and the vision request overlap across items), while at most
+_MAX_CONCURRENT_VISION Gemini calls are in flight.  genai is configured
+once and each GenerativeModel is built once per process.
+
+Verdicts are cached under (sha256 of the media file, topic, category), in
+process and in Redis (RK.vision_verdict, 30-day TTL).  The same clip checked
+again for the same topic, whether from an AssetCache hit, a ShortPipeline
+retry or a later run, costs no frame extraction and no vision quota.  Only
+real "vision_checked" verdicts are cached, never the neutral fallbacks.
 """
 from __future__ import annotations
-import json, os, subprocess, tempfile
-from dataclasses import dataclass
+import hashlib, json, os, subprocess, tempfile, threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -40,6 +55,12 @@ _VISION_FALLBACK      = "gemini-2.0-flash-lite"
 # transient API failure — we try the fallback model on these.
 _MODEL_NOT_FOUND_LOWER = ("404", "not found", "not supported", "is not found")
 
+_MAX_CONCURRENT_ITEMS  = 4
+_MAX_CONCURRENT_VISION = 3
+_VERDICT_TTL_SECONDS   = 30 * 86_400
+_LOCAL_VERDICTS        = 512
+_HASH_CHUNK            = 1 << 20
+
 
 @dataclass
 class VerificationResult:
@@ -51,6 +72,14 @@ class VerificationResult:
 
 class VisualVerifier:
 
+    def __init__(self) -> None:
+        self._lock         = threading.Lock()
+        self._vision_slots = threading.BoundedSemaphore(_MAX_CONCURRENT_VISION)
+        self._models: Dict[str, Any] = {}
+        self._genai: Optional[Any] = None
+        self._verdicts: "OrderedDict[str, VerificationResult]" = OrderedDict()
+        self._stats = {"vision_calls": 0, "memory_hits": 0, "redis_hits": 0, "cached": 0}
+
     def is_available(self) -> bool:
         return bool(os.getenv("GEMINI_API_KEY", "").strip())
 
@@ -66,6 +95,12 @@ class VisualVerifier:
         if not self.is_available():
             return VerificationResult(True, 50, "unknown", "vision_unavailable_skipped")
 
+        fingerprint = self._fingerprint(local_path, topic_name, category)
+        if fingerprint is not None:
+            cached = self._cached_verdict(fingerprint)
+            if cached is not None:
+                return cached
+
         try:
             image_bytes = self._extract_frame(local_path, asset_type)
         except Exception as exc:
@@ -76,11 +111,16 @@ class VisualVerifier:
             return VerificationResult(True, 50, "unknown", "no_frame_extracted")
 
         try:
-            return self._call_vision(image_bytes, topic_name, category)
+            with self._vision_slots:
+                result = self._call_vision(image_bytes, topic_name, category)
         except Exception as exc:
             logger.warning("vision_call_failed", error=str(exc)[:120])
             return VerificationResult(True, 50, "unknown", "vision_call_failed")
 
+        if fingerprint is not None and result.reason == "vision_checked":
+            self._store_verdict(fingerprint, result)
+        return result
+
     def verify_batch(
         self,
         media_items,
@@ -93,16 +133,40 @@ class VisualVerifier:
         confidence below min_confidence) are replaced with None so the
         assembler falls back to a black frame and the pipeline can decide
         whether to re-fetch.
+
+        Items served from the asset library were verified when they entered
+        it and are passed through without a vision call.  Accepted items get
+        their confidence recorded as visual_match_score.
         """
+        todo = [
+            item for item in media_items
+            if item is not None and not getattr(item, "library_asset_id", None)
+        ]
+
+        def check(item) -> VerificationResult:
+            return self.verify(item.local_path, item.asset_type, topic_name, category)
+
+        if len(todo) > 1:
+            workers = min(_MAX_CONCURRENT_ITEMS, len(todo))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="visual_verify") as pool:
+                verdicts = dict(zip(map(id, todo), pool.map(check, todo)))
+        else:
+            verdicts = {id(item): check(item) for item in todo}
+
         results = []
         for item in media_items:
             if item is None:
                 results.append(None)
                 continue
 
-            v = self.verify(item.local_path, item.asset_type, topic_name, category)
+            if getattr(item, "library_asset_id", None):
+                results.append(item)
+                continue
+
+            v = verdicts[id(item)]
 
             if v.is_match or v.confidence >= min_confidence:
+                item.visual_match_score = v.confidence
                 results.append(item)
             else:
                 logger.info(
@@ -116,6 +180,64 @@ class VisualVerifier:
 
         return results
 
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._verdicts)}
+
+    # ── Verdict cache ─────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _fingerprint(local_path: str, topic_name: str, category: str) -> Optional[str]:
+        try:
+            h = hashlib.sha256()
+            with open(local_path, "rb") as fh:
+                for chunk in iter(lambda: fh.read(_HASH_CHUNK), b""):
+                    h.update(chunk)
+        except OSError:
+            return None
+        key = f"{h.hexdigest()}|{topic_name.strip().lower()}|{category.strip().lower()}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _cached_verdict(self, fingerprint: str) -> Optional[VerificationResult]:
+        with self._lock:
+            hit = self._verdicts.get(fingerprint)
+            if hit is not None:
+                self._verdicts.move_to_end(fingerprint)
+                self._stats["memory_hits"] += 1
+                return hit
+        try:
+            from storage.redis_client import RK, get_redis
+            data = get_redis().get_json(RK.vision_verdict(fingerprint))
+            if not data:
+                return None
+            result = VerificationResult(
+                bool(data["is_match"]), int(data["confidence"]),
+                str(data.get("detected_subject", "unknown")), str(data.get("reason", "vision_checked")),
+            )
+        except Exception as exc:
+            logger.debug("vision_verdict_cache_get_failed", error=str(exc)[:80])
+            return None
+        with self._lock:
+            self._stats["redis_hits"] += 1
+            self._remember(fingerprint, result)
+        return result
+
+    def _store_verdict(self, fingerprint: str, result: VerificationResult) -> None:
+        with self._lock:
+            self._stats["cached"] += 1
+            self._remember(fingerprint, result)
+        try:
+            from storage.redis_client import RK, get_redis
+            get_redis().set_with_ttl(RK.vision_verdict(fingerprint), asdict(result), _VERDICT_TTL_SECONDS)
+        except Exception as exc:
+            logger.debug("vision_verdict_cache_put_failed", error=str(exc)[:80])
+
+    def _remember(self, fingerprint: str, result: VerificationResult) -> None:
+        self._verdicts[fingerprint] = result
+        self._verdicts.move_to_end(fingerprint)
+        while len(self._verdicts) > _LOCAL_VERDICTS:
+            self._verdicts.popitem(last=False)
+
     # ── Frame extraction ──────────────────────────────────────────────────────
 
     def _extract_frame(self, local_path: str, asset_type: str) -> Optional[bytes]:
@@ -153,11 +275,22 @@ class VisualVerifier:
 
     # ── Vision call ───────────────────────────────────────────────────────────
 
+    def _model(self, model_name: str) -> Any:
+        """Long-lived GenerativeModel; genai.configure runs once per process."""
+        with self._lock:
+            if self._genai is None:
+                import google.generativeai as genai
+                genai.configure(api_key=os.environ["GEMINI_API_KEY"])
+                self._genai = genai
+            model = self._models.get(model_name)
+            if model is None:
+                model = self._models[model_name] = self._genai.GenerativeModel(model_name)
+            return model
+
     def _call_vision(
         self, image_bytes: bytes, topic_name: str, category: str
     ) -> VerificationResult:
         import google.generativeai as genai
-        genai.configure(api_key=os.environ["GEMINI_API_KEY"])
 
         prompt = (
             f"You are verifying footage for a {category} nature video about: '{topic_name}'.\n"
@@ -179,7 +312,9 @@ class VisualVerifier:
         last_exc: Optional[Exception] = None
         for model_name in (_VISION_MODEL, _VISION_FALLBACK):
             try:
-                model    = genai.GenerativeModel(model_name)
+                model    = self._model(model_name)
+                with self._lock:
+                    self._stats["vision_calls"] += 1
                 response = model.generate_content(
                     [prompt, {"mime_type": "image/jpeg", "data": image_bytes}],
                     generation_config=gen_cfg,
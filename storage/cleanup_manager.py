@@ -16,6 +16,13 @@ Responsibilities
 
   4. Storage health report  Summarise byte usage per folder for the war room.
 
+Every task works from listings: one paginated list_objects_v2 pass per
+prefix, joined in memory against the database, and deletions go out in
+delete_objects batches of up to 1 000 keys.  There are no per-object HEAD
+or DELETE requests.  Within run_full_cleanup each prefix is listed once,
+and the usage counters (storage/storage_usage.py) are reconciled weekly
+with a full scan.  The health report reads those counters.
+
 Called by
 ─────────
   • publisher.py              — immediately after a confirmed YouTube upload
@@ -26,11 +33,12 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import structlog
 
 from storage.r2_client import R2Client, R2Paths, get_r2
+from storage.storage_usage import TRACKED_PREFIXES, get_storage_usage
 from storage.supabase_client import SupabaseClient, get_db
 
 logger = structlog.get_logger(__name__)
@@ -62,7 +70,10 @@ class CleanupManager:
     def __init__(self) -> None:
         self.r2: R2Client = get_r2()
         self.db: SupabaseClient = get_db()
+        self._usage = get_storage_usage()
         self._retention_days_finals: int = self._load_retention_days()
+        # prefix → listing, shared by the steps of one run_full_cleanup()
+        self._listings: Optional[Dict[str, List[Dict]]] = None
 
     # ── Configuration ─────────────────────────────────────────────────────────
 
@@ -99,16 +110,12 @@ class CleanupManager:
         }
 
         # ── Raw clips ────────────────────────────────────────────────────────
-        raw_objects = self.r2.list_prefix(R2Paths.raw_prefix(queue_id))
-        raw_bytes = sum(obj["size_bytes"] for obj in raw_objects)
-        raw_deleted = self.r2.delete_prefix(R2Paths.raw_prefix(queue_id))
+        raw_deleted, raw_bytes = self._delete_all(R2Paths.raw_prefix(queue_id))
         result["raw_clips_deleted"] = raw_deleted
         result["bytes_freed"] += raw_bytes
 
         # ── Intermediate audio ────────────────────────────────────────────────
-        audio_objects = self.r2.list_prefix(R2Paths.audio_prefix(queue_id))
-        audio_bytes = sum(obj["size_bytes"] for obj in audio_objects)
-        audio_deleted = self.r2.delete_prefix(R2Paths.audio_prefix(queue_id))
+        audio_deleted, audio_bytes = self._delete_all(R2Paths.audio_prefix(queue_id))
         result["audio_files_deleted"] = audio_deleted
         result["bytes_freed"] += audio_bytes
 
@@ -143,60 +150,34 @@ class CleanupManager:
         }
 
         cutoff = datetime.now(timezone.utc) - timedelta(days=self._retention_days_finals)
-        cutoff_iso = cutoff.isoformat()
-
-        published = self.db.get_recent_published(limit=2_000)
-
-        for record in published:
-            pub_at_raw = record.get("published_at")
-            if not pub_at_raw:
-                continue
-
-            # Parse published_at; Supabase returns ISO strings
-            try:
-                pub_at = datetime.fromisoformat(
-                    pub_at_raw.replace("Z", "+00:00")
-                )
-            except (ValueError, AttributeError):
-                continue
-
-            if pub_at >= cutoff:
-                continue   # Still within retention window
-
-            result["inspected"] += 1
-            queue_id = record.get("queue_id")
-            if not queue_id:
-                continue
-
-            # ── Final MP4 ────────────────────────────────────────────────────
-            final_key = R2Paths.final_video(queue_id)
-            if self.r2.file_exists(final_key):
-                size = self.r2.get_file_size(final_key) or 0
-                if not dry_run:
-                    if self.r2.delete_file(final_key):
-                        result["finals_deleted"] += 1
-                        result["bytes_freed"] += size
-                else:
-                    logger.info(
-                        "dry_run_would_delete_final",
-                        queue_id=queue_id[:8],
-                        key=final_key,
-                        size_bytes=size,
-                    )
-                    result["finals_deleted"] += 1
-                    result["bytes_freed"] += size
-
-            # ── Thumbnail ────────────────────────────────────────────────────
-            thumb_key = R2Paths.thumbnail(queue_id)
-            if self.r2.file_exists(thumb_key):
-                t_size = self.r2.get_file_size(thumb_key) or 0
-                if not dry_run:
-                    if self.r2.delete_file(thumb_key):
-                        result["thumbnails_deleted"] += 1
-                        result["bytes_freed"] += t_size
-                else:
-                    result["thumbnails_deleted"] += 1
-                    result["bytes_freed"] += t_size
+        expired = {
+            r["queue_id"]
+            for r in self.db.get_published_before(cutoff.isoformat())
+            if r.get("queue_id")
+        }
+        result["inspected"] = len(expired)
+
+        if expired:
+            finals = self._expired_objects(
+                "finals/", {R2Paths.final_video(q) for q in expired}
+            )
+            thumbs = self._expired_objects(
+                "thumbnails/", {R2Paths.thumbnail(q) for q in expired}
+            )
+
+            if dry_run:
+                for key, size in finals.items():
+                    logger.info("dry_run_would_delete_final", key=key, size_bytes=size)
+                deleted_finals, deleted_thumbs = list(finals), list(thumbs)
+            else:
+                deleted_finals = self._delete("finals/", finals)
+                deleted_thumbs = self._delete("thumbnails/", thumbs)
+
+            result["finals_deleted"] = len(deleted_finals)
+            result["thumbnails_deleted"] = len(deleted_thumbs)
+            result["bytes_freed"] = (
+                sum(finals[k] for k in deleted_finals) + sum(thumbs[k] for k in deleted_thumbs)
+            )
 
         logger.info(
             "expired_finals_cleanup_done",
@@ -219,18 +200,7 @@ class CleanupManager:
         older_than_hours.  Returns the count of deleted objects.
         """
         cutoff = datetime.now(timezone.utc) - timedelta(hours=older_than_hours)
-        all_objects = self.r2.list_prefix("media/raw/")
-
-        to_delete = [
-            obj["key"]
-            for obj in all_objects
-            if self._is_older_than(obj["last_modified"], cutoff)
-        ]
-
-        deleted = 0
-        for key in to_delete:
-            if self.r2.delete_file(key):
-                deleted += 1
+        deleted = self._delete_older_than("media/raw/", cutoff)
 
         if deleted:
             logger.info(
@@ -248,18 +218,7 @@ class CleanupManager:
         older_than_hours.  Returns the count of deleted objects.
         """
         cutoff = datetime.now(timezone.utc) - timedelta(hours=older_than_hours)
-        all_objects = self.r2.list_prefix("audio/")
-
-        to_delete = [
-            obj["key"]
-            for obj in all_objects
-            if self._is_older_than(obj["last_modified"], cutoff)
-        ]
-
-        deleted = 0
-        for key in to_delete:
-            if self.r2.delete_file(key):
-                deleted += 1
+        deleted = self._delete_older_than("audio/", cutoff)
 
         if deleted:
             logger.info(
@@ -274,18 +233,7 @@ class CleanupManager:
     ) -> int:
         """Delete subtitle files older than older_than_days."""
         cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
-        all_objects = self.r2.list_prefix("subtitles/")
-
-        to_delete = [
-            obj["key"]
-            for obj in all_objects
-            if self._is_older_than(obj["last_modified"], cutoff)
-        ]
-
-        deleted = 0
-        for key in to_delete:
-            if self.r2.delete_file(key):
-                deleted += 1
+        deleted = self._delete_older_than("subtitles/", cutoff)
 
         if deleted:
             logger.info("orphaned_subtitles_deleted", count=deleted)
@@ -299,20 +247,18 @@ class CleanupManager:
         """
         Compute byte usage per logical folder and emit a health summary.
         Used by the daily_dashboard and the COS weekly review.
+        Read from the incremental usage counters in O(1).  Listings are used
+        only while the index has never been reconciled.
         """
-        folders = {
-            "raw_clips": "media/raw/",
-            "audio": "audio/",
-            "subtitles": "subtitles/",
-            "thumbnails": "thumbnails/",
-            "finals": "finals/",
-            "music": "music/",
-            "archive": "archive/",
-        }
+        folders = TRACKED_PREFIXES
 
+        counted = self._usage.usage()
         usage: Dict[str, int] = {}
         for label, prefix in folders.items():
-            usage[f"{label}_bytes"] = self.r2.get_storage_usage_bytes(prefix)
+            if counted is not None:
+                usage[f"{label}_bytes"] = counted[prefix]["bytes"]
+            else:
+                usage[f"{label}_bytes"] = sum(obj["size_bytes"] for obj in self._list(prefix))
 
         total_bytes: int = sum(usage.values())
         total_gb: float = round(total_bytes / (1024 ** 3), 4)
@@ -349,12 +295,19 @@ class CleanupManager:
         dry_run=True performs a complete inspection pass without deleting anything.
         """
         logger.info("full_cleanup_started", dry_run=dry_run)
+        self._listings = {}
+        try:
+            return self._run_full_cleanup(dry_run)
+        finally:
+            self._listings = None
 
+    def _run_full_cleanup(self, dry_run: bool) -> Dict:
         report: Dict = {
             "dry_run": dry_run,
             "orphaned_raw_clips_deleted": 0,
             "orphaned_audio_deleted": 0,
             "orphaned_subtitles_deleted": 0,
+            "usage_reconciled": False,
             "expired_finals": {},
             "storage_health": {},
         }
@@ -374,7 +327,11 @@ class CleanupManager:
         # Step 4 — Expired finals (respects dry_run)
         report["expired_finals"] = self.cleanup_expired_finals(dry_run=dry_run)
 
-        # Step 5 — Storage health report
+        # Step 5 — Reconcile the usage counters with a full scan (weekly)
+        if not dry_run:
+            report["usage_reconciled"] = self._usage.reconcile_if_stale(self.r2)
+
+        # Step 6 — Storage health report
         report["storage_health"] = self.get_storage_health_report()
 
         logger.info(
@@ -390,6 +347,44 @@ class CleanupManager:
     # Internal helpers
     # ═════════════════════════════════════════════════════════════════════════
 
+    def _list(self, prefix: str) -> List[Dict]:
+        """One paginated listing per prefix; reused within run_full_cleanup()."""
+        if self._listings is not None and prefix in self._listings:
+            return self._listings[prefix]
+        objects = self.r2.list_prefix(prefix)
+        if self._listings is not None:
+            self._listings[prefix] = objects
+        return objects
+
+    def _expired_objects(self, prefix: str, wanted: Iterable[str]) -> Dict[str, int]:
+        """key → size for the listed objects under prefix whose key is in wanted."""
+        wanted = set(wanted)
+        return {
+            obj["key"]: obj["size_bytes"] for obj in self._list(prefix) if obj["key"] in wanted
+        }
+
+    def _delete(self, prefix: str, keys: Iterable[str]) -> List[str]:
+        """Batch-delete keys listed under prefix and drop them from the cached listing."""
+        deleted = self.r2.delete_keys(list(keys))
+        if deleted and self._listings is not None and prefix in self._listings:
+            gone = set(deleted)
+            self._listings[prefix] = [o for o in self._listings[prefix] if o["key"] not in gone]
+        return deleted
+
+    def _delete_all(self, prefix: str) -> Tuple[int, int]:
+        """Delete everything under prefix from one listing.  Returns (count, bytes)."""
+        sizes = {obj["key"]: obj["size_bytes"] for obj in self._list(prefix)}
+        deleted = self._delete(prefix, sizes) if sizes else []
+        return len(deleted), sum(sizes[k] for k in deleted)
+
+    def _delete_older_than(self, prefix: str, cutoff: datetime) -> int:
+        stale = [
+            obj["key"]
+            for obj in self._list(prefix)
+            if self._is_older_than(obj["last_modified"], cutoff)
+        ]
+        return len(self._delete(prefix, stale)) if stale else 0
+
     @staticmethod
     def _is_older_than(last_modified: datetime, cutoff: datetime) -> bool:
         """
@@ -0,0 +1,169 @@
+"""
+storage/config_cache.py
+
+In-process cache of the growth_rules and channel_config tables.
+
+Rules and config change a few times a week (ChannelOS weekly review,
+bootstrap), but they are read many times per video:
+voice_consecutive_limit on every TTS call, voice_split and
+category_allocation on every pipeline attempt.  Without a cache each read
+is a PostgREST round trip.
+
+  load        growth_rules and channel_config are each fetched in one
+              query (all rows) and served from memory.
+  expiry      A snapshot is reloaded after _TTL_SECONDS at the latest.
+  invalidate  SupabaseClient.update_rule / set_config bump a Redis version
+              counter (RK.CONFIG_VERSION).  Every process compares it with
+              the version its snapshot was loaded under, at most every
+              _VERSION_CHECK_SECONDS, and reloads when it moved.  A rule
+              change applied by ChannelOS therefore reaches running
+              pipelines within seconds, not after the TTL.
+
+Each load also refreshes the Redis copies (RK.GROWTH_RULES /
+RK.CHANNEL_CONFIG) that TopicSelector falls back to when Supabase is down.
+Redis is best-effort throughout.  Without it the cache behaves as a plain
+TTL cache.  If a reload fails, the previous snapshot keeps being served.
+Only the very first load raises.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_TTL_SECONDS           = 300.0
+_VERSION_CHECK_SECONDS = 15.0
+
+
+class ConfigCache:
+    """Thread-safe snapshot of growth_rules and channel_config."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = _TTL_SECONDS,
+        version_check_seconds: float = _VERSION_CHECK_SECONDS,
+    ) -> None:
+        self._ttl           = ttl_seconds
+        self._version_every = version_check_seconds
+        self._lock          = threading.Lock()
+        self._rules:  Optional[Dict[str, Any]] = None
+        self._config: Optional[Dict[str, Any]] = None
+        self._loaded_at     = 0.0
+        self._checked_at    = 0.0
+        self._version: Optional[int] = None
+        self._stats = {"hits": 0, "loads": 0, "load_failures": 0, "remote_invalidations": 0}
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def get_rule(self, rule_name: str) -> Optional[Any]:
+        return self._snapshot()[0].get(rule_name)
+
+    def get_config(self, key: str) -> Any:
+        return self._snapshot()[1].get(key)
+
+    def all_rules(self) -> Dict[str, Any]:
+        return dict(self._snapshot()[0])
+
+    def all_config(self) -> Dict[str, Any]:
+        return dict(self._snapshot()[1])
+
+    def invalidate(self, broadcast: bool = True) -> None:
+        """
+        Drop the local snapshot.  With broadcast=True the Redis version is
+        bumped too, so every other process reloads on its next check.
+        """
+        with self._lock:
+            self._rules = self._config = None
+        if broadcast:
+            try:
+                from storage.redis_client import get_redis
+                get_redis().bump_config_version()
+            except Exception as exc:
+                logger.debug("config_version_bump_failed", error=str(exc)[:80])
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "rules":       len(self._rules or {}),
+                "config_keys": len(self._config or {}),
+                "version":     self._version,
+                "age_seconds": round(time.time() - self._loaded_at, 1) if self._rules is not None else None,
+            }
+
+    # ── Internal ──────────────────────────────────────────────────────────────
+
+    def _snapshot(self):
+        with self._lock:
+            if self._fresh():
+                self._stats["hits"] += 1
+                return self._rules, self._config
+            try:
+                self._load()
+            except Exception as exc:
+                self._stats["load_failures"] += 1
+                if self._rules is None:
+                    raise
+                logger.warning("config_cache_reload_failed", error=str(exc)[:120])
+                self._loaded_at = time.time()   # retry after another TTL, not on every read
+            return self._rules, self._config
+
+    def _fresh(self) -> bool:
+        if self._rules is None:
+            return False
+        now = time.time()
+        if now - self._loaded_at >= self._ttl:
+            return False
+        if now - self._checked_at >= self._version_every:
+            self._checked_at = now
+            version = self._remote_version()
+            if version is not None and version != self._version:
+                self._stats["remote_invalidations"] += 1
+                return False
+        return True
+
+    def _load(self) -> None:
+        from storage.supabase_client import get_db
+        version = self._remote_version()
+        db      = get_db()
+        rules   = db.get_all_rules()
+        config  = db.get_all_config()
+        self._rules, self._config = rules, config
+        self._version    = version
+        self._loaded_at  = self._checked_at = time.time()
+        self._stats["loads"] += 1
+        logger.debug("config_cache_loaded", rules=len(rules), config_keys=len(config), version=version)
+        try:
+            from storage.redis_client import get_redis
+            redis = get_redis()
+            redis.cache_growth_rules(rules)
+            redis.cache_channel_config(config)
+        except Exception as exc:
+            logger.debug("config_cache_redis_copy_failed", error=str(exc)[:80])
+
+    @staticmethod
+    def _remote_version() -> Optional[int]:
+        try:
+            from storage.redis_client import get_redis
+            return get_redis().get_config_version()
+        except Exception as exc:
+            logger.debug("config_version_read_failed", error=str(exc)[:80])
+            return None
+
+
+# ── Singleton ──────────────────────────────────────────────────────────────────
+
+_cache_instance: Optional[ConfigCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_config_cache() -> ConfigCache:
+    global _cache_instance
+    with _cache_lock:
+        if _cache_instance is None:
+            _cache_instance = ConfigCache()
+        return _cache_instance
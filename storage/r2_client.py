@@ -31,10 +31,14 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import math
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import boto3
 import structlog
@@ -104,17 +108,48 @@ class R2Paths:
     def archive(queue_id: str, year: int, month: int) -> str:
         return f"archive/{year}/{month:02d}/{queue_id}.mp4"
 
+    @staticmethod
+    def library_asset(file_hash: str, ext: str = ".mp4") -> str:
+        return f"library/{file_hash[:2]}/{file_hash}{ext}"
+
+    @staticmethod
+    def library_prefix() -> str:
+        return "library/"
+
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Transfer configuration for multipart uploads
+# Transfer tuning
 # ─────────────────────────────────────────────────────────────────────────────
-
-_TRANSFER_CONFIG = TransferConfig(
-    multipart_threshold=10 * 1024 * 1024,   # 10 MB
-    max_concurrency=4,
-    multipart_chunksize=10 * 1024 * 1024,
-    use_threads=True,
-)
+#
+# Objects range from 2 KB SRT files to 500 MB long-form renders, so transfer
+# parameters are chosen per object rather than from one static config:
+#
+#   ≤ _SINGLE_PART_MAX   one PUT / GET, no thread pool.
+#   larger               about _TARGET_PARTS parts, each between
+#                        _MIN_PART and _MAX_PART (MiB-aligned).  As many
+#                        parallel streams as parts, capped at
+#                        _MAX_CONCURRENCY.  If the measured throughput (EWMA
+#                        over recent transfers) shows a slow link, the cap is
+#                        _SLOW_LINK_CONCURRENCY, because extra streams would
+#                        only compete with each other.
+#
+# Downloads above _SINGLE_PART_MAX are parallel ranged GETs (s3transfer
+# splits on multipart_chunksize).  open_reader() exposes the same ranged
+# reads as a random-access stream with read-ahead, so a consumer such as
+# the YouTube uploader can start before the object is fully fetched.
+
+_MIB                    = 1024 * 1024
+_SINGLE_PART_MAX        = 16 * _MIB
+_MIN_PART               = 8 * _MIB
+_MAX_PART               = 64 * _MIB
+_TARGET_PARTS           = 16
+_MAX_CONCURRENCY        = 16
+_SLOW_LINK_BYTES_PER_S  = 4 * _MIB
+_SLOW_LINK_CONCURRENCY  = 4
+_THROUGHPUT_ALPHA       = 0.3
+_READER_BLOCK           = 8 * _MIB
+_READER_PREFETCH        = 4
+_DELETE_BATCH           = 1_000               # S3 DeleteObjects limit
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -131,6 +166,8 @@ class R2Client:
     _s3: Optional[object] = None
     _bucket: str = ""
     _initialized: bool = False
+    _throughput: Optional[float] = None      # bytes/s, EWMA over recent transfers
+    _throughput_lock = threading.Lock()
 
     def __new__(cls) -> R2Client:
         if cls._instance is None:
@@ -165,6 +202,8 @@ class R2Client:
             config=Config(
                 signature_version="s3v4",
                 retries={"max_attempts": 3, "mode": "adaptive"},
+                # Enough pooled connections for the widest parallel transfer
+                max_pool_connections=_MAX_CONCURRENCY + _READER_PREFETCH,
                 # Cloudflare R2 only supports path-style addressing
                 # (<endpoint>/<bucket>), not virtual-hosted-style
                 # (<bucket>.<endpoint>). botocore's "auto" default can pick
@@ -293,24 +332,28 @@ class R2Client:
     ) -> str:
         """
         Upload a local file to R2.
-        Uses multipart for files >10 MB automatically.
-        Returns the R2 key on success.
+        Part size and parallelism are chosen from the file size
+        (see _transfer_config).  Returns the R2 key on success.
         """
+        size = Path(local_path).stat().st_size
         extra: Dict = {}
         if content_type:
             extra["ContentType"] = content_type
         if metadata:
             extra["Metadata"] = {str(k): str(v) for k, v in metadata.items()}
 
+        started = time.monotonic()
         self._s3.upload_file(
             local_path,
             self._bucket,
             r2_key,
             ExtraArgs=extra if extra else None,
-            Config=_TRANSFER_CONFIG,
+            Config=self._transfer_config(size),
         )
-        size = Path(local_path).stat().st_size
-        logger.info("r2_upload_file", key=r2_key, bytes=size)
+        elapsed = time.monotonic() - started
+        self._record_throughput(size, elapsed)
+        _usage().record_put(r2_key, size)
+        logger.info("r2_upload_file", key=r2_key, bytes=size, seconds=round(elapsed, 2))
         return r2_key
 
     @retry(
@@ -332,6 +375,7 @@ class R2Client:
             r2_key,
             ExtraArgs={"ContentType": content_type},
         )
+        _usage().record_put(r2_key, len(data))
         logger.info("r2_upload_bytes", key=r2_key, bytes=len(data))
         return r2_key
 
@@ -342,16 +386,30 @@ class R2Client:
         wait=wait_exponential(multiplier=1, min=2, max=12),
         reraise=True,
     )
-    def download_file(self, r2_key: str, local_path: str) -> str:
+    def download_file(
+        self, r2_key: str, local_path: str, size_bytes: Optional[int] = None,
+    ) -> str:
         """
         Download an R2 object to a local file.
+        Objects above _SINGLE_PART_MAX are fetched as parallel ranged GETs.
+        Pass size_bytes when already known to skip the HEAD request.
         Creates parent directories automatically.
         Returns local_path on success.
         """
         Path(local_path).parent.mkdir(parents=True, exist_ok=True)
-        self._s3.download_file(self._bucket, r2_key, local_path)
+        if size_bytes is None:
+            size_bytes = self.get_file_size(r2_key)
+        started = time.monotonic()
+        self._s3.download_file(
+            self._bucket, r2_key, local_path, Config=self._transfer_config(size_bytes),
+        )
+        elapsed = time.monotonic() - started
         size = Path(local_path).stat().st_size
-        logger.info("r2_download_file", key=r2_key, bytes=size, dest=local_path)
+        self._record_throughput(size, elapsed)
+        logger.info(
+            "r2_download_file", key=r2_key, bytes=size, dest=local_path,
+            seconds=round(elapsed, 2),
+        )
         return local_path
 
     @retry(
@@ -366,6 +424,37 @@ class R2Client:
         logger.info("r2_download_bytes", key=r2_key, bytes=len(data))
         return data
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=12),
+        reraise=True,
+    )
+    def read_range(self, r2_key: str, offset: int, length: int) -> bytes:
+        """Return `length` bytes of an object starting at `offset` (one ranged GET)."""
+        started = time.monotonic()
+        response = self._s3.get_object(
+            Bucket=self._bucket, Key=r2_key, Range=f"bytes={offset}-{offset + length - 1}",
+        )
+        data: bytes = response["Body"].read()
+        self._record_throughput(len(data), time.monotonic() - started)
+        return data
+
+    def open_reader(
+        self,
+        r2_key: str,
+        block_size: int = _READER_BLOCK,
+        prefetch: int = _READER_PREFETCH,
+    ) -> "R2RangeReader":
+        """
+        Random-access reader over an R2 object, backed by parallel ranged GETs
+        with read-ahead.  Use as a context manager, or call close().
+        Raises FileNotFoundError if the object does not exist.
+        """
+        size = self.get_file_size(r2_key)
+        if size is None:
+            raise FileNotFoundError(f"R2 object not found: {r2_key}")
+        return R2RangeReader(self, r2_key, size, block_size, prefetch)
+
     # ── Delete operations ─────────────────────────────────────────────────────
 
     def delete_file(self, r2_key: str) -> bool:
@@ -375,6 +464,7 @@ class R2Client:
         """
         try:
             self._s3.delete_object(Bucket=self._bucket, Key=r2_key)
+            _usage().record_delete([r2_key])
             logger.info("r2_delete_file", key=r2_key)
             return True
         except ClientError as exc:
@@ -391,14 +481,41 @@ class R2Client:
         paginator = self._s3.get_paginator("list_objects_v2")
         for page in paginator.paginate(Bucket=self._bucket, Prefix=prefix):
             objects = page.get("Contents", [])
-            if not objects:
-                continue
-            batch = {"Objects": [{"Key": obj["Key"]} for obj in objects]}
-            self._s3.delete_objects(Bucket=self._bucket, Delete=batch)
-            deleted += len(objects)
+            if objects:
+                deleted += len(self.delete_keys([obj["Key"] for obj in objects]))
         logger.info("r2_delete_prefix", prefix=prefix, deleted=deleted)
         return deleted
 
+    def delete_keys(self, keys: Sequence[str]) -> List[str]:
+        """
+        Delete many objects with batched delete_objects calls of up to
+        _DELETE_BATCH keys each.  Per-key failures are logged, not raised.
+        Returns the keys that were deleted.
+        """
+        deleted: List[str] = []
+        keys = list(keys)
+        for start in range(0, len(keys), _DELETE_BATCH):
+            batch = keys[start:start + _DELETE_BATCH]
+            try:
+                response = self._s3.delete_objects(
+                    Bucket=self._bucket,
+                    Delete={"Objects": [{"Key": k} for k in batch], "Quiet": True},
+                )
+            except ClientError as exc:
+                logger.warning("r2_delete_batch_failed", keys=len(batch), error=str(exc)[:200])
+                continue
+            errors = response.get("Errors", [])
+            if errors:
+                logger.warning(
+                    "r2_delete_batch_partial", failed=len(errors),
+                    first_error=errors[0].get("Message", "")[:120],
+                )
+            failed = {e.get("Key") for e in errors}
+            done = [k for k in batch if k not in failed]
+            _usage().record_delete(done)
+            deleted.extend(done)
+        return deleted
+
     # ── Existence & metadata ──────────────────────────────────────────────────
 
     def file_exists(self, r2_key: str) -> bool:
@@ -462,11 +579,17 @@ class R2Client:
 
     # ── Storage usage ─────────────────────────────────────────────────────────
 
-    def get_storage_usage_bytes(self, prefix: str = "") -> int:
+    def get_storage_usage_bytes(self, prefix: str = "", exact: bool = False) -> int:
         """
-        Sum up the byte size of all objects under a prefix (or entire bucket).
-        Use sparingly — iterates every object.
+        Byte size of all objects under a prefix (or entire bucket).
+        Answered from the incremental usage index (storage/storage_usage.py)
+        when it covers the prefix.  exact=True, an untracked prefix, or an
+        index that was never reconciled falls back to iterating every object.
         """
+        if not exact:
+            counted = _usage().bytes_under(prefix)
+            if counted is not None:
+                return counted
         total = 0
         paginator = self._s3.get_paginator("list_objects_v2")
         params: Dict = {"Bucket": self._bucket}
@@ -496,6 +619,37 @@ class R2Client:
         """Compute the SHA-256 hash of a bytes object."""
         return hashlib.sha256(data).hexdigest()
 
+    # ── Transfer tuning ───────────────────────────────────────────────────────
+
+    def _transfer_config(self, size_bytes: Optional[int]) -> TransferConfig:
+        if size_bytes is None or size_bytes <= _SINGLE_PART_MAX:
+            return TransferConfig(multipart_threshold=_SINGLE_PART_MAX + 1, use_threads=False)
+
+        part = math.ceil(size_bytes / _TARGET_PARTS / _MIB) * _MIB
+        part = min(_MAX_PART, max(_MIN_PART, part))
+        streams = min(_MAX_CONCURRENCY, math.ceil(size_bytes / part))
+        throughput = self._throughput
+        if throughput is not None and throughput < _SLOW_LINK_BYTES_PER_S:
+            streams = min(streams, _SLOW_LINK_CONCURRENCY)
+        return TransferConfig(
+            multipart_threshold=_SINGLE_PART_MAX,
+            multipart_chunksize=part,
+            max_concurrency=streams,
+            use_threads=streams > 1,
+        )
+
+    @classmethod
+    def _record_throughput(cls, size_bytes: int, seconds: float) -> None:
+        # Small objects are dominated by request latency, not bandwidth
+        if size_bytes < _MIN_PART or seconds <= 0:
+            return
+        sample = size_bytes / seconds
+        with cls._throughput_lock:
+            prev = cls._throughput
+            cls._throughput = sample if prev is None else (
+                _THROUGHPUT_ALPHA * sample + (1 - _THROUGHPUT_ALPHA) * prev
+            )
+
     # ── Properties ────────────────────────────────────────────────────────────
 
     @property
@@ -503,6 +657,72 @@ class R2Client:
         return self._bucket
 
 
+def _usage():
+    from storage.storage_usage import get_storage_usage
+    return get_storage_usage()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Ranged reader
+# ─────────────────────────────────────────────────────────────────────────────
+
+class R2RangeReader:
+    """
+    Random-access view of one R2 object.  The object is fetched in
+    block_size ranged GETs on a small thread pool.  Each read() also
+    schedules the next `prefetch` blocks, so sequential consumers rarely
+    wait on the network.  Blocks behind the read position are dropped, so
+    memory stays at about (read size + prefetch × block_size).
+    """
+
+    def __init__(
+        self, client: R2Client, r2_key: str, size: int, block_size: int, prefetch: int,
+    ) -> None:
+        self.key  = r2_key
+        self.size = size
+        self._client   = client
+        self._block    = block_size
+        self._prefetch = prefetch
+        self._pool     = ThreadPoolExecutor(max_workers=max(1, prefetch), thread_name_prefix="r2_range")
+        self._blocks: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+
+    def read(self, offset: int, length: int) -> bytes:
+        if offset < 0 or offset >= self.size or length <= 0:
+            return b""
+        length = min(length, self.size - offset)
+        first = offset // self._block
+        last  = (offset + length - 1) // self._block
+        last_block = (self.size - 1) // self._block
+        with self._lock:
+            for idx in [i for i in self._blocks if i < first]:
+                self._blocks.pop(idx).cancel()
+            for idx in range(first, min(last + self._prefetch, last_block) + 1):
+                if idx not in self._blocks:
+                    self._blocks[idx] = self._pool.submit(self._fetch, idx)
+            wanted = [self._blocks[i] for i in range(first, last + 1)]
+        data = b"".join(f.result() for f in wanted)
+        start = offset - first * self._block
+        return data[start:start + length]
+
+    def close(self) -> None:
+        with self._lock:
+            for fut in self._blocks.values():
+                fut.cancel()
+            self._blocks.clear()
+        self._pool.shutdown(wait=False)
+
+    def __enter__(self) -> "R2RangeReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _fetch(self, idx: int) -> bytes:
+        start = idx * self._block
+        return self._client.read_range(self.key, start, min(self._block, self.size - start))
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Module-level accessor
 # ─────────────────────────────────────────────────────────────────────────────
@@ -5,12 +5,18 @@ Singleton Redis client backed by Upstash.
 Covers every real-time coordination need of the system:
 
   • API quota tracking   — ElevenLabs (per key), YouTube uploads (per key)
-  • Deduplication        — script hash, title hash, topic cooldown
+  • Deduplication        — script hash, title hash, topic cooldown,
+                           MinHash/LSH near-duplicate index
   • Job locking          — prevent duplicate production runs
   • Voice rotation state — enforce gender/voice-ID consecutive limits
+                           (one hash, updated atomically by _VOICE_STATE_LUA)
   • Hook recency         — sliding window of recently used hooks
   • System health        — Dead Man's Switch heartbeat
-  • Cache                — growth rules, channel config (1-hour TTL)
+  • Storage accounting   — per-prefix R2 byte / object counters
+                           (updated atomically by _STORAGE_USAGE_LUA)
+  • Cache                — growth rules, channel config (1-hour TTL),
+                           LLM responses (24-hour TTL),
+                           vision verdicts (30-day TTL)
 
 Required GitHub Secret
 ──────────────────────
@@ -25,8 +31,9 @@ import logging
 import os
 import time
 import hashlib
+import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import redis
 import structlog
@@ -49,20 +56,29 @@ class RK:
     # ── API quota ──────────────────────────────────────────────────────────────
     # Resets monthly (ElevenLabs) or daily (YouTube)
     TTS_QUOTA        = "yta:quota:tts:{key_index}:{month}"       # chars used
+    TTS_QUOTA_FLOOR  = "yta:quota:tts_floor:{key_index}:{month}" # last absolute SET (block / reset)
     YT_UPLOAD_QUOTA  = "yta:quota:yt_upload:{key_index}:{date}"  # API units used
     YT_MGMT_QUOTA    = "yta:quota:yt_mgmt:{date}"                # management key units
 
+    # ── YouTube resumable upload sessions ─────────────────────────────────────
+    YT_UPLOAD_SESSION = "yta:upload:session:{upload_id}"          # TTL = 6 days
+
     # ── Deduplication ─────────────────────────────────────────────────────────
     SCRIPT_HASH      = "yta:dedup:script:{hash}"                 # TTL = 90 days
     TITLE_HASH       = "yta:dedup:title:{hash}"                  # TTL = 60 days
     TOPIC_COOLDOWN   = "yta:dedup:topic:{topic_id}"              # TTL = cooldown_days
+    DEDUP_LSH_BUCKET = "yta:dedup:lsh2:{kind}:{band}:{bucket}"    # set of doc ids, no TTL
+    DEDUP_LSH_DOCS   = "yta:dedup:lsh2_sigs:{kind}"               # hash doc id → signature, no TTL
+    DEDUP_LSH_TEXTS  = "yta:dedup:lsh2_texts:{kind}"              # hash doc id → original text, no TTL
+    DEDUP_LSH_READY  = "yta:dedup:lsh2_ready"                     # set once the index is backfilled
 
     # ── Job locking ───────────────────────────────────────────────────────────
     JOB_LOCK         = "yta:lock:job:{queue_id}"                 # TTL = 1 hour
     PROD_LOCK        = "yta:lock:prod:{video_type}"              # TTL = 2 hours
 
     # ── Voice rotation state ──────────────────────────────────────────────────
-    VOICE_STATE      = "yta:voice:state"                          # no TTL
+    VOICE_STATE      = "yta:voice:rotation"                       # hash, no TTL
+    VOICE_STATE_LEGACY = "yta:voice:state"                        # pre-hash JSON blob, migrated on first use
 
     # ── Hook recency (sorted set: hook_id → unix timestamp) ───────────────────
     HOOKS_RECENT     = "yta:hooks:recent"                         # no TTL
@@ -71,10 +87,23 @@ class RK:
     SYSTEM_HEALTH    = "yta:system:health"                        # TTL = 6 hours
     LAST_PUBLISH     = "yta:system:last_publish:{video_type}"
 
+    # ── R2 storage accounting (see storage/storage_usage.py) ─────────────────
+    STORAGE_USAGE    = "yta:storage:usage"                        # hash "{prefix}:bytes|objects" → int, no TTL
+    STORAGE_OBJECTS  = "yta:storage:objects"                      # hash object key → size, no TTL
+    STORAGE_RECONCILED = "yta:storage:reconciled_at"              # unix ts of the last full scan
+    STORAGE_RECONCILE_LOCK = "yta:lock:storage_reconcile"         # TTL = 30 min
+
     # ── Cache ─────────────────────────────────────────────────────────────────
     GROWTH_RULES     = "yta:cache:growth_rules"                   # TTL = 1 hour
     CHANNEL_CONFIG   = "yta:cache:channel_config"                 # TTL = 1 hour
     WAR_ROOM         = "yta:cache:war_room"                       # TTL = 5 min
+    CONFIG_VERSION   = "yta:cache:config_version"                 # no TTL, bumped on rule/config writes
+    LLM_RESPONSE     = "yta:cache:llm:{fingerprint}"              # TTL = 24 hours
+    VISION_VERDICT   = "yta:cache:vision:{fingerprint}"           # TTL = 30 days
+
+    # ── Cascade routing ───────────────────────────────────────────────────────
+    CASCADE_STATS    = "yta:cascade:stats:{category}"             # TTL = 7 days
+    CIRCUIT_BREAKER  = "yta:cascade:breaker:{category}:{provider}"  # TTL = 24 hours
 
     # ─────────────────────────────────────────────────────────────────────────
     # Builder helpers
@@ -86,6 +115,12 @@ class RK:
             month = datetime.utcnow().strftime("%Y-%m")
         return cls.TTS_QUOTA.format(key_index=key_index, month=month)
 
+    @classmethod
+    def tts_quota_floor(cls, key_index: int, month: Optional[str] = None) -> str:
+        if month is None:
+            month = datetime.utcnow().strftime("%Y-%m")
+        return cls.TTS_QUOTA_FLOOR.format(key_index=key_index, month=month)
+
     @classmethod
     def yt_upload_quota(cls, key_index: int, date: Optional[str] = None) -> str:
         if date is None:
@@ -98,6 +133,10 @@ class RK:
             date = datetime.utcnow().strftime("%Y-%m-%d")
         return cls.YT_MGMT_QUOTA.format(date=date)
 
+    @classmethod
+    def yt_upload_session(cls, upload_id: str) -> str:
+        return cls.YT_UPLOAD_SESSION.format(upload_id=upload_id)
+
     @classmethod
     def script_hash(cls, text: str) -> str:
         h = hashlib.sha256(text.encode("utf-8", errors="replace")).hexdigest()[:32]
@@ -112,6 +151,18 @@ class RK:
     def topic_cooldown(cls, topic_id: str) -> str:
         return cls.TOPIC_COOLDOWN.format(topic_id=topic_id)
 
+    @classmethod
+    def dedup_lsh_bucket(cls, kind: str, band: int, bucket: str) -> str:
+        return cls.DEDUP_LSH_BUCKET.format(kind=kind, band=band, bucket=bucket)
+
+    @classmethod
+    def dedup_lsh_docs(cls, kind: str) -> str:
+        return cls.DEDUP_LSH_DOCS.format(kind=kind)
+
+    @classmethod
+    def dedup_lsh_texts(cls, kind: str) -> str:
+        return cls.DEDUP_LSH_TEXTS.format(kind=kind)
+
     @classmethod
     def job_lock(cls, queue_id: str) -> str:
         return cls.JOB_LOCK.format(queue_id=queue_id)
@@ -124,6 +175,299 @@ class RK:
     def last_publish(cls, video_type: str) -> str:
         return cls.LAST_PUBLISH.format(video_type=video_type)
 
+    @classmethod
+    def llm_response(cls, fingerprint: str) -> str:
+        return cls.LLM_RESPONSE.format(fingerprint=fingerprint)
+
+    @classmethod
+    def vision_verdict(cls, fingerprint: str) -> str:
+        return cls.VISION_VERDICT.format(fingerprint=fingerprint)
+
+    @classmethod
+    def cascade_stats(cls, category: str) -> str:
+        return cls.CASCADE_STATS.format(category=category)
+
+    @classmethod
+    def circuit_breaker(cls, category: str, provider: str) -> str:
+        return cls.CIRCUIT_BREAKER.format(category=category, provider=provider)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Lua scripts (run atomically server-side)
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Circuit breaker transition.  Mirrors cascade_manager._breaker_transition.
+# KEYS[1] = breaker hash
+# ARGV    = op, now, threshold, reset_timeout, max_probes, probe_timeout, ttl
+# Returns   {state, failures, opened_at, probes, allowed, probe_at}
+_CIRCUIT_BREAKER_LUA = """
+local k = KEYS[1]
+local op = ARGV[1]
+local now = tonumber(ARGV[2])
+local threshold = tonumber(ARGV[3])
+local reset_timeout = tonumber(ARGV[4])
+local max_probes = tonumber(ARGV[5])
+local probe_timeout = tonumber(ARGV[6])
+local ttl = tonumber(ARGV[7])
+
+local h = redis.call('HMGET', k, 'state', 'failures', 'opened_at', 'probes', 'probe_at')
+local state = h[1] or 'closed'
+local failures = tonumber(h[2]) or 0
+local opened_at = tonumber(h[3]) or 0
+local probes = tonumber(h[4]) or 0
+local probe_at = tonumber(h[5]) or 0
+
+if state == 'open' and now - opened_at >= reset_timeout then
+  state = 'half_open'
+  probes = 0
+end
+if state == 'half_open' and probes >= max_probes and now - probe_at >= probe_timeout then
+  probes = 0
+end
+
+local allowed = 0
+if state == 'closed' or (state == 'half_open' and probes < max_probes) then
+  allowed = 1
+end
+
+if op == 'allow' then
+  if state == 'half_open' and allowed == 1 then
+    probes = probes + 1
+    probe_at = now
+  end
+elseif op == 'success' then
+  state = 'closed'
+  failures = 0
+  opened_at = 0
+  probes = 0
+elseif op == 'failure' then
+  if state == 'half_open' then
+    state = 'open'
+    opened_at = now
+    failures = math.max(failures, threshold)
+  else
+    failures = failures + 1
+    if state == 'closed' and failures >= threshold then
+      state = 'open'
+      opened_at = now
+    end
+  end
+elseif op == 'force_open' then
+  state = 'open'
+  opened_at = now
+  failures = math.max(failures, threshold)
+  probes = 0
+end
+
+if op ~= 'peek' then
+  if state == 'closed' and failures == 0 then
+    redis.call('DEL', k)
+  else
+    redis.call('HSET', k, 'state', state, 'failures', failures,
+               'opened_at', tostring(opened_at), 'probes', probes,
+               'probe_at', tostring(probe_at))
+    redis.call('EXPIRE', k, ttl)
+  end
+end
+return {state, failures, tostring(opened_at), probes, allowed, tostring(probe_at)}
+"""
+
+_BREAKER_TTL_SECONDS = 86_400
+
+# Pick the quota counter with the most headroom and reserve units on it.
+# Ties go to the earliest key, matching the old get_best_* loops.
+# KEYS    = candidate quota counters, in key-index order
+# ARGV    = limit, units, expire_at (unix seconds)
+# Returns   {position in KEYS (1-based) or 0 if none fits, new usage}
+_QUOTA_RESERVE_LUA = """
+local limit = tonumber(ARGV[1])
+local units = tonumber(ARGV[2])
+local best, best_remaining = 0, -1
+for i, k in ipairs(KEYS) do
+  local remaining = limit - (tonumber(redis.call('GET', k)) or 0)
+  if remaining >= units and remaining > best_remaining then
+    best, best_remaining = i, remaining
+  end
+end
+if best == 0 then
+  return {0, 0}
+end
+local used = redis.call('INCRBY', KEYS[best], units)
+redis.call('EXPIREAT', KEYS[best], tonumber(ARGV[3]))
+return {best, used}
+"""
+
+# Give back a reservation whose work never happened.  The counter never
+# drops below its floor: the value of the last absolute SET (a deliberate
+# block, or a reset).  A block therefore survives releases of reservations
+# made before it, while a reservation that filled the key to exactly the
+# limit is still released.
+# KEYS[1] = quota counter
+# KEYS[2] = floor key (optional)
+# ARGV    = units
+_QUOTA_RELEASE_LUA = """
+local used = tonumber(redis.call('GET', KEYS[1])) or 0
+local floor = 0
+if KEYS[2] then
+  floor = tonumber(redis.call('GET', KEYS[2])) or 0
+end
+local give = math.min(tonumber(ARGV[1]), used - floor)
+if give <= 0 then
+  return used
+end
+return redis.call('DECRBY', KEYS[1], give)
+"""
+
+_YT_QUOTA_TTL_SECONDS = 172_800   # 2 days (covers timezone edge cases)
+
+# Voice rotation state as one hash, read and updated in a single call.
+# KEYS[1] = state hash, KEYS[2] = legacy JSON blob (migrated once, then deleted)
+# ARGV    = "peek"
+#         | "record", gender ("" = leave gender counters), voice_id
+#         | "assign", gender, max_consecutive, voice_id...
+#         | "restore", expected state (5 fields), prior state (5 fields)
+#           puts the prior state back if the hash still holds the expected
+#           one, i.e. nobody recorded a voice since (undoes an "assign")
+# Returns   {chosen voice_id ("1" / "" for restore), last_gender, last_voice_id,
+#            female_consecutive, male_consecutive, voice_id_consecutive,
+#            the same five fields as they were before this call}
+_VOICE_STATE_LUA = """
+local h = KEYS[1]
+local op = ARGV[1]
+
+if redis.call('EXISTS', h) == 0 then
+  local raw = redis.call('GET', KEYS[2])
+  if raw then
+    local ok, old = pcall(cjson.decode, raw)
+    if ok and type(old) == 'table' then
+      local function s(v) if type(v) == 'string' then return v end return '' end
+      redis.call('HSET', h,
+        'last_gender', s(old.last_gender), 'last_voice_id', s(old.last_voice_id),
+        'female_consecutive', tonumber(old.female_consecutive) or 0,
+        'male_consecutive', tonumber(old.male_consecutive) or 0,
+        'voice_id_consecutive', tonumber(old.voice_id_consecutive) or 0)
+    end
+    redis.call('DEL', KEYS[2])
+  end
+end
+
+local v = redis.call('HMGET', h, 'last_gender', 'last_voice_id',
+                     'female_consecutive', 'male_consecutive', 'voice_id_consecutive')
+local last_gender = v[1] or ''
+local last_voice = v[2] or ''
+local fc = tonumber(v[3]) or 0
+local mc = tonumber(v[4]) or 0
+local vc = tonumber(v[5]) or 0
+local before = {last_gender, last_voice, fc, mc, vc}
+
+local chosen = ''
+local gender = ARGV[2] or ''
+if op == 'record' then
+  chosen = ARGV[3]
+elseif op == 'assign' then
+  local maxc = tonumber(ARGV[3])
+  local n = #ARGV - 3
+  local idx = nil
+  for i = 4, #ARGV do
+    if ARGV[i] == last_voice then idx = i - 3 end
+  end
+  chosen = ARGV[4]
+  if vc >= maxc and n > 1 then
+    if idx then chosen = ARGV[4 + (idx % n)] end
+  elseif idx then
+    chosen = last_voice
+  end
+elseif op == 'restore' then
+  if last_gender == ARGV[2] and last_voice == ARGV[3] and fc == tonumber(ARGV[4])
+     and mc == tonumber(ARGV[5]) and vc == tonumber(ARGV[6]) then
+    last_gender, last_voice = ARGV[7], ARGV[8]
+    fc, mc, vc = tonumber(ARGV[9]), tonumber(ARGV[10]), tonumber(ARGV[11])
+    redis.call('HSET', h, 'last_gender', last_gender, 'last_voice_id', last_voice,
+               'female_consecutive', fc, 'male_consecutive', mc, 'voice_id_consecutive', vc)
+    chosen = '1'
+  end
+end
+
+if op == 'record' or op == 'assign' then
+  if gender == 'female' then
+    fc = fc + 1
+    mc = 0
+  elseif gender == 'male' then
+    mc = mc + 1
+    fc = 0
+  end
+  if last_voice == chosen then vc = vc + 1 else vc = 1 end
+  if gender ~= '' then last_gender = gender end
+  last_voice = chosen
+  redis.call('HSET', h, 'last_gender', last_gender, 'last_voice_id', last_voice,
+             'female_consecutive', fc, 'male_consecutive', mc, 'voice_id_consecutive', vc)
+end
+return {chosen, last_gender, last_voice, fc, mc, vc,
+        before[1], before[2], before[3], before[4], before[5]}
+"""
+
+# Owner-checked lock release / extend.  A lock whose TTL expired and was
+# taken by another run is never deleted or extended by the previous holder.
+# KEYS[1] = lock key
+# ARGV    = op ("release" | "extend"), owner token, ttl seconds
+_LOCK_LUA = """
+if redis.call('GET', KEYS[1]) ~= ARGV[2] then
+  return 0
+end
+if ARGV[1] == 'release' then
+  return redis.call('DEL', KEYS[1])
+end
+return redis.call('EXPIRE', KEYS[1], tonumber(ARGV[3]))
+"""
+
+# Per-prefix storage counters.  STORAGE_OBJECTS remembers each object's
+# size, so overwriting a key counts only the size difference, and deleting
+# a key that was never recorded changes nothing.
+# KEYS[1] = usage hash, KEYS[2] = object-size hash
+# ARGV    = op ("put" | "delete"), prefix,
+#           then key, size pairs (put) or keys (delete)
+_STORAGE_USAGE_LUA = """
+local op, prefix = ARGV[1], ARGV[2]
+local bytes, objects = 0, 0
+if op == 'put' then
+  for i = 3, #ARGV, 2 do
+    local old = redis.call('HGET', KEYS[2], ARGV[i])
+    redis.call('HSET', KEYS[2], ARGV[i], ARGV[i + 1])
+    bytes = bytes + tonumber(ARGV[i + 1]) - (tonumber(old) or 0)
+    if not old then objects = objects + 1 end
+  end
+else
+  for i = 3, #ARGV do
+    local old = redis.call('HGET', KEYS[2], ARGV[i])
+    if old then
+      redis.call('HDEL', KEYS[2], ARGV[i])
+      bytes = bytes - tonumber(old)
+      objects = objects - 1
+    end
+  end
+end
+if bytes ~= 0 then redis.call('HINCRBY', KEYS[1], prefix .. ':bytes', bytes) end
+if objects ~= 0 then redis.call('HINCRBY', KEYS[1], prefix .. ':objects', objects) end
+return bytes
+"""
+
+_STORAGE_WRITE_BATCH = 1_000
+
+
+def _text(value: Any) -> str:
+    return str(value) if value is not None else ""
+
+
+def _voice_state(fields: Sequence[Any]) -> Dict[str, Any]:
+    last_gender, last_voice_id, female, male, voice_cons = fields
+    return {
+        "last_gender":          _text(last_gender) or None,
+        "last_voice_id":        _text(last_voice_id) or None,
+        "female_consecutive":   int(female),
+        "male_consecutive":     int(male),
+        "voice_id_consecutive": int(voice_cons),
+    }
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Singleton client
@@ -138,6 +482,12 @@ class RedisClient:
     _instance: Optional[RedisClient] = None
     _redis: Optional[redis.Redis] = None
     _initialized: bool = False
+    _breaker_script: Optional[Any] = None
+    _reserve_script: Optional[Any] = None
+    _voice_script:   Optional[Any] = None
+    _lock_script:    Optional[Any] = None
+    _release_script: Optional[Any] = None
+    _storage_script: Optional[Any] = None
 
     def __new__(cls) -> RedisClient:
         if cls._instance is None:
@@ -163,6 +513,7 @@ class RedisClient:
             health_check_interval=30,
         )
         self._redis.ping()
+        self._lock_token = f"{os.getpid()}:{uuid.uuid4().hex}"
         host = url.split("@")[-1].split(":")[0] if "@" in url else "unknown"
         logger.info("redis_client_ready", host=host[:20] + "…")
 
@@ -274,13 +625,18 @@ class RedisClient:
             succession (or concurrently with a production run) still results
             in exactly 0, not a race-condition artefact.
 
+        The value is also stored as the counter's floor, so
+        release_tts_chars() cannot undo a block by giving back a reservation
+        made before it.
+
         The expiry is always set to the last second of the current calendar
         month so the key auto-cleans even if the reset script is never run.
         """
-        rkey = RK.tts_quota(key_index)
+        expire_at = self._end_of_month_unix()
         pipe = self.r.pipeline(transaction=True)
-        pipe.set(rkey, char_count)
-        pipe.expireat(rkey, self._end_of_month_unix())
+        for rkey in (RK.tts_quota(key_index), RK.tts_quota_floor(key_index)):
+            pipe.set(rkey, char_count)
+            pipe.expireat(rkey, expire_at)
         pipe.execute()
 
     def add_tts_chars_used(self, key_index: int, char_count: int) -> int:
@@ -292,6 +648,10 @@ class RedisClient:
         results = pipe.execute()
         return int(results[0])
 
+    def get_tts_usage(self, key_indexes: Sequence[int] = (1, 2, 3)) -> Dict[int, int]:
+        """Characters used this month per TTS key, read in one MGET."""
+        return self._mget_counters([RK.tts_quota(i) for i in key_indexes], key_indexes)
+
     def get_best_tts_key(
         self,
         monthly_limit: int = 100_000,
@@ -301,21 +661,32 @@ class RedisClient:
         Return the key index (1, 2, or 3) with the most remaining TTS chars.
         Returns None if all keys are exhausted for the month.
         Also falls back to key index 0 which represents the free edge-tts fallback.
+        Read-only; use reserve_tts_chars() to claim the characters as well.
         """
-        best_key: Optional[int] = None
-        best_remaining: int = -1
-
-        for idx in [1, 2, 3]:
-            used = self.get_tts_chars_used(idx)
-            remaining = monthly_limit - used
-            if remaining >= char_count_needed and remaining > best_remaining:
-                best_remaining = remaining
-                best_key = idx
-
+        best_key = self._best_counter(self.get_tts_usage(), monthly_limit, char_count_needed)
         if best_key is None:
             logger.warning("all_tts_keys_exhausted_falling_back_to_edge_tts")
         return best_key  # None → caller must use edge-tts
 
+    def reserve_tts_chars(
+        self,
+        char_count: int,
+        key_indexes: Sequence[int] = (1, 2, 3),
+        monthly_limit: int = 100_000,
+    ) -> Optional[int]:
+        """
+        Atomically pick the key in key_indexes with the most headroom for
+        char_count and add char_count to its monthly counter.  Returns the
+        key index, or None if none fits.  Undo with release_tts_chars().
+        """
+        return self._reserve(
+            [RK.tts_quota(i) for i in key_indexes], key_indexes,
+            monthly_limit, char_count, self._end_of_month_unix(),
+        )
+
+    def release_tts_chars(self, key_index: int, char_count: int) -> None:
+        self._release(RK.tts_quota(key_index), char_count, RK.tts_quota_floor(key_index))
+
     # ── YouTube Upload Quota ───────────────────────────────────────────────────
 
     def get_yt_upload_units_used(self, key_index: int) -> int:
@@ -332,6 +703,10 @@ class RedisClient:
         results = pipe.execute()
         return int(results[0])
 
+    def get_yt_upload_usage(self, key_indexes: Sequence[int] = (1, 2, 3)) -> Dict[int, int]:
+        """Upload units used today per key, read in one MGET."""
+        return self._mget_counters([RK.yt_upload_quota(i) for i in key_indexes], key_indexes)
+
     def get_best_yt_upload_key(
         self,
         units_per_upload: int = 1_600,
@@ -340,21 +715,69 @@ class RedisClient:
         """
         Return the upload key index (1, 2, or 3) with the most remaining quota.
         Returns None if all 3 keys are exhausted.
+        Read-only; use reserve_yt_upload_key() to claim the units as well.
         """
-        best_key: Optional[int] = None
-        best_remaining: int = -1
+        best_key = self._best_counter(self.get_yt_upload_usage(), daily_limit, units_per_upload)
+        if best_key is None:
+            logger.warning("all_yt_upload_keys_exhausted_for_today")
+        return best_key
+
+    def reserve_yt_upload_key(
+        self,
+        units_per_upload: int = 1_600,
+        daily_limit: int = 9_000,
+        key_indexes: Sequence[int] = (1, 2, 3),
+    ) -> Optional[int]:
+        """
+        Atomically pick the upload key with the most remaining quota and
+        charge units_per_upload to it.  Returns the key index, or None if
+        all keys are exhausted.  Undo with release_yt_upload_units().
+        """
+        key_index = self._reserve(
+            [RK.yt_upload_quota(i) for i in key_indexes], key_indexes,
+            daily_limit, units_per_upload, int(time.time()) + _YT_QUOTA_TTL_SECONDS,
+        )
+        if key_index is None:
+            logger.warning("all_yt_upload_keys_exhausted_for_today")
+        return key_index
+
+    def release_yt_upload_units(self, key_index: int, units: int = 1_600) -> None:
+        self._release(RK.yt_upload_quota(key_index), units)
+
+    # ── Quota helpers ─────────────────────────────────────────────────────────
 
-        for idx in [1, 2, 3]:
-            used = self.get_yt_upload_units_used(idx)
-            remaining = daily_limit - used
-            if remaining >= units_per_upload and remaining > best_remaining:
+    def _mget_counters(self, keys: List[str], key_indexes: Sequence[int]) -> Dict[int, int]:
+        values = self.r.mget(keys)
+        return {idx: int(v) if v else 0 for idx, v in zip(key_indexes, values)}
+
+    @staticmethod
+    def _best_counter(usage: Dict[int, int], limit: int, needed: int) -> Optional[int]:
+        best_key: Optional[int] = None
+        best_remaining = -1
+        for idx, used in usage.items():
+            remaining = limit - used
+            if remaining >= needed and remaining > best_remaining:
                 best_remaining = remaining
                 best_key = idx
-
-        if best_key is None:
-            logger.warning("all_yt_upload_keys_exhausted_for_today")
         return best_key
 
+    def _reserve(
+        self, keys: List[str], key_indexes: Sequence[int], limit: int, units: int, expire_at: int,
+    ) -> Optional[int]:
+        if self._reserve_script is None:
+            self._reserve_script = self.r.register_script(_QUOTA_RESERVE_LUA)
+        position, used = self._reserve_script(keys=keys, args=[limit, units, expire_at])
+        if not int(position):
+            return None
+        key_index = key_indexes[int(position) - 1]
+        logger.debug("quota_reserved", key=keys[int(position) - 1], units=units, used=int(used))
+        return key_index
+
+    def _release(self, key: str, units: int, floor_key: Optional[str] = None) -> None:
+        if self._release_script is None:
+            self._release_script = self.r.register_script(_QUOTA_RELEASE_LUA)
+        self._release_script(keys=[key, floor_key] if floor_key else [key], args=[units])
+
     # ── YouTube Management Quota ───────────────────────────────────────────────
 
     def get_yt_mgmt_units_used(self) -> int:
@@ -407,12 +830,14 @@ class RedisClient:
         """
         Atomically acquire an exclusive lock for a production job.
         Returns True if the lock was acquired (i.e. not already held).
+        The lock holds this process's owner token; release and extend only
+        act on a lock this process still owns.
         """
-        result = self.r.set(RK.job_lock(queue_id), "1", nx=True, ex=ttl_seconds)
+        result = self.r.set(RK.job_lock(queue_id), self._lock_token, nx=True, ex=ttl_seconds)
         return result is True
 
     def release_job_lock(self, queue_id: str) -> None:
-        self.r.delete(RK.job_lock(queue_id))
+        self._lock_op("release", RK.job_lock(queue_id))
 
     def acquire_production_lock(
         self, video_type: str, ttl_seconds: int = 7_200
@@ -422,16 +847,24 @@ class RedisClient:
         Returns True if lock was acquired.
         """
         result = self.r.set(
-            RK.prod_lock(video_type), "1", nx=True, ex=ttl_seconds
+            RK.prod_lock(video_type), self._lock_token, nx=True, ex=ttl_seconds
         )
         return result is True
 
     def release_production_lock(self, video_type: str) -> None:
-        self.r.delete(RK.prod_lock(video_type))
+        self._lock_op("release", RK.prod_lock(video_type))
 
-    def extend_job_lock(self, queue_id: str, extra_seconds: int = 1_800) -> None:
-        """Extend an existing job lock TTL (call mid-pipeline for long tasks)."""
-        self.r.expire(RK.job_lock(queue_id), extra_seconds)
+    def extend_job_lock(self, queue_id: str, extra_seconds: int = 1_800) -> bool:
+        """
+        Extend an existing job lock TTL (call mid-pipeline for long tasks).
+        Returns False if this process no longer holds the lock.
+        """
+        return self._lock_op("extend", RK.job_lock(queue_id), extra_seconds)
+
+    def _lock_op(self, op: str, key: str, ttl_seconds: int = 0) -> bool:
+        if self._lock_script is None:
+            self._lock_script = self.r.register_script(_LOCK_LUA)
+        return bool(self._lock_script(keys=[key], args=[op, self._lock_token, ttl_seconds]))
 
     # ═════════════════════════════════════════════════════════════════════════
     # VOICE ROTATION STATE
@@ -443,45 +876,61 @@ class RedisClient:
         Keys: last_gender, last_voice_id, female_consecutive,
               male_consecutive, voice_id_consecutive.
         """
-        raw = self.r.get(RK.VOICE_STATE)
-        if raw:
-            return json.loads(raw)
-        return {
-            "last_gender": None,
-            "last_voice_id": None,
-            "female_consecutive": 0,
-            "male_consecutive": 0,
-            "voice_id_consecutive": 0,
-        }
+        return self._voice_op("peek")[1]
 
-    def update_voice_state(self, gender: str, voice_id: str) -> Dict[str, Any]:
-        """
-        Update rotation counters after a voice is selected.
-        Returns the new state dict.
+    def assign_voice(
+        self, gender: str, voice_ids: List[str], max_consecutive: int
+    ) -> Tuple[str, Dict[str, Any]]:
         """
-        state = self.get_voice_state()
-
-        if gender == "female":
-            state["female_consecutive"] = (state.get("female_consecutive") or 0) + 1
-            state["male_consecutive"] = 0
-        else:
-            state["male_consecutive"] = (state.get("male_consecutive") or 0) + 1
-            state["female_consecutive"] = 0
+        Pick the voice for the next narration and record its use, atomically.
 
-        if state.get("last_voice_id") == voice_id:
-            state["voice_id_consecutive"] = (state.get("voice_id_consecutive") or 0) + 1
-        else:
-            state["voice_id_consecutive"] = 1
+        Keeps the last voice while it is in voice_ids and has been used fewer
+        than max_consecutive times in a row.  Otherwise rotates to the next
+        voice in voice_ids.  Two workers calling this at once see each other's
+        use, so the consecutive limit holds across parallel runs.
 
-        state["last_gender"] = gender
-        state["last_voice_id"] = voice_id
+        Returns (voice_id, undo).  Pass undo to unassign_voice() if the
+        narration is never produced.
+        """
+        if not voice_ids:
+            raise ValueError("assign_voice() needs at least one voice_id.")
+        chosen, state, prior = self._voice_op("assign", gender, max_consecutive, *voice_ids)
+        return chosen, {"state": state, "prior": prior}
 
-        self.r.set(RK.VOICE_STATE, json.dumps(state))
-        return state
+    def unassign_voice(self, undo: Dict[str, Any]) -> bool:
+        """
+        Take back an assign_voice() whose synthesis failed.  The prior state
+        is restored only if no voice was recorded since; otherwise the
+        assignment stays counted.  Returns True if it was taken back.
+        """
+        fields = ("last_gender", "last_voice_id", "female_consecutive",
+                  "male_consecutive", "voice_id_consecutive")
+        args = [
+            "" if snapshot[f] is None else snapshot[f]
+            for snapshot in (undo["state"], undo["prior"]) for f in fields
+        ]
+        return self._voice_op("restore", *args)[0] == "1"
+
+    def update_voice_state(self, gender: Optional[str], voice_id: str) -> Dict[str, Any]:
+        """
+        Update rotation counters after a voice is used, atomically.
+        gender=None records the voice only, leaving gender counters alone
+        (used to correct an assignment whose voice was substituted).
+        Returns the new state dict.
+        """
+        return self._voice_op("record", gender or "", voice_id)[1]
 
     def reset_voice_state(self) -> None:
         """Full reset — use only in tests or after a manual override."""
-        self.r.delete(RK.VOICE_STATE)
+        self.r.delete(RK.VOICE_STATE, RK.VOICE_STATE_LEGACY)
+
+    def _voice_op(self, op: str, *args: Any):
+        if self._voice_script is None:
+            self._voice_script = self.r.register_script(_VOICE_STATE_LUA)
+        reply = self._voice_script(
+            keys=[RK.VOICE_STATE, RK.VOICE_STATE_LEGACY], args=[op, *args],
+        )
+        return _text(reply[0]), _voice_state(reply[1:6]), _voice_state(reply[6:11])
 
     # ═════════════════════════════════════════════════════════════════════════
     # HOOK RECENCY  (sorted set, score = unix timestamp)
@@ -559,8 +1008,121 @@ class RedisClient:
     def invalidate_all_caches(self) -> None:
         """Drop all cached data — call after any COS rule change."""
         self.r.delete(RK.GROWTH_RULES, RK.CHANNEL_CONFIG, RK.WAR_ROOM)
+        self.bump_config_version()
         logger.info("redis_caches_invalidated")
 
+    def get_config_version(self) -> int:
+        """Version of growth_rules / channel_config, see storage/config_cache.py."""
+        return int(self.r.get(RK.CONFIG_VERSION) or 0)
+
+    def bump_config_version(self) -> int:
+        return int(self.r.incr(RK.CONFIG_VERSION))
+
+    # ═════════════════════════════════════════════════════════════════════════
+    # CIRCUIT BREAKERS  (shared by every run; see cascade_manager.CircuitBreaker)
+    # ═════════════════════════════════════════════════════════════════════════
+
+    def circuit_transition(
+        self,
+        category: str,
+        provider: str,
+        op: str,
+        threshold: int,
+        reset_timeout: float,
+        max_probes: int,
+        probe_timeout: float,
+    ) -> Dict[str, Any]:
+        """
+        Apply one breaker transition atomically and return the new record:
+        {state, failures, opened_at, probes, probe_at, allowed}.
+        op is one of: peek, allow, success, failure, force_open.
+        """
+        if self._breaker_script is None:
+            self._breaker_script = self.r.register_script(_CIRCUIT_BREAKER_LUA)
+        state, failures, opened_at, probes, allowed, probe_at = self._breaker_script(
+            keys=[RK.circuit_breaker(category, provider)],
+            args=[op, time.time(), threshold, reset_timeout, max_probes,
+                  probe_timeout, _BREAKER_TTL_SECONDS],
+        )
+        return {
+            "state": state,
+            "failures": int(failures),
+            "opened_at": float(opened_at),
+            "probes": int(probes),
+            "probe_at": float(probe_at),
+            "allowed": int(allowed),
+        }
+
+    # ═════════════════════════════════════════════════════════════════════════
+    # R2 STORAGE ACCOUNTING  (see storage/storage_usage.py)
+    # ═════════════════════════════════════════════════════════════════════════
+
+    def record_storage_put(self, prefix: str, sizes: Dict[str, int]) -> int:
+        """Account uploaded objects (key → size) under prefix.  Returns the byte delta."""
+        return self._storage_op("put", prefix, [v for kv in sizes.items() for v in kv])
+
+    def record_storage_delete(self, prefix: str, keys: Sequence[str]) -> int:
+        """Account deleted objects under prefix.  Returns the (negative) byte delta."""
+        return self._storage_op("delete", prefix, list(keys))
+
+    def get_storage_usage(self) -> Dict[str, Dict[str, int]]:
+        """prefix → {bytes, objects} as currently counted."""
+        usage: Dict[str, Dict[str, int]] = {}
+        for field, value in self.r.hgetall(RK.STORAGE_USAGE).items():
+            prefix, _, metric = field.rpartition(":")
+            usage.setdefault(prefix, {"bytes": 0, "objects": 0})[metric] = int(value)
+        return usage
+
+    def get_storage_reconciled_at(self) -> Optional[float]:
+        raw = self.r.get(RK.STORAGE_RECONCILED)
+        return float(raw) if raw else None
+
+    def replace_storage_usage(
+        self, usage: Dict[str, Dict[str, int]], objects: Dict[str, int]
+    ) -> None:
+        """
+        Swap in counters and object sizes from a full scan.  Both hashes are
+        built under temporary keys and RENAMEd into place, so readers never
+        see a half-written index.
+        """
+        usage_tmp, objects_tmp = f"{RK.STORAGE_USAGE}:rebuild", f"{RK.STORAGE_OBJECTS}:rebuild"
+        self.r.delete(usage_tmp, objects_tmp)
+        items = list(objects.items())
+        for start in range(0, len(items), _STORAGE_WRITE_BATCH):
+            self.r.hset(objects_tmp, mapping=dict(items[start:start + _STORAGE_WRITE_BATCH]))
+        flat = {
+            f"{prefix}:{metric}": value
+            for prefix, counts in usage.items()
+            for metric, value in counts.items()
+        }
+        pipe = self.r.pipeline(transaction=True)
+        if flat:
+            pipe.hset(usage_tmp, mapping=flat)
+            pipe.rename(usage_tmp, RK.STORAGE_USAGE)
+        else:
+            pipe.delete(RK.STORAGE_USAGE)
+        if items:
+            pipe.rename(objects_tmp, RK.STORAGE_OBJECTS)
+        else:
+            pipe.delete(RK.STORAGE_OBJECTS)
+        pipe.set(RK.STORAGE_RECONCILED, time.time())
+        pipe.execute()
+
+    def acquire_storage_reconcile_lock(self, ttl_seconds: int = 1_800) -> bool:
+        return self.r.set(RK.STORAGE_RECONCILE_LOCK, self._lock_token, nx=True, ex=ttl_seconds) is True
+
+    def release_storage_reconcile_lock(self) -> None:
+        self._lock_op("release", RK.STORAGE_RECONCILE_LOCK)
+
+    def _storage_op(self, op: str, prefix: str, args: List[Any]) -> int:
+        if not args:
+            return 0
+        if self._storage_script is None:
+            self._storage_script = self.r.register_script(_STORAGE_USAGE_LUA)
+        return int(self._storage_script(
+            keys=[RK.STORAGE_USAGE, RK.STORAGE_OBJECTS], args=[op, prefix, *args],
+        ))
+
     # ═════════════════════════════════════════════════════════════════════════
     # GENERIC UTILITIES
     # ═════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,174 @@
+"""
+storage/status_writer.py
+
+Coalescing writer for video_queue status transitions.
+
+A production run moves a job through researching → scripting → voicing →
+fetching_media → assembling → quality_check → approved/rejected.  Each
+transition used to be its own synchronous, retried PostgREST UPDATE on the
+critical path, and most carried nothing but the status string.
+
+  Immediate   approved, rejected, failed, scheduled, published.  These are
+              observed by other workflows (Publisher polls approved jobs),
+              so they are written synchronously.  Any buffered fields for
+              the job go out in the same single UPDATE.
+  Coalesced   Every other status.  The latest status and the merged extra
+              fields are buffered per queue_id and written at the next
+              immediate transition, on flush(), or once the buffer is
+              _MAX_DEFER_SECONDS old, so the dashboard never lags by more
+              than that.
+
+With background=True the aged buffers are written by a daemon thread
+instead of on the next update() call.  Either way an atexit hook flushes
+whatever is left.  A failed write puts its payload back in the buffer
+(merged under anything newer), so a transition is written at least once
+unless the process dies hard.
+
+Every transition is logged as job_status_transition when update() is called,
+so the full sequence stays in the run log even when the intermediate rows
+are never written.
+"""
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+IMMEDIATE_STATUSES = frozenset({"approved", "rejected", "failed", "scheduled", "published"})
+
+_MAX_DEFER_SECONDS = 30.0
+_BACKGROUND_TICK   = 5.0
+
+
+class VideoStatusWriter:
+    """Thread-safe buffered front end to SupabaseClient.update_video_status."""
+
+    def __init__(
+        self,
+        max_defer_seconds: float = _MAX_DEFER_SECONDS,
+        background: bool = False,
+    ) -> None:
+        self._max_defer  = max_defer_seconds
+        self._lock       = threading.Lock()
+        # Held from taking a payload out of _pending until it is written, so
+        # an older payload can never land after a newer one.  Lock order:
+        # _write_lock, then _lock.
+        self._write_lock = threading.Lock()
+        self._pending: Dict[str, Tuple[float, Dict[str, Any]]] = {}   # queue_id → (first buffered at, payload)
+        self._stats = {"updates": 0, "writes": 0, "coalesced": 0, "write_failures": 0}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._thread = threading.Thread(target=self._run, name="status_writer", daemon=True)
+            self._thread.start()
+        atexit.register(self.close)
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def update(self, queue_id: str, status: str, extra: Optional[Dict] = None) -> None:
+        """Drop-in for db.update_video_status(queue_id, status, extra)."""
+        payload: Dict[str, Any] = dict(extra or {})
+        payload["status"] = status
+        payload["updated_at"] = datetime.now(timezone.utc).isoformat()
+        logger.info("job_status_transition", queue_id=queue_id[:8], status=status)
+
+        if status in IMMEDIATE_STATUSES:
+            with self._write_lock:
+                self._write(queue_id, self._merge(queue_id, payload, buffer=False))
+        else:
+            self._merge(queue_id, payload, buffer=True)
+            if self._thread is None:
+                self._flush_aged()
+
+    def flush(self, queue_id: Optional[str] = None) -> None:
+        """Write buffered transitions now, for one job or for all of them."""
+        with self._write_lock:
+            with self._lock:
+                if queue_id is None:
+                    batch = {q: p for q, (_, p) in self._pending.items()}
+                    self._pending.clear()
+                else:
+                    entry = self._pending.pop(queue_id, None)
+                    batch = {queue_id: entry[1]} if entry else {}
+            for qid, payload in batch.items():
+                self._write(qid, payload)
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=_BACKGROUND_TICK * 2)
+        self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "pending": len(self._pending)}
+
+    # ── Internal ──────────────────────────────────────────────────────────────
+
+    def _merge(self, queue_id: str, payload: Dict[str, Any], buffer: bool) -> Dict[str, Any]:
+        """Merge payload over the job's buffered one; keep it buffered if asked."""
+        with self._lock:
+            self._stats["updates"] += 1
+            since, buffered = self._pending.pop(queue_id, (time.time(), {}))
+            if buffered:
+                self._stats["coalesced"] += 1
+            merged = {**buffered, **payload}
+            if buffer:
+                self._pending[queue_id] = (since, merged)
+            return merged
+
+    def _flush_aged(self) -> None:
+        cutoff = time.time() - self._max_defer
+        with self._write_lock:
+            with self._lock:
+                aged = [q for q, (since, _) in self._pending.items() if since <= cutoff]
+                batch = {q: self._pending.pop(q)[1] for q in aged}
+            for qid, payload in batch.items():
+                self._write(qid, payload)
+
+    def _write(self, queue_id: str, payload: Dict[str, Any]) -> None:
+        """Caller holds _write_lock."""
+        from storage.supabase_client import get_db
+        extra = {k: v for k, v in payload.items() if k not in ("status", "updated_at")}
+        try:
+            get_db().update_video_status(queue_id, payload["status"], extra=extra or None)
+            with self._lock:
+                self._stats["writes"] += 1
+        except Exception as exc:
+            with self._lock:
+                self._stats["write_failures"] += 1
+                since, newer = self._pending.pop(queue_id, (time.time(), {}))
+                self._pending[queue_id] = (since, {**payload, **newer})
+            logger.warning(
+                "job_status_write_failed", queue_id=queue_id[:8],
+                status=payload["status"], error=str(exc)[:120],
+            )
+            if payload["status"] in IMMEDIATE_STATUSES:
+                raise
+
+    def _run(self) -> None:
+        while not self._stop.wait(_BACKGROUND_TICK):
+            try:
+                self._flush_aged()
+            except Exception as exc:
+                logger.debug("status_writer_tick_failed", error=str(exc)[:80])
+
+
+# ── Singleton ──────────────────────────────────────────────────────────────────
+
+_writer_instance: Optional[VideoStatusWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_status_writer() -> VideoStatusWriter:
+    global _writer_instance
+    with _writer_lock:
+        if _writer_instance is None:
+            _writer_instance = VideoStatusWriter()
+        return _writer_instance
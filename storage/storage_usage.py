@@ -0,0 +1,212 @@
+"""
+storage/storage_usage.py
+
+Incremental R2 storage accounting.
+
+Summing usage used to mean listing every object under every prefix on each
+call, which costs more every day the channel runs.  Instead, R2Client
+reports each change as it happens:
+
+  upload_file / upload_bytes   record_put(key, size)
+  delete_file / delete_keys    record_delete(keys)
+  (delete_prefix and CleanupManager go through delete_keys)
+
+Each key is attributed to the longest matching entry of TRACKED_PREFIXES,
+or to "" (other).  Its size is applied to Redis counters by one Lua call
+(RedisClient.record_storage_put / record_storage_delete), so usage() is a
+single HGETALL.
+
+Reconciliation
+──────────────
+  Writes that bypass R2Client, lost deltas while Redis was down, and
+  objects older than the index all make the counters drift.  reconcile()
+  lists the whole bucket once (not once per prefix) and swaps exact
+  counters in.  It runs when the last reconciliation is older than
+  _RECONCILE_SECONDS, or has never happened.  The daily storage_cleanup
+  workflow calls reconcile_if_stale(), so a full scan happens about weekly.
+  A Redis lock keeps concurrent runs from scanning twice.
+
+Accounting is best-effort: a Redis failure never fails the R2 operation.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+TRACKED_PREFIXES: Dict[str, str] = {
+    "raw_clips":  "media/raw/",
+    "audio":      "audio/",
+    "subtitles":  "subtitles/",
+    "thumbnails": "thumbnails/",
+    "finals":     "finals/",
+    "music":      "music/",
+    "archive":    "archive/",
+    "library":    "library/",
+}
+OTHER_PREFIX = ""
+
+_RECONCILE_SECONDS = 7 * 86_400
+
+# Longest prefix first, so nested prefixes resolve to the most specific one
+_PREFIXES_BY_LENGTH = sorted(TRACKED_PREFIXES.values(), key=len, reverse=True)
+
+
+def prefix_of(key: str) -> str:
+    for prefix in _PREFIXES_BY_LENGTH:
+        if key.startswith(prefix):
+            return prefix
+    return OTHER_PREFIX
+
+
+class StorageUsageIndex:
+
+    def __init__(self, reconcile_seconds: float = _RECONCILE_SECONDS) -> None:
+        self._reconcile_every = reconcile_seconds
+
+    # ── Recording (called by R2Client) ────────────────────────────────────────
+
+    def record_put(self, key: str, size_bytes: int) -> None:
+        try:
+            from storage.redis_client import get_redis
+            get_redis().record_storage_put(prefix_of(key), {key: int(size_bytes)})
+        except Exception as exc:
+            logger.debug("storage_usage_record_failed", op="put", error=str(exc)[:80])
+
+    def record_delete(self, keys: Iterable[str]) -> None:
+        by_prefix: Dict[str, List[str]] = {}
+        for key in keys:
+            by_prefix.setdefault(prefix_of(key), []).append(key)
+        try:
+            from storage.redis_client import get_redis
+            redis = get_redis()
+            for prefix, group in by_prefix.items():
+                redis.record_storage_delete(prefix, group)
+        except Exception as exc:
+            logger.debug("storage_usage_record_failed", op="delete", error=str(exc)[:80])
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    def usage(self) -> Optional[Dict[str, Dict[str, int]]]:
+        """
+        prefix → {bytes, objects} for every tracked prefix (plus "" for
+        everything else), or None if the index was never reconciled or
+        Redis is unavailable.  Callers then fall back to a scan.
+        """
+        try:
+            from storage.redis_client import get_redis
+            redis = get_redis()
+            if redis.get_storage_reconciled_at() is None:
+                return None
+            counted = redis.get_storage_usage()
+        except Exception as exc:
+            logger.debug("storage_usage_read_failed", error=str(exc)[:80])
+            return None
+        return {
+            prefix: counted.get(prefix, {"bytes": 0, "objects": 0})
+            for prefix in [*TRACKED_PREFIXES.values(), OTHER_PREFIX]
+        }
+
+    def bytes_under(self, prefix: str = "") -> Optional[int]:
+        """
+        Bytes under a tracked prefix, or the whole bucket for "".  None when
+        the index cannot answer (not reconciled, untracked prefix, Redis down).
+        """
+        usage = self.usage()
+        if usage is None:
+            return None
+        if prefix == "":
+            return sum(c["bytes"] for c in usage.values())
+        if prefix not in TRACKED_PREFIXES.values():
+            return None
+        return usage[prefix]["bytes"]
+
+    def is_stale(self) -> bool:
+        try:
+            from storage.redis_client import get_redis
+            reconciled_at = get_redis().get_storage_reconciled_at()
+        except Exception:
+            return True
+        return reconciled_at is None or time.time() - reconciled_at >= self._reconcile_every
+
+    # ── Reconciliation ────────────────────────────────────────────────────────
+
+    def reconcile_if_stale(self, r2: Optional[Any] = None) -> bool:
+        """Run reconcile() when the index is stale.  Returns True if it ran."""
+        if not self.is_stale():
+            return False
+        return self.reconcile(r2)
+
+    def reconcile(self, r2: Optional[Any] = None) -> bool:
+        """
+        Rebuild the counters from one listing of the whole bucket.  Returns
+        False if another process holds the reconcile lock or Redis is down.
+        """
+        try:
+            from storage.redis_client import get_redis
+            redis = get_redis()
+            if not redis.acquire_storage_reconcile_lock():
+                logger.info("storage_usage_reconcile_skipped", reason="locked")
+                return False
+        except Exception as exc:
+            logger.warning("storage_usage_reconcile_failed", error=str(exc)[:120])
+            return False
+
+        try:
+            if r2 is None:
+                from storage.r2_client import get_r2
+                r2 = get_r2()
+            started = time.monotonic()
+            usage: Dict[str, Dict[str, int]] = {}
+            objects: Dict[str, int] = {}
+            for obj in r2.list_prefix(""):
+                counts = usage.setdefault(prefix_of(obj["key"]), {"bytes": 0, "objects": 0})
+                counts["bytes"] += obj["size_bytes"]
+                counts["objects"] += 1
+                objects[obj["key"]] = obj["size_bytes"]
+
+            drift = self._drift(redis.get_storage_usage(), usage)
+            redis.replace_storage_usage(usage, objects)
+            logger.info(
+                "storage_usage_reconciled",
+                objects=len(objects),
+                total_bytes=sum(c["bytes"] for c in usage.values()),
+                drift_bytes=drift,
+                seconds=round(time.monotonic() - started, 1),
+            )
+            return True
+        except Exception as exc:
+            logger.warning("storage_usage_reconcile_failed", error=str(exc)[:120])
+            return False
+        finally:
+            try:
+                redis.release_storage_reconcile_lock()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _drift(counted: Dict[str, Dict[str, int]], actual: Dict[str, Dict[str, int]]) -> int:
+        """Total absolute byte difference between the counters and a scan."""
+        prefixes = set(counted) | set(actual)
+        return sum(
+            abs(counted.get(p, {}).get("bytes", 0) - actual.get(p, {}).get("bytes", 0))
+            for p in prefixes
+        )
+
+
+# ── Singleton ──────────────────────────────────────────────────────────────────
+
+_usage_instance: Optional[StorageUsageIndex] = None
+_usage_lock = threading.Lock()
+
+
+def get_storage_usage() -> StorageUsageIndex:
+    global _usage_instance
+    with _usage_lock:
+        if _usage_instance is None:
+            _usage_instance = StorageUsageIndex()
+        return _usage_instance
@@ -15,6 +15,8 @@ import json
 import logging
 import os
 import random
+import re
+import threading
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
@@ -30,6 +32,13 @@ from tenacity import (
 
 logger = structlog.get_logger(__name__)
 
+_DOMAIN_RE = re.compile(r"^(?:www\.)?([a-z0-9-]+(?:\.[a-z0-9-]+)+)$")
+
+# Defaults for sources registered automatically from research output.
+# Tier 4 / trust 60 keeps them below every curated seed source.
+_AUTO_SOURCE_TIER  = 4
+_AUTO_SOURCE_TRUST = 60
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Custom exceptions
@@ -73,6 +82,8 @@ class SupabaseClient:
     def _bootstrap(self) -> None:
         url, key = self._resolve_credentials()
         self._client = create_client(url, key)
+        self._source_ids: Dict[str, Optional[str]] = {}   # source_name → source_id (None = unresolvable)
+        self._source_lock = threading.Lock()
         logger.info("supabase_client_ready", host=url.split("//")[-1][:20] + "…")
 
     @staticmethod
@@ -154,8 +165,14 @@ class SupabaseClient:
     # CHANNEL CONFIG  (table: channel_config)
     # ═════════════════════════════════════════════════════════════════════════
 
-    def get_config(self, key: str) -> Any:
-        """Return the JSONB value for a config key, or None if absent."""
+    def get_config(self, key: str, fresh: bool = False) -> Any:
+        """
+        Return the JSONB value for a config key, or None if absent.
+        Served from the process-wide ConfigCache unless fresh=True.
+        """
+        if not fresh:
+            from storage.config_cache import get_config_cache
+            return get_config_cache().get_config(key)
         rows = self._exec(
             self.client.table("channel_config")
             .select("config_value")
@@ -176,6 +193,7 @@ class SupabaseClient:
                 on_conflict="config_key",
             )
         )
+        self._invalidate_config_cache()
 
     def get_all_config(self) -> Dict[str, Any]:
         """Return every config entry as a flat dict."""
@@ -188,8 +206,14 @@ class SupabaseClient:
     # GROWTH RULES  (table: growth_rules)
     # ═════════════════════════════════════════════════════════════════════════
 
-    def get_rule(self, rule_name: str) -> Optional[Any]:
-        """Return current_value for a named rule, or None."""
+    def get_rule(self, rule_name: str, fresh: bool = False) -> Optional[Any]:
+        """
+        Return current_value for a named rule, or None.
+        Served from the process-wide ConfigCache unless fresh=True.
+        """
+        if not fresh:
+            from storage.config_cache import get_config_cache
+            return get_config_cache().get_rule(rule_name)
         rows = self._exec(
             self.client.table("growth_rules")
             .select("current_value,is_locked")
@@ -242,9 +266,17 @@ class SupabaseClient:
             )
             .eq("rule_name", rule_name)
         )
+        self._invalidate_config_cache()
         logger.info("growth_rule_updated", rule_name=rule_name, by=updated_by)
         return True
 
+    @staticmethod
+    def _invalidate_config_cache() -> None:
+        # Local snapshot is dropped and the Redis version bumped, so other
+        # running processes pick the change up on their next version check.
+        from storage.config_cache import get_config_cache
+        get_config_cache().invalidate()
+
     # ═════════════════════════════════════════════════════════════════════════
     # TOPICS  (table: topics)
     # ═════════════════════════════════════════════════════════════════════════
@@ -413,6 +445,61 @@ class SupabaseClient:
         )
         return rows[0] if rows else None
 
+    def resolve_source_ids(self, names: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Map source names to source_ids in at most two round trips.
+
+        Names are looked up with one in_() query.  Missing names that look
+        like a domain ("livescience.com") are registered with one upsert
+        as tier-4 sources.  Anything else ("general_knowledge") maps to None.
+        Results are cached on the client for the rest of the run.
+        """
+        wanted = list(dict.fromkeys(
+            n.strip() for n in names if isinstance(n, str) and n.strip()
+        ))
+        with self._source_lock:
+            missing = [n for n in wanted if n not in self._source_ids]
+        if missing:
+            found = {
+                r["source_name"]: r["source_id"]
+                for r in self._exec(
+                    self.client.table("sources")
+                    .select("source_id,source_name")
+                    .in_("source_name", missing)
+                )
+            }
+            new_rows = []
+            for name in missing:
+                m = _DOMAIN_RE.match(name.lower())
+                if name not in found and m:
+                    new_rows.append({
+                        "source_name": name,
+                        "base_url":    f"https://{m.group(1)}",
+                        "tier":        _AUTO_SOURCE_TIER,
+                        "trust_score": _AUTO_SOURCE_TRUST,
+                        "notes":       "Registered automatically from fact research.",
+                    })
+            if new_rows:
+                # ignore_duplicates: a concurrent run may have registered the
+                # same name; its row is left untouched and resolved next time.
+                for r in self._exec(
+                    self.client.table("sources").upsert(
+                        new_rows, on_conflict="source_name", ignore_duplicates=True
+                    )
+                ):
+                    found[r["source_name"]] = r["source_id"]
+            attempted = {r["source_name"] for r in new_rows}
+            with self._source_lock:
+                for name in missing:
+                    if name in found or name not in attempted:
+                        self._source_ids[name] = found.get(name)
+            logger.debug(
+                "sources_resolved", requested=len(wanted), looked_up=len(missing),
+                registered=len(new_rows),
+            )
+        with self._source_lock:
+            return {n: self._source_ids.get(n) for n in wanted}
+
     def record_source_verification(self, source_id: str, success: bool) -> None:
         rows = self._exec(
             self.client.table("sources")
@@ -733,6 +820,26 @@ class SupabaseClient:
             .limit(limit)
         )
 
+    def get_published_before(self, cutoff_iso: str, page_size: int = 1_000) -> List[Dict]:
+        """
+        queue_id and published_at of every record published before cutoff_iso,
+        fetched in pages (PostgREST caps a single response).
+        """
+        rows: List[Dict] = []
+        start = 0
+        while True:
+            page = self._exec(
+                self.client.table("published_log")
+                .select("queue_id,published_at")
+                .lt("published_at", cutoff_iso)
+                .order("published_at")
+                .range(start, start + page_size - 1)
+            )
+            rows.extend(page)
+            if len(page) < page_size:
+                return rows
+            start += page_size
+
     def get_published_by_youtube_id(self, yt_id: str) -> Optional[Dict]:
         rows = self._exec(
             self.client.table("published_log")
@@ -852,6 +959,30 @@ class SupabaseClient:
         )
         return rows[0] if rows else None
 
+    def find_library_assets(
+        self,
+        keywords: List[str],
+        asset_type: str = "video",
+        min_score: int = 0,
+        limit: int = 25,
+    ) -> List[Dict]:
+        """
+        Library candidates: verified assets with an R2 copy whose tags
+        overlap any of the keywords (served by the topic_tags GIN index).
+        Caller ranks by overlap and filters orientation / duration.
+        """
+        return self._exec(
+            self.client.table("visual_assets")
+            .select("*")
+            .overlaps("topic_tags", keywords)
+            .eq("asset_type", asset_type)
+            .eq("has_watermark", False)
+            .not_.is_("r2_path", "null")
+            .gte("visual_match_score", min_score)
+            .order("visual_match_score", desc=True)
+            .limit(limit)
+        )
+
     def register_asset(self, asset_data: Dict) -> Optional[Dict]:
         """Register a newly verified clip.  Ignores duplicate file hashes."""
         rows = self._exec(
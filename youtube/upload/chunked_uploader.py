@@ -0,0 +1,311 @@
+"""
+youtube/upload/chunked_uploader.py
+
+Chunked, resumable transfer of a video file into a YouTube upload session.
+
+The old client PUT the whole file in one request with a 900 s timeout.  A
+network blip near the end of a long-form upload restarted it from byte
+zero, and the retry opened a new session, which cost another 1 600 quota
+units.  This module sends the file in chunks and can pick up a session
+where it stopped.
+
+  chunks     Every chunk except the last is a multiple of 256 KiB, as the
+             protocol requires.  The size adapts: after each chunk it is
+             re-aimed so a chunk takes about _TARGET_CHUNK_SECONDS at the
+             measured throughput, within [_MIN_CHUNK, _MAX_CHUNK].  A failed
+             chunk halves it.
+  recovery   After a transient failure (connection error, 5xx, 429) the
+             uploader backs off exponentially.  It then asks the server
+             how much it holds (empty PUT with Content-Range: bytes */N) and
+             continues from that offset.
+  pacing     An optional max_bytes_per_second caps throughput so uploads
+             stay predictable next to other traffic.
+  sources    The uploader reads bytes through a ByteSource.  It can be a
+             local file (FileSource) or an R2 object
+             (R2Client.open_reader), so a video can be streamed from
+             R2 straight into YouTube without a local copy.
+  sessions   UploadSessionStore keeps the session URI, file size, upload
+             key and confirmed offset in Redis (RK.yt_upload_session).  A
+             later run can resume the same session instead of opening a
+             new one.
+
+Redis is best-effort.  Without it uploads still run in chunks, but cannot
+resume across processes.
+"""
+from __future__ import annotations
+
+import os
+import random
+import time
+from typing import Any, Dict, Optional, Protocol, Tuple
+
+import requests
+import structlog
+
+from cascade.http_pool import http_session
+
+logger = structlog.get_logger(__name__)
+
+CHUNK_ALIGN = 256 * 1024
+
+_DEFAULT_CHUNK         = 32 * CHUNK_ALIGN        # 8 MiB
+_MIN_CHUNK             = 4 * CHUNK_ALIGN         # 1 MiB
+_MAX_CHUNK             = 256 * CHUNK_ALIGN       # 64 MiB
+_TARGET_CHUNK_SECONDS  = 15.0
+_MAX_CONSECUTIVE_FAILS = 6
+_MAX_BACKOFF_SECONDS   = 60.0
+_CHUNK_TIMEOUT         = (10.0, 180.0)           # (connect, read) seconds
+_SESSION_TTL_SECONDS   = 6 * 86_400              # YouTube keeps a session for about a week
+
+_TRANSIENT_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class UploadSessionExpired(RuntimeError):
+    """The session URI is no longer valid (HTTP 404 / 410).  Open a new one."""
+
+
+# ── Byte sources ──────────────────────────────────────────────────────────────
+
+class ByteSource(Protocol):
+    """Random-access bytes of known size (FileSource, storage.r2_client.R2RangeReader)."""
+
+    size: int
+
+    def read(self, offset: int, length: int) -> bytes: ...
+
+    def close(self) -> None: ...
+
+
+class FileSource:
+    """ByteSource over a local file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.size = os.path.getsize(path)
+        self._fh = None
+
+    def read(self, offset: int, length: int) -> bytes:
+        if self._fh is None:
+            self._fh = open(self.path, "rb")
+        self._fh.seek(offset)
+        return self._fh.read(length)
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+# ── Session persistence ───────────────────────────────────────────────────────
+
+class UploadSessionStore:
+    """Best-effort Redis record of in-flight upload sessions."""
+
+    def get(self, upload_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            from storage.redis_client import RK, get_redis
+            session = get_redis().get_json(RK.yt_upload_session(upload_id))
+            return session if isinstance(session, dict) and session.get("uri") else None
+        except Exception as exc:
+            logger.debug("upload_session_read_failed", error=str(exc)[:80])
+            return None
+
+    def save(self, upload_id: str, session: Dict[str, Any]) -> None:
+        try:
+            from storage.redis_client import RK, get_redis
+            get_redis().set_with_ttl(RK.yt_upload_session(upload_id), session, _SESSION_TTL_SECONDS)
+        except Exception as exc:
+            logger.debug("upload_session_save_failed", error=str(exc)[:80])
+
+    def clear(self, upload_id: str) -> None:
+        try:
+            from storage.redis_client import RK, get_redis
+            get_redis().delete(RK.yt_upload_session(upload_id))
+        except Exception as exc:
+            logger.debug("upload_session_clear_failed", error=str(exc)[:80])
+
+
+# ── Uploader ──────────────────────────────────────────────────────────────────
+
+class ChunkedUploader:
+
+    def __init__(
+        self,
+        chunk_size: int = _DEFAULT_CHUNK,
+        max_bytes_per_second: Optional[float] = None,
+        store: Optional[UploadSessionStore] = None,
+    ) -> None:
+        self._initial_chunk = _align(chunk_size)
+        self._max_rate = max_bytes_per_second
+        self._store = store or UploadSessionStore()
+
+    def upload(
+        self,
+        source: ByteSource,
+        session_uri: str,
+        upload_id: Optional[str] = None,
+        session: Optional[Dict[str, Any]] = None,
+        resume: bool = False,
+    ) -> str:
+        """
+        Send source into session_uri and return the new video ID.
+
+        With resume=True the server is asked for its offset first.  With
+        upload_id set, the confirmed offset is written to `session` in the
+        store after every chunk, and the record is cleared on completion.
+        Raises UploadSessionExpired or RuntimeError.
+        """
+        session = dict(session or {})
+        file_size = source.size
+        offset, video_id = self.query_offset(session_uri, file_size) if resume else (0, None)
+        if video_id:
+            return self._finish(upload_id, video_id)
+
+        chunk = self._initial_chunk
+        failures = 0
+        logger.debug("youtube_chunked_upload_start", size=file_size, offset=offset, resumed=resume)
+
+        while offset < file_size:
+            length = min(chunk, file_size - offset)
+            try:
+                data = source.read(offset, length)
+            except Exception as exc:
+                # The session stays stored: a later attempt resumes from here
+                raise RuntimeError(f"Reading upload source failed at byte {offset}: {exc}") from exc
+            t0 = time.monotonic()
+            try:
+                resp = http_session().put(
+                    session_uri,
+                    headers={
+                        "Content-Type":   "video/mp4",
+                        "Content-Length": str(length),
+                        "Content-Range":  f"bytes {offset}-{offset + length - 1}/{file_size}",
+                    },
+                    data=data,
+                    timeout=_CHUNK_TIMEOUT,
+                )
+                status, error = resp.status_code, None
+            except requests.RequestException as exc:
+                resp, status, error = None, None, str(exc)[:200]
+
+            if status in (200, 201):
+                return self._finish(upload_id, _video_id(resp))
+
+            if status == 308:
+                failures = 0
+                elapsed = time.monotonic() - t0
+                offset = _next_offset(resp)
+                chunk = _retarget(chunk, length, elapsed)
+                if upload_id:
+                    session["offset"] = offset
+                    self._store.save(upload_id, session)
+                self._pace(length, elapsed)
+                continue
+
+            if status in (404, 410):
+                raise UploadSessionExpired(f"Upload session expired (HTTP {status}).")
+            if status is not None and status not in _TRANSIENT_STATUSES:
+                # Rejected outright: resuming this session would fail the same way
+                if upload_id:
+                    self._store.clear(upload_id)
+                raise RuntimeError(f"Upload chunk failed (HTTP {status}): {resp.text[:300]}")
+
+            failures += 1
+            if failures > _MAX_CONSECUTIVE_FAILS:
+                raise RuntimeError(
+                    f"Upload stalled at byte {offset}/{file_size} after "
+                    f"{failures - 1} retries: {error or f'HTTP {status}'}"
+                )
+            chunk = max(_MIN_CHUNK, _align(chunk // 2))
+            backoff = min(_MAX_BACKOFF_SECONDS, 2 ** failures) + random.uniform(0, 1)
+            logger.warning(
+                "youtube_upload_chunk_retry",
+                offset=offset, size=file_size, attempt=failures,
+                status=status, error=error, backoff_s=round(backoff, 1),
+            )
+            time.sleep(backoff)
+            offset, video_id = self.query_offset(session_uri, file_size)
+            if video_id:
+                return self._finish(upload_id, video_id)
+
+        # Every byte was acknowledged with 308 but the final response never
+        # arrived: the status query returns the created video.
+        _, video_id = self.query_offset(session_uri, file_size)
+        if not video_id:
+            raise RuntimeError("Upload completed but YouTube returned no video ID.")
+        return self._finish(upload_id, video_id)
+
+    def query_offset(self, session_uri: str, file_size: int) -> Tuple[int, Optional[str]]:
+        """
+        Ask the server how many bytes it holds.  Returns (offset, None) while
+        incomplete, or (file_size, video_id) if the upload already finished.
+        Transient errors are retried, like chunk failures.
+        """
+        for attempt in range(1, _MAX_CONSECUTIVE_FAILS + 1):
+            try:
+                resp = http_session().put(
+                    session_uri,
+                    headers={"Content-Length": "0", "Content-Range": f"bytes */{file_size}"},
+                    timeout=_CHUNK_TIMEOUT,
+                )
+            except requests.RequestException as exc:
+                logger.debug("youtube_upload_status_retry", attempt=attempt, error=str(exc)[:80])
+            else:
+                if resp.status_code in (200, 201):
+                    return file_size, _video_id(resp)
+                if resp.status_code == 308:
+                    return _next_offset(resp), None
+                if resp.status_code in (404, 410):
+                    raise UploadSessionExpired(f"Upload session expired (HTTP {resp.status_code}).")
+                if resp.status_code not in _TRANSIENT_STATUSES:
+                    raise RuntimeError(
+                        f"Upload status query failed (HTTP {resp.status_code}): {resp.text[:300]}"
+                    )
+            time.sleep(min(_MAX_BACKOFF_SECONDS, 2 ** attempt) + random.uniform(0, 1))
+        raise RuntimeError("Upload status query kept failing; session left for a later resume.")
+
+    # ── Internal ──────────────────────────────────────────────────────────────
+
+    def _finish(self, upload_id: Optional[str], video_id: str) -> str:
+        if upload_id:
+            self._store.clear(upload_id)
+        return video_id
+
+    def _pace(self, length: int, elapsed: float) -> None:
+        if not self._max_rate:
+            return
+        wait = length / self._max_rate - elapsed
+        if wait > 0:
+            time.sleep(wait)
+
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+def _align(n: int) -> int:
+    return max(CHUNK_ALIGN, (int(n) // CHUNK_ALIGN) * CHUNK_ALIGN)
+
+
+def _retarget(current: int, sent: int, elapsed: float) -> int:
+    """Chunk size that takes about _TARGET_CHUNK_SECONDS, at most doubling per step."""
+    if elapsed <= 0:
+        return current
+    target = sent / elapsed * _TARGET_CHUNK_SECONDS
+    return min(_MAX_CHUNK, max(_MIN_CHUNK, _align(min(target, current * 2))))
+
+
+def _next_offset(resp: requests.Response) -> int:
+    """Offset after a 308: one past the end of the Range header ("bytes=0-N")."""
+    rng = resp.headers.get("Range")
+    if not rng or "-" not in rng:
+        return 0
+    return int(rng.rsplit("-", 1)[1]) + 1
+
+
+def _video_id(resp: requests.Response) -> str:
+    try:
+        video_id = resp.json().get("id")
+    except ValueError:
+        video_id = None
+    if not video_id:
+        raise RuntimeError(f"No video ID in YouTube response: {resp.text[:300]}")
+    return video_id
@@ -86,18 +86,25 @@ class KeyRotator:
 
     # ── Upload key selection ──────────────────────────────────────────────────
 
-    def select_upload_credentials(self) -> Tuple[int, OAuthCredentials, str]:
+    def select_upload_credentials(self, reserve: bool = False) -> Tuple[int, OAuthCredentials, str]:
         """
         Return (key_index, credentials, access_token) for the upload key with
         the most remaining daily quota.
+        With reserve=True the upload's quota units are charged to the key in
+        the same atomic step; the caller must release them if the upload fails.
         Raises RuntimeError if all 3 upload keys are exhausted for today.
         """
-        key_index = self._quota.get_best_key()
+        key_index = self._quota.reserve_key() if reserve else self._quota.get_best_key()
         if key_index is None:
             raise RuntimeError("All 3 YouTube upload keys have exhausted today's quota.")
 
-        creds = self.get_credentials(key_index)
-        token = self.get_access_token(creds)
+        try:
+            creds = self.get_credentials(key_index)
+            token = self.get_access_token(creds)
+        except Exception:
+            if reserve:
+                self._quota.release_upload(key_index)
+            raise
         return key_index, creds, token
 
     def get_management_token(self) -> str:
@@ -32,15 +32,27 @@ class QuotaManager:
             units_per_upload=UNITS_PER_UPLOAD, daily_limit=DAILY_LIMIT
         )
 
+    def reserve_key(self, units: int = UNITS_PER_UPLOAD) -> Optional[int]:
+        """
+        Atomically pick the key with the most remaining quota and charge the
+        upload to it up front.  Call release_upload() if the upload fails.
+        """
+        return self._redis.reserve_yt_upload_key(
+            units_per_upload=units, daily_limit=DAILY_LIMIT, key_indexes=UPLOAD_KEYS,
+        )
+
+    def release_upload(self, key_index: int, units: int = UNITS_PER_UPLOAD) -> None:
+        try:
+            self._redis.release_yt_upload_units(key_index, units)
+        except Exception as exc:
+            logger.warning("yt_quota_release_failed", key_index=key_index, error=str(exc)[:120])
+
     def record_upload(self, key_index: int, units: int = UNITS_PER_UPLOAD) -> int:
         return self._redis.add_yt_upload_units(key_index, units)
 
     def get_status(self) -> List[QuotaStatus]:
-        out: List[QuotaStatus] = []
-        for k in UPLOAD_KEYS:
-            used = self._redis.get_yt_upload_units_used(k)
-            out.append(QuotaStatus(k, used, max(0, DAILY_LIMIT - used)))
-        return out
+        usage = self._redis.get_yt_upload_usage(UPLOAD_KEYS)
+        return [QuotaStatus(k, used, max(0, DAILY_LIMIT - used)) for k, used in usage.items()]
 
     def total_remaining_uploads(self) -> int:
         return sum(s.remaining // UNITS_PER_UPLOAD for s in self.get_status())
@@ -1,11 +1,23 @@
 """
 youtube/upload/upload_client.py
+
+Uploads go through YouTube's resumable protocol, sent in chunks by
+ChunkedUploader, from a local file or any ByteSource (e.g. an R2 object
+opened with R2Client.open_reader).  The session URI is kept in Redis under upload_id (the
+queue_id when called from Publisher).  If an upload fails part-way, the next
+attempt for the same upload_id resumes that session.  It does not open a new
+one, so no further quota is charged.
 """
 from __future__ import annotations
-import os
+import hashlib
+import time
 from dataclasses import dataclass
-from typing import Dict, List, Optional
-import requests, structlog
+from typing import Dict, List, Optional, Union
+import structlog
+from cascade.http_pool import http_session
+from youtube.upload.chunked_uploader import (
+    ByteSource, ChunkedUploader, FileSource, UploadSessionExpired, UploadSessionStore,
+)
 from youtube.upload.key_rotator import get_key_rotator
 from youtube.upload.quota_manager import get_quota_manager, UNITS_PER_UPLOAD
 
@@ -27,12 +39,14 @@ class YouTubeUploadClient:
     def __init__(self) -> None:
         self._rotator = get_key_rotator()
         self._quota   = get_quota_manager()
+        self._sessions = UploadSessionStore()
+        self._uploader = ChunkedUploader(store=self._sessions)
 
     # ── Public API ────────────────────────────────────────────────────────────
 
     def upload_video(
         self,
-        file_path:      str,
+        file_path:      Union[str, ByteSource],   # local path, or a source such as an R2 reader
         title:          str,
         description:    str,
         tags:           List[str],
@@ -40,9 +54,47 @@ class YouTubeUploadClient:
         privacy_status: str = "public",
         publish_at:     Optional[str] = None, # ISO 8601 UTC — sets status=private + scheduled
         is_short:       bool = True,
+        upload_id:      Optional[str] = None, # stable ID (queue_id) used to resume a failed upload
     ) -> UploadResult:
+        if isinstance(file_path, str):
+            try:
+                source: ByteSource = FileSource(file_path)
+            except OSError as exc:
+                return UploadResult(False, error=f"Video file unreadable: {exc}")
+        else:
+            source = file_path
         try:
-            key_index, _creds, access_token = self._rotator.select_upload_credentials()
+            return self._upload_source(
+                source, title, description, tags, category_id,
+                privacy_status, publish_at, is_short, upload_id,
+            )
+        finally:
+            if isinstance(file_path, str):
+                source.close()
+
+    def _upload_source(
+        self,
+        source:         ByteSource,
+        title:          str,
+        description:    str,
+        tags:           List[str],
+        category_id:    str,
+        privacy_status: str,
+        publish_at:     Optional[str],
+        is_short:       bool,
+        upload_id:      Optional[str],
+    ) -> UploadResult:
+        file_size = source.size
+        if file_size <= 0:
+            return UploadResult(False, error="Video file is empty.")
+
+        upload_id = upload_id or _default_upload_id(title, file_size)
+        resumed = self._resume_upload(upload_id, source)
+        if resumed is not None:
+            return resumed
+
+        try:
+            key_index, _creds, access_token = self._rotator.select_upload_credentials(reserve=True)
         except RuntimeError as exc:
             logger.error("youtube_no_upload_capacity", error=str(exc))
             return UploadResult(False, error=str(exc))
@@ -69,24 +121,37 @@ class YouTubeUploadClient:
 
         metadata = {"snippet": snippet, "status": status}
 
+        # Quota for this upload was reserved with the key.  Opening a session
+        # is what YouTube charges, so the reservation is handed back only if
+        # no session URI was ever obtained, whatever happened to it after.
+        uploaded = False
+        opened: List[str] = []
         try:
-            video_id = self._resumable_upload(file_path, metadata, access_token)
-        except RuntimeError as exc:
-            err_str = str(exc)
-            # 401 → token may have just expired despite cache; retry once with a forced refresh
-            if "401" in err_str:
-                try:
-                    creds = self._rotator.get_credentials(key_index)
-                    access_token = self._rotator.get_access_token(creds, force_refresh=True)
-                    video_id = self._resumable_upload(file_path, metadata, access_token)
-                except Exception as retry_exc:
-                    logger.error("youtube_upload_retry_failed", key_index=key_index, error=str(retry_exc)[:200])
-                    return UploadResult(False, key_used=key_index, error=str(retry_exc))
-            else:
-                logger.error("youtube_upload_failed", key_index=key_index, error=err_str[:200])
-                return UploadResult(False, key_used=key_index, error=err_str)
-
-        self._quota.record_upload(key_index, UNITS_PER_UPLOAD)
+            try:
+                video_id = self._resumable_upload(
+                    source, metadata, access_token, upload_id, key_index, opened
+                )
+            except RuntimeError as exc:
+                err_str = str(exc)
+                # 401 → token may have just expired despite cache; retry once with a forced refresh
+                if "401" in err_str:
+                    try:
+                        creds = self._rotator.get_credentials(key_index)
+                        access_token = self._rotator.get_access_token(creds, force_refresh=True)
+                        video_id = self._resumable_upload(
+                            source, metadata, access_token, upload_id, key_index, opened
+                        )
+                    except Exception as retry_exc:
+                        logger.error("youtube_upload_retry_failed", key_index=key_index, error=str(retry_exc)[:200])
+                        return UploadResult(False, key_used=key_index, error=str(retry_exc))
+                else:
+                    logger.error("youtube_upload_failed", key_index=key_index, error=err_str[:200])
+                    return UploadResult(False, key_used=key_index, error=err_str)
+            uploaded = True
+        finally:
+            if not uploaded and not opened:
+                self._quota.release_upload(key_index, UNITS_PER_UPLOAD)
+
         logger.info(
             "youtube_upload_success",
             video_id=video_id, key_used=key_index, title=title[:50],
@@ -96,12 +161,53 @@ class YouTubeUploadClient:
 
     # ── Resumable upload protocol ────────────────────────────────────────────
 
-    def _resumable_upload(self, file_path: str, metadata: Dict, access_token: str) -> str:
-        file_size = os.path.getsize(file_path)
-        if file_size <= 0:
-            raise RuntimeError(f"Video file is empty: {file_path}")
+    def _resume_upload(self, upload_id: str, source: ByteSource) -> Optional[UploadResult]:
+        """
+        Continue a session left open by an earlier attempt.  Returns None when
+        there is nothing to resume (or the session expired), so the caller
+        opens a new one.
+        """
+        session = self._sessions.get(upload_id)
+        if session is None:
+            return None
+        key_index = session.get("key_index")
+        file_size = source.size
+        if session.get("size") != file_size:
+            logger.warning("youtube_upload_session_size_mismatch", upload_id=upload_id[:8])
+            self._sessions.clear(upload_id)
+            return None
+
+        logger.info(
+            "youtube_upload_resuming", upload_id=upload_id[:8],
+            offset=session.get("offset", 0), size=file_size,
+        )
+        try:
+            video_id = self._uploader.upload(
+                source, session["uri"], upload_id=upload_id, session=session, resume=True,
+            )
+        except UploadSessionExpired:
+            logger.warning("youtube_upload_session_expired", upload_id=upload_id[:8])
+            self._sessions.clear(upload_id)
+            return None
+        except (RuntimeError, OSError) as exc:
+            logger.error("youtube_upload_resume_failed", upload_id=upload_id[:8], error=str(exc)[:200])
+            return UploadResult(False, key_used=key_index, error=str(exc))
+
+        logger.info("youtube_upload_success", video_id=video_id, key_used=key_index, resumed=True)
+        return UploadResult(True, video_id=video_id, key_used=key_index)
 
-        init_resp = requests.post(
+    def _resumable_upload(
+        self,
+        source:       ByteSource,
+        metadata:     Dict,
+        access_token: str,
+        upload_id:    str,
+        key_index:    int,
+        opened:       List[str],
+    ) -> str:
+        """Open a session and upload into it.  Appends the session URI to opened."""
+        file_size = source.size
+        init_resp = http_session().post(
             _UPLOAD_URL,
             params={"uploadType": "resumable", "part": "snippet,status"},
             headers={
@@ -121,28 +227,27 @@ class YouTubeUploadClient:
         session_uri = init_resp.headers.get("Location")
         if not session_uri:
             raise RuntimeError("YouTube did not return an upload session URI.")
+        opened.append(session_uri)
 
-        with open(file_path, "rb") as fh:
-            put_resp = requests.put(
-                session_uri,
-                headers={
-                    "Content-Type":   "video/mp4",
-                    "Content-Length": str(file_size),
-                },
-                data=fh,
-                timeout=900,
-            )
-
-        if put_resp.status_code not in (200, 201):
-            raise RuntimeError(
-                f"Upload PUT failed (HTTP {put_resp.status_code}): {put_resp.text[:300]}"
+        session = {
+            "uri":        session_uri,
+            "size":       file_size,
+            "key_index":  key_index,
+            "offset":     0,
+            "created_at": int(time.time()),
+        }
+        self._sessions.save(upload_id, session)
+        try:
+            return self._uploader.upload(
+                source, session_uri, upload_id=upload_id, session=session,
             )
+        except UploadSessionExpired:
+            self._sessions.clear(upload_id)
+            raise
 
-        video_id = put_resp.json().get("id")
-        if not video_id:
-            raise RuntimeError(f"No video ID in YouTube response: {put_resp.text[:300]}")
 
-        return video_id
+def _default_upload_id(title: str, file_size: int) -> str:
+    return hashlib.sha256(f"{title}|{file_size}".encode("utf-8")).hexdigest()[:32]
 
 
 _instance: Optional[YouTubeUploadClient] = None